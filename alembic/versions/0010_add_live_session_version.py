@@ -0,0 +1,24 @@
+"""add version counter to live sessions
+
+Revision ID: 0010_add_live_session_version
+Revises: 0009_add_event_slug
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_add_live_session_version"
+down_revision = "0009_add_event_slug"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "live_sessions",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade():
+    op.drop_column("live_sessions", "version")
@@ -0,0 +1,20 @@
+"""add composite index for keyset pagination of questions
+
+Revision ID: 0011_add_questions_keyset_index
+Revises: 0010_add_live_session_version
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0011_add_questions_keyset_index"
+down_revision = "0010_add_live_session_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_questions_added_at_id", "questions", ["added_at", "question_id"])
+
+
+def downgrade():
+    op.drop_index("ix_questions_added_at_id", table_name="questions")
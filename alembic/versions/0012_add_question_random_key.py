@@ -0,0 +1,27 @@
+"""add indexed random sort key to questions
+
+Revision ID: 0012_add_question_random_key
+Revises: 0011_add_questions_keyset_index
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012_add_question_random_key"
+down_revision = "0011_add_questions_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # random() is volatile, so Postgres evaluates the default per existing row.
+    op.add_column(
+        "questions",
+        sa.Column("random_key", sa.Float(), nullable=False, server_default=sa.text("random()")),
+    )
+    op.create_index("ix_questions_review_random", "questions", ["review_status", "random_key"])
+
+
+def downgrade():
+    op.drop_index("ix_questions_review_random", table_name="questions")
+    op.drop_column("questions", "random_key")
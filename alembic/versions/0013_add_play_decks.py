@@ -0,0 +1,31 @@
+"""add play_decks table for server-side shuffled free play
+
+Revision ID: 0013_add_play_decks
+Revises: 0012_add_question_random_key
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0013_add_play_decks"
+down_revision = "0012_add_question_random_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "play_decks",
+        sa.Column("deck_id", sa.String(), primary_key=True),
+        sa.Column("filters", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("question_ids", postgresql.ARRAY(sa.String()), nullable=False, server_default=sa.text("'{}'")),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_play_decks_last_used_at", "play_decks", ["last_used_at"])
+
+
+def downgrade():
+    op.drop_index("ix_play_decks_last_used_at", table_name="play_decks")
+    op.drop_table("play_decks")
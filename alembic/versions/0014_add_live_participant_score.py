@@ -0,0 +1,43 @@
+"""add running score to live participants
+
+Revision ID: 0014_add_live_participant_score
+Revises: 0013_add_play_decks
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014_add_live_participant_score"
+down_revision = "0013_add_play_decks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "live_participants",
+        sa.Column("score", sa.Float(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        """
+        UPDATE live_participants p
+        SET score = s.total
+        FROM (
+            SELECT participant_id, SUM(points_awarded) AS total
+            FROM live_answers
+            WHERE points_awarded IS NOT NULL
+            GROUP BY participant_id
+        ) s
+        WHERE p.participant_id = s.participant_id
+        """
+    )
+    op.create_index(
+        "ix_live_participants_session_score",
+        "live_participants",
+        ["session_id", sa.text("score DESC"), "joined_at"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_live_participants_session_score", table_name="live_participants")
+    op.drop_column("live_participants", "score")
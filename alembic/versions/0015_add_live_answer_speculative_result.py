@@ -0,0 +1,25 @@
+"""add speculative evaluation result to live answers
+
+Revision ID: 0015_add_live_answer_speculative_result
+Revises: 0014_add_live_participant_score
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0015_add_live_answer_speculative_result"
+down_revision = "0014_add_live_participant_score"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "live_answers",
+        sa.Column("speculative_result", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("live_answers", "speculative_result")
@@ -0,0 +1,30 @@
+"""add persistent answer evaluation cache
+
+Revision ID: 0016_add_eval_cache
+Revises: 0015_add_live_answer_speculative_result
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0016_add_eval_cache"
+down_revision = "0015_add_live_answer_speculative_result"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "eval_cache",
+        sa.Column("question_hash", sa.String(length=64), nullable=False),
+        sa.Column("answer_norm", sa.Text(), nullable=False),
+        sa.Column("max_points", sa.Integer(), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("question_hash", "answer_norm", "max_points"),
+    )
+
+
+def downgrade():
+    op.drop_table("eval_cache")
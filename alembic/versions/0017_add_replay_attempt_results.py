@@ -0,0 +1,32 @@
+"""add per-attempt replay grading results
+
+Revision ID: 0017_add_replay_attempt_results
+Revises: 0016_add_eval_cache
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0017_add_replay_attempt_results"
+down_revision = "0016_add_eval_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "replay_attempt_results",
+        sa.Column("attempt_id", sa.String(), nullable=False),
+        sa.Column("result_key", sa.String(length=32), nullable=False),
+        sa.Column("event_id", sa.String(), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("attempt_id", "result_key"),
+    )
+    op.create_index("ix_replay_attempt_results_created_at", "replay_attempt_results", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_replay_attempt_results_created_at", table_name="replay_attempt_results")
+    op.drop_table("replay_attempt_results")
@@ -0,0 +1,22 @@
+"""clear evaluation cache keyed by the old answer normalization
+
+Revision ID: 0018_clear_eval_cache
+Revises: 0017_add_replay_attempt_results
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0018_clear_eval_cache"
+down_revision = "0017_add_replay_attempt_results"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # answer_norm used to drop signs and decimal points, so "314" could hold
+    # the verdict for "3.14"; such rows must not be served under the new key
+    op.execute("DELETE FROM eval_cache")
+
+
+def downgrade():
+    pass
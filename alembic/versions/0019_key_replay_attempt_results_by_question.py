@@ -0,0 +1,29 @@
+"""keep one replay attempt result per question
+
+Revision ID: 0019_key_replay_attempt_results_by_question
+Revises: 0018_clear_eval_cache
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0019_key_replay_attempt_results_by_question"
+down_revision = "0018_clear_eval_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows are only kept while an attempt is played; dropping them just means
+    # those answers are graded again on evaluate
+    op.execute("DELETE FROM replay_attempt_results")
+    op.add_column("replay_attempt_results", sa.Column("question_id", sa.String(), nullable=False))
+    op.drop_constraint("replay_attempt_results_pkey", "replay_attempt_results", type_="primary")
+    op.create_primary_key("replay_attempt_results_pkey", "replay_attempt_results", ["attempt_id", "question_id"])
+
+
+def downgrade():
+    op.execute("DELETE FROM replay_attempt_results")
+    op.drop_constraint("replay_attempt_results_pkey", "replay_attempt_results", type_="primary")
+    op.drop_column("replay_attempt_results", "question_id")
+    op.create_primary_key("replay_attempt_results_pkey", "replay_attempt_results", ["attempt_id", "result_key"])
@@ -0,0 +1,24 @@
+"""count submitted answers apart from the live session version
+
+Revision ID: 0020_add_live_session_answers_version
+Revises: 0019_key_replay_attempt_results_by_question
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0020_add_live_session_answers_version"
+down_revision = "0019_key_replay_attempt_results_by_question"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "live_sessions",
+        sa.Column("answers_version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade():
+    op.drop_column("live_sessions", "answers_version")
@@ -1,3 +1,5 @@
+import logging
+
 from flask import Blueprint, jsonify, request, session
 
 from backend.services.event_service import (
@@ -18,15 +20,23 @@ from backend.services.replay_service import (
     evaluate_replay,
     get_leaderboard,
     get_replay_detail,
+    grade_replay_answer,
     has_played_event,
     start_replay,
     submit_replay,
 )
 from backend.storage import get_media_store
+from backend.utils.rate_limit import replay_grade_limiter
+
+logger = logging.getLogger(__name__)
 
 events_bp = Blueprint("events", __name__, url_prefix="/api/events")
 
 
+def _client_ip() -> str:
+    return request.headers.get("X-Forwarded-For", request.remote_addr or "unknown").split(",")[0].strip()
+
+
 def _require_auth():
     if not session.get("logged_in"):
         return jsonify({"error": "Unauthorized"}), 403
@@ -119,7 +129,10 @@ def update_event_endpoint(event_id):
     if not updates:
         return jsonify({"error": "Missing request body"}), 400
 
-    result = update_event(event_id, updates, session["username"], session.get("role", "user"))
+    try:
+        result = update_event(event_id, updates, session["username"], session.get("role", "user"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
     if not result:
         return jsonify({"error": "Event not found or not permitted"}), 404
     return jsonify(result.model_dump(mode="json")), 200
@@ -259,7 +272,12 @@ def evaluate_replay_endpoint(event_id):
     user_answers = data.get("answers", [])
 
     try:
-        result = evaluate_replay(event_id, user_answers)
+        result = evaluate_replay(
+            event_id,
+            user_answers,
+            evaluation_token=data.get("evaluation_token"),
+            attempt_id=data.get("attempt_id"),
+        )
     except Exception:
         import traceback
         traceback.print_exc()
@@ -271,6 +289,42 @@ def evaluate_replay_endpoint(event_id):
     return jsonify(result), 200
 
 
+@events_bp.route("/<event_id>/replay/grade", methods=["POST"])
+def grade_replay_answer_endpoint(event_id):
+    """Grade one answer in the background during play; the result is kept for
+    the attempt and only revealed by evaluate/submit. Best effort: anything
+    rejected here is simply graded at evaluate time."""
+    if not replay_grade_limiter.check_and_record(f"replay-grade:{_client_ip()}"):
+        return jsonify({"error": "Too many requests. Please try again later."}), 429
+    event = get_event(event_id)
+    if not event:
+        return jsonify({"error": "Event not found"}), 404
+    username = session.get("username") if session.get("logged_in") else None
+    if not can_see_event(event, username, session.get("role", "user")):
+        return jsonify({"error": "Event not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    attempt_id = data.get("attempt_id")
+    question_id = data.get("question_id")
+    answer = data.get("answer", "")
+    if not isinstance(attempt_id, str) or not attempt_id or len(attempt_id) > 256:
+        return jsonify({"error": "attempt_id is required"}), 400
+    if not isinstance(question_id, str) or not isinstance(answer, str):
+        return jsonify({"error": "question_id and answer are required"}), 400
+
+    try:
+        graded = grade_replay_answer(event_id, attempt_id, question_id, answer)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    except Exception:
+        logger.exception("Background grading failed for event %s", event_id)
+        return jsonify({"error": "Grading failed unexpectedly"}), 500
+
+    if graded is None:
+        return jsonify({"error": "Question not found"}), 404
+    return jsonify({"graded": graded}), 202
+
+
 @events_bp.route("/<event_id>/replay/submit", methods=["POST"])
 def submit_replay_endpoint(event_id):
     """Submit and save replay — requires login."""
@@ -283,7 +337,14 @@ def submit_replay_endpoint(event_id):
     display_name = data.get("display_name") or session.get("username")
     user_id = session.get("user_id")
 
-    replay = submit_replay(event_id, user_answers, user_id=user_id, display_name=display_name)
+    replay = submit_replay(
+        event_id,
+        user_answers,
+        user_id=user_id,
+        display_name=display_name,
+        evaluation_token=data.get("evaluation_token"),
+        attempt_id=data.get("attempt_id"),
+    )
     if not replay:
         return jsonify({"error": "Event not found"}), 404
 
@@ -1,8 +1,18 @@
 from flask import Blueprint, jsonify
 
+from backend.utils.answer_eval import get_answer_evaluator
+
 health_bp = Blueprint("health", __name__)
 
 
 @health_bp.route("/health", methods=["GET"])
 def health_check():
-    return jsonify({"status": "ok"}), 200
+    evaluator = get_answer_evaluator()
+    batches = evaluator.inner.stats()
+    return jsonify({
+        "status": "ok",
+        "eval_cache": evaluator.stats(),
+        "eval_batches": batches,
+        # "disabled" until the LLM evaluator is configured and first used
+        "llm_breaker": batches.get("llm", {}).get("breaker", {"state": "disabled"}),
+    }), 200
@@ -1,22 +1,55 @@
-from flask import Blueprint, jsonify, request, session
+import hashlib
+import json
+import threading
+import time
 
+from flask import Blueprint, Response, jsonify, request, session
+
+from backend.core.settings import get_settings
 from backend.services.live_service import (
     advance_question,
     create_live_session,
     finish_session,
     get_leaderboard,
     get_live_session,
+    get_participant_rank,
     get_session_state,
+    get_session_version,
     join_session,
     lock_question,
     override_answer_points,
     reveal_question,
     submit_answer,
     update_session_settings,
+    wait_for_session_version,
+    watch_session,
 )
 
 live_bp = Blueprint("live", __name__, url_prefix="/api/live")
 
+_STREAM_KEEPALIVE_SECONDS = 10
+
+# Open streams in this process. Each holds a worker thread for up to
+# LIVE_STREAM_MAX_SECONDS, so past LIVE_STREAM_MAX_CONCURRENT new streams are
+# refused and clients poll /state instead, leaving threads for other requests.
+_open_streams = 0
+_open_streams_lock = threading.Lock()
+
+
+def _claim_stream_slot() -> bool:
+    global _open_streams
+    with _open_streams_lock:
+        if _open_streams >= get_settings().live_stream_max_concurrent:
+            return False
+        _open_streams += 1
+        return True
+
+
+def _release_stream_slot() -> None:
+    global _open_streams
+    with _open_streams_lock:
+        _open_streams -= 1
+
 
 def _require_auth():
     if not session.get("logged_in"):
@@ -236,6 +269,8 @@ def answer_endpoint(session_id):
     result = submit_answer(session_id, participant_id, question_index, answer_text)
     if not result:
         return jsonify({"error": "Cannot submit answer (locked, wrong question, or session inactive)"}), 400
+    # Part of this player's /state ETag, so their next poll sees the answer
+    session["live_answer_seq"] = session.get("live_answer_seq", 0) + 1
     return jsonify(result.model_dump(mode="json")), 200
 
 
@@ -243,27 +278,133 @@ def answer_endpoint(session_id):
 # Shared endpoints
 # ---------------------------------------------------------------------------
 
-@live_bp.route("/<session_id>/state", methods=["GET"])
-def state_endpoint(session_id):
-    live_session = get_live_session(session_id)
-    if not live_session:
-        return jsonify({"error": "Session not found"}), 404
-
+def _viewer(live_session) -> tuple[str | None, bool]:
+    """Resolve (participant_id, is_presenter) for the current request."""
     participant_id = session.get("live_participant_id")
-    is_presenter = (
+    is_presenter = bool(
         session.get("logged_in")
         and (session.get("username") == live_session.created_by or session.get("role") == "admin")
     )
 
     # If not presenter and not participant, only allow basic info
-    if not is_presenter and session.get("live_session_id") != session_id:
+    if is_presenter or session.get("live_session_id") != live_session.session_id:
         participant_id = None
+    return participant_id, is_presenter
 
-    state = get_session_state(
-        session_id,
-        participant_id=participant_id if not is_presenter else None,
-        is_presenter=is_presenter,
-    )
+
+def _state_etag(session_id: str, version: int) -> str:
+    """ETag for a state view: the session version plus everything in the
+    cookie that decides which view (anonymous/participant/presenter) is served,
+    including how many answers this player has submitted."""
+    viewer = "|".join(str(session.get(key) or "") for key in (
+        "logged_in", "username", "role", "live_participant_id", "live_session_id", "live_answer_seq",
+    ))
+    digest = hashlib.sha1(viewer.encode()).hexdigest()[:12]
+    return f"{session_id}-{version}-{digest}"
+
+
+@live_bp.route("/<session_id>/state", methods=["GET"])
+def state_endpoint(session_id):
+    # Idle polls are answered from the version alone. Other players' answers
+    # only change the presenter's view, so they only count for logged-in
+    # viewers (who may be presenting); a player's own answers move their ETag
+    # through the cookie.
+    version = get_session_version(session_id, include_answers=bool(session.get("logged_in")))
+    if version is None:
+        return jsonify({"error": "Session not found"}), 404
+    if request.if_none_match.contains(_state_etag(session_id, version)):
+        response = Response(status=304)
+        response.set_etag(_state_etag(session_id, version))
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    live_session = get_live_session(session_id)
+    if not live_session:
+        return jsonify({"error": "Session not found"}), 404
+
+    participant_id, is_presenter = _viewer(live_session)
+    state = get_session_state(session_id, participant_id=participant_id, is_presenter=is_presenter)
     if not state:
         return jsonify({"error": "Session not found"}), 404
-    return jsonify(state), 200
+    response = jsonify(state)
+    response.set_etag(_state_etag(session_id, version))
+    response.headers["Cache-Control"] = "no-cache"
+    return response, 200
+
+
+@live_bp.route("/<session_id>/leaderboard", methods=["GET"])
+def leaderboard_endpoint(session_id):
+    """Top-N by running score plus the caller's own rank (if they are playing)."""
+    try:
+        limit = int(request.args.get("limit", 10))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be >= 1"}), 400
+
+    live_session = get_live_session(session_id)
+    if not live_session:
+        return jsonify({"error": "Session not found"}), 404
+
+    participant_id, _ = _viewer(live_session)
+    me = get_participant_rank(session_id, participant_id) if participant_id else None
+    return jsonify({"leaderboard": get_leaderboard(session_id, limit=limit), "me": me}), 200
+
+
+@live_bp.route("/<session_id>/stream", methods=["GET"])
+def stream_endpoint(session_id):
+    """Server-Sent Events feed of the session state.
+
+    Emits a ``state`` event whenever the session version changes and an
+    ``end`` event once the session is gone. Submitted answers only wake the
+    presenter's stream; players refresh their own answer via ``/state``.
+    Streams do not query the store themselves: they wait on the process's
+    version watcher, which checks each watched session every
+    LIVE_STREAM_POLL_SECONDS. The stream closes itself after
+    LIVE_STREAM_MAX_SECONDS and EventSource reconnects with Last-Event-ID,
+    only receiving a state if it missed one. Beyond LIVE_STREAM_MAX_CONCURRENT
+    open streams the endpoint answers 503 and clients poll ``/state``.
+    """
+    live_session = get_live_session(session_id)
+    if not live_session:
+        return jsonify({"error": "Session not found"}), 404
+
+    participant_id, is_presenter = _viewer(live_session)
+    settings = get_settings()
+    last_event_id = request.headers.get("Last-Event-ID")
+
+    def generate():
+        last_version = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        deadline = time.monotonic() + settings.live_stream_max_seconds
+        yield "retry: 1000\n\n"
+        with watch_session(session_id):
+            while True:
+                timeout = max(0.0, min(_STREAM_KEEPALIVE_SECONDS, deadline - time.monotonic()))
+                version = wait_for_session_version(session_id, last_version, include_answers=is_presenter,
+                                                   timeout=timeout)
+                if version is None:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+                if version != last_version:
+                    state = get_session_state(session_id, participant_id=participant_id, is_presenter=is_presenter)
+                    if state is None:
+                        yield "event: end\ndata: {}\n\n"
+                        return
+                    last_version = version
+                    yield f"id: {version}\nevent: state\ndata: {json.dumps(state)}\n\n"
+                elif time.monotonic() < deadline:
+                    yield ": keepalive\n\n"
+                if time.monotonic() >= deadline:
+                    return
+
+    if not _claim_stream_slot():
+        response = jsonify({"error": "Too many open streams; poll /state instead"})
+        response.headers["Retry-After"] = "30"
+        return response, 503
+    response = Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    response.call_on_close(_release_stream_slot)
+    return response
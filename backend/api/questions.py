@@ -7,14 +7,21 @@ from backend.services.question_service import (
     create_question,
     update_question,
     delete_question,
-    get_random_question_filtered
+    get_random_question_filtered,
+    create_play_deck,
+    draw_from_deck,
 )
 from backend.models.question import QuestionModel
 from backend.storage import get_media_store
+from backend.utils.rate_limit import deck_create_limiter
 
 questions_bp = Blueprint("questions", __name__, url_prefix="/questions")
 
 
+def _client_ip() -> str:
+    return request.headers.get("X-Forwarded-For", request.remote_addr or "unknown").split(",")[0].strip()
+
+
 def _serialize_question(question: QuestionModel) -> dict:
     data = question.model_dump(mode="json")
     # Provide both id and question_id for compatibility with legacy clients.
@@ -46,7 +53,7 @@ def _normalize_string_list(value):
     return cleaned
 
 def _normalize_filters(raw_filters: dict):
-    filters = {k: v for k, v in raw_filters.items() if k not in {"limit", "offset"}}
+    filters = {k: v for k, v in raw_filters.items() if k not in {"limit", "offset", "page_token", "cursor"}}
 
     if "tags" in filters:
         tags = _normalize_string_list(filters.get("tags"))
@@ -127,7 +134,13 @@ def _require_role(role: str | None = None):
 
 @questions_bp.route("/", methods=["GET"])
 def list_questions():
-    """List all questions, optionally filtered by query params."""
+    """List all questions, optionally filtered by query params.
+
+    Pages are keyset-paginated: pass the returned ``next_cursor`` (alias
+    ``next_page_token``) back as ``cursor`` (or ``page_token``) to fetch the
+    next page. ``offset`` is still accepted for the first page only. A cursor
+    that was not issued by this endpoint (e.g. an old offset token) is a 400.
+    """
     try:
         limit = int(request.args.get("limit", 50))
         offset = int(request.args.get("offset", 0))
@@ -137,12 +150,17 @@ def list_questions():
     if limit < 1 or offset < 0:
         return jsonify({"error": "limit must be >= 1 and offset >= 0"}), 400
 
-    page_token = request.args.get("page_token")
+    page_token = request.args.get("cursor") or request.args.get("page_token")
     filters, error = _normalize_filters(request.args)
     if error:
         return jsonify({"error": error}), 400
 
-    questions, next_token = get_all_questions(filters, limit=limit, offset=offset, page_token=page_token, include_token=True)
+    try:
+        questions, next_token = get_all_questions(
+            filters, limit=limit, offset=offset, page_token=page_token, include_token=True
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
     total = count_questions(filters)
 
     payload = {
@@ -152,6 +170,7 @@ def list_questions():
             "offset": offset,
             "count": len(questions),
             "total": total,
+            "next_cursor": next_token,
             "next_page_token": next_token
         }
     }
@@ -290,6 +309,50 @@ def random_question():
     return jsonify(_serialize_question(question))
 
 
+_DECK_MAX_DRAW = 50
+
+
+@questions_bp.route("/decks", methods=["POST"])
+def create_deck():
+    """Shuffle the reviewed questions matching the filters into a server-side deck.
+
+    Open to anonymous players, so it is rate-limited per IP, and each browser
+    session holds one deck: a new one replaces the previous.
+    """
+    if not deck_create_limiter.check_and_record(f"deck:{_client_ip()}"):
+        return jsonify({"error": "Too many requests. Please try again later."}), 429
+    payload = request.get_json(silent=True) or {}
+    filters, error = _normalize_filters(payload.get("filters", {}))
+    if error:
+        return jsonify({"error": error}), 400
+    deck = create_play_deck(filters, replaces=session.get("play_deck_id"))
+    if not deck:
+        return jsonify({"error": "No questions match the given filters"}), 404
+    session["play_deck_id"] = deck.deck_id
+    return jsonify({"deck_id": deck.deck_id, "size": deck.size, "next_cursor": 0}), 201
+
+
+@questions_bp.route("/decks/<deck_id>/next", methods=["GET"])
+def next_from_deck(deck_id):
+    """Draw the next questions from a deck, starting at ?cursor= (default 0)."""
+    try:
+        cursor = int(request.args.get("cursor", 0))
+        count = int(request.args.get("count", 1))
+    except ValueError:
+        return jsonify({"error": "cursor and count must be integers"}), 400
+    if cursor < 0 or not 1 <= count <= _DECK_MAX_DRAW:
+        return jsonify({"error": f"cursor must be >= 0 and count between 1 and {_DECK_MAX_DRAW}"}), 400
+
+    result = draw_from_deck(deck_id, cursor=cursor, count=count)
+    if result is None:
+        return jsonify({"error": "Deck not found or expired"}), 404
+    questions, next_cursor = result
+    return jsonify({
+        "items": [_serialize_question(q) for q in questions],
+        "next_cursor": next_cursor,
+    }), 200
+
+
 @questions_bp.route("/metadata", methods=["GET"])
 def question_metadata():
     metadata = get_question_metadata()
@@ -26,6 +26,13 @@ def _as_int(value: str | None, default: int) -> int:
         return default
 
 
+def _as_float(value: str | None, default: float) -> float:
+    try:
+        return float(value) if value is not None else default
+    except ValueError:
+        return default
+
+
 def _normalize_backend(value: str | None, default: str) -> str:
     if not value:
         return default
@@ -81,6 +88,29 @@ class Settings:
     llm_eval_api_key: str
     llm_eval_model: str
     llm_gen_model: str
+    llm_eval_chunk_size: int
+    llm_eval_concurrency: int
+    llm_eval_deadline_seconds: float
+    llm_eval_timeout_seconds: float
+    llm_eval_slow_call_seconds: float
+    llm_eval_breaker_failures: int
+    llm_eval_breaker_reset_seconds: float
+    llm_eval_batch_window_ms: int
+    llm_eval_batch_max_items: int
+    eval_cache_size: int
+    eval_cache_persistent: bool
+
+    live_stream_poll_seconds: float
+    live_stream_max_seconds: int
+    live_stream_max_concurrent: int
+    live_speculative_eval: bool
+    live_eval_workers: int
+
+    replay_eval_token_ttl_seconds: int
+    replay_attempt_idle_seconds: int
+
+    play_deck_idle_seconds: int
+    play_deck_max_size: int
 
 
 @lru_cache()
@@ -133,4 +163,24 @@ def get_settings() -> Settings:
         llm_eval_api_key=os.getenv("LLM_EVAL_API_KEY", ""),
         llm_eval_model=os.getenv("LLM_EVAL_MODEL", "claude-haiku-4-5-20251001"),
         llm_gen_model=os.getenv("LLM_GEN_MODEL", os.getenv("LLM_EVAL_MODEL", "claude-haiku-4-5-20251001")),
+        llm_eval_chunk_size=_as_int(os.getenv("LLM_EVAL_CHUNK_SIZE"), 25),
+        llm_eval_concurrency=_as_int(os.getenv("LLM_EVAL_CONCURRENCY"), 4),
+        llm_eval_deadline_seconds=_as_float(os.getenv("LLM_EVAL_DEADLINE_SECONDS"), 20.0),
+        llm_eval_timeout_seconds=_as_float(os.getenv("LLM_EVAL_TIMEOUT_SECONDS"), 10.0),
+        llm_eval_slow_call_seconds=_as_float(os.getenv("LLM_EVAL_SLOW_CALL_SECONDS"), 8.0),
+        llm_eval_breaker_failures=_as_int(os.getenv("LLM_EVAL_BREAKER_FAILURES"), 5),
+        llm_eval_breaker_reset_seconds=_as_float(os.getenv("LLM_EVAL_BREAKER_RESET_SECONDS"), 30.0),
+        llm_eval_batch_window_ms=_as_int(os.getenv("LLM_EVAL_BATCH_WINDOW_MS"), 75),
+        llm_eval_batch_max_items=_as_int(os.getenv("LLM_EVAL_BATCH_MAX_ITEMS"), 25),
+        eval_cache_size=_as_int(os.getenv("EVAL_CACHE_SIZE"), 5000),
+        eval_cache_persistent=_as_bool(os.getenv("EVAL_CACHE_PERSISTENT"), False),
+        live_stream_poll_seconds=_as_float(os.getenv("LIVE_STREAM_POLL_SECONDS"), 0.5),
+        live_stream_max_seconds=_as_int(os.getenv("LIVE_STREAM_MAX_SECONDS"), 30),
+        live_stream_max_concurrent=_as_int(os.getenv("LIVE_STREAM_MAX_CONCURRENT"), 16),
+        live_speculative_eval=_as_bool(os.getenv("LIVE_SPECULATIVE_EVAL"), True),
+        live_eval_workers=_as_int(os.getenv("LIVE_EVAL_WORKERS"), 4),
+        replay_eval_token_ttl_seconds=_as_int(os.getenv("REPLAY_EVAL_TOKEN_TTL_SECONDS"), 3600),
+        replay_attempt_idle_seconds=_as_int(os.getenv("REPLAY_ATTEMPT_IDLE_SECONDS"), 6 * 3600),
+        play_deck_idle_seconds=_as_int(os.getenv("PLAY_DECK_IDLE_SECONDS"), 6 * 3600),
+        play_deck_max_size=_as_int(os.getenv("PLAY_DECK_MAX_SIZE"), 5000),
     )
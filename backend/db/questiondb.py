@@ -45,6 +45,35 @@ def get_question_by_id_db(question_id) -> Optional[QuestionModel]:
     print(f"DEBUG: Question with ID {question_id} not found.")
     return None
 
+_BATCH_GET_LIMIT = 100  # DynamoDB caps BatchGetItem at 100 keys per request
+
+
+def get_questions_by_ids_db(question_ids: List[str]) -> Dict[str, QuestionModel]:
+    """Fetch several questions with BatchGetItem, keyed by ID in request order.
+
+    BatchGetItem needs the full primary key, so tables that carry a
+    question_topic sort key fall back to one query per ID.
+    """
+    ids = list(dict.fromkeys(qid for qid in question_ids if qid))
+    items: Dict[str, dict] = {}
+    try:
+        for start in range(0, len(ids), _BATCH_GET_LIMIT):
+            request = {DYNAMODB_TABLE: {"Keys": [{"id": qid} for qid in ids[start:start + _BATCH_GET_LIMIT]]}}
+            while request:
+                resp = dynamodb.batch_get_item(RequestItems=request)
+                for item in resp.get("Responses", {}).get(DYNAMODB_TABLE, []):
+                    items[item["id"]] = item
+                request = resp.get("UnprocessedKeys") or None
+    except Exception as e:
+        print(f"DEBUG: batch_get_item failed ({e}); falling back to per-ID queries.")
+        items = {}
+        for qid in ids:
+            item = _query_item_by_id(qid)
+            if item:
+                items[qid] = item
+    return {qid: QuestionModel(**items[qid]) for qid in ids if qid in items}
+
+
 def get_all_questions_db(filters=None, limit: int = 50, last_key: Optional[Dict[str, Any]] = None) -> Tuple[List[QuestionModel], Optional[Dict[str, Any]]]:
     """
     Scan with optional filters and pagination.
@@ -127,6 +156,36 @@ def update_question_in_db(question_id: str, update: dict) -> QuestionModel | Non
         return QuestionModel(**attrs)
     return None
 
+def increment_question_stats_db(deltas: Dict[str, Tuple[int, int, int]]) -> int:
+    """Atomically add (asked, correct, incorrect) to each question's counters.
+
+    Uses an ADD update expression so concurrent submissions never lose
+    increments, and leaves update_history untouched. DynamoDB has no
+    multi-item UPDATE, so this is one UpdateItem per question (plus a
+    key-only query, since the table may carry a question_topic sort key).
+    """
+    updated = 0
+    for question_id, (asked, correct, incorrect) in deltas.items():
+        try:
+            resp = table.query(
+                KeyConditionExpression=Key("id").eq(question_id),
+                ProjectionExpression="id, question_topic",
+                Limit=1,
+            )
+            items = resp.get("Items", [])
+            if not items:
+                continue
+            table.update_item(
+                Key=_make_key_from_item(items[0]),
+                UpdateExpression="ADD times_asked :asked, times_correct :correct, times_incorrect :incorrect",
+                ExpressionAttributeValues={":asked": asked, ":correct": correct, ":incorrect": incorrect},
+            )
+            updated += 1
+        except Exception as e:
+            print(f"ERROR: stats increment failed for question {question_id}: {e}")
+    return updated
+
+
 def delete_question_from_db(question_id):
     try:
         item = _get_item_with_fallback(question_id)
@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, ConfigDict, Field
+
+import uuid
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class PlayDeckModel(BaseModel):
+    deck_id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        description="Unique identifier for the deck",
+    )
+    filters: dict = Field(default_factory=dict, description="Filters the deck was built from")
+    question_ids: list[str] = Field(
+        default_factory=list, description="Shuffled IDs of the matching reviewed questions"
+    )
+    created_at: datetime = Field(default_factory=_utcnow)
+    last_used_at: datetime = Field(
+        default_factory=_utcnow, description="Last draw; decks expire after inactivity"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @property
+    def size(self) -> int:
+        return len(self.question_ids)
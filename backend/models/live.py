@@ -37,6 +37,12 @@ class LiveSessionModel(BaseModel):
     status: str = Field(
         default="lobby", description="lobby / active / finished"
     )
+    version: int = Field(
+        default=0, description="Bumped on every change visible in the session state"
+    )
+    answers_version: int = Field(
+        default=0, description="Bumped on every submitted answer; only the presenter's view shows those"
+    )
     created_by: str = Field(..., description="Username of the presenter")
     created_at: datetime = Field(default_factory=_utcnow)
     updated_at: datetime = Field(default_factory=_utcnow)
@@ -63,6 +69,9 @@ class LiveParticipantModel(BaseModel):
     user_id: Optional[str] = Field(
         None, description="User ID if logged in, None for anonymous"
     )
+    score: float = Field(
+        default=0, description="Running total of points awarded; kept in sync by the store"
+    )
     joined_at: datetime = Field(default_factory=_utcnow)
 
     model_config = ConfigDict(populate_by_name=True)
@@ -91,6 +100,11 @@ class LiveAnswerModel(BaseModel):
     max_points: Optional[float] = Field(None, description="Max possible points")
     is_correct: Optional[bool] = Field(None, description="Whether the answer is correct")
     explanation: Optional[str] = Field(None, description="Evaluation explanation")
+    speculative_result: Optional[dict] = Field(
+        None,
+        exclude=True,
+        description="Evaluation computed in the background at submit time; published on reveal",
+    )
     submitted_at: datetime = Field(default_factory=_utcnow)
 
     model_config = ConfigDict(populate_by_name=True)
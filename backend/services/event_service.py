@@ -1,4 +1,5 @@
 from backend.models.event import EventModel
+from backend.services.question_service import invalidate_question_metadata
 from backend.storage import get_event_store, get_question_store, get_media_store
 
 
@@ -6,13 +7,8 @@ def compute_max_score(question_ids: list[str]) -> float:
     """Sum the points of all questions in the list."""
     if not question_ids:
         return 0.0
-    question_store = get_question_store()
-    total = 0.0
-    for qid in question_ids:
-        q = question_store.get_by_id(qid)
-        if q:
-            total += q.points
-    return total
+    found = get_question_store().get_many(question_ids)
+    return float(sum(found[qid].points for qid in question_ids if qid in found))
 
 
 def create_event(data: dict, username: str) -> EventModel | None:
@@ -113,11 +109,13 @@ def delete_event(
     if delete_questions and event.question_ids:
         question_store = get_question_store()
         media_store = get_media_store()
+        found = question_store.get_many(event.question_ids)
         for qid in event.question_ids:
-            question = question_store.get_by_id(qid)
+            question = found.get(qid)
             if question and question.media_path:
                 media_store.delete(question.media_path)
             question_store.delete(qid)
+        invalidate_question_metadata()
 
     return event_store.delete(event_id)
 
@@ -182,10 +180,6 @@ def get_event_questions(event_id: str):
     if not event:
         return []
 
-    question_store = get_question_store()
-    questions: list[QuestionModel] = []
-    for qid in event.question_ids:
-        q = question_store.get_by_id(qid)
-        if q:
-            questions.append(q)
+    found = get_question_store().get_many(event.question_ids)
+    questions: list[QuestionModel] = [found[qid] for qid in event.question_ids if qid in found]
     return questions
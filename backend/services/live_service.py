@@ -1,12 +1,25 @@
+import logging
 import random
 import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
+from backend.core.settings import get_settings
 from backend.models.live import LiveAnswerModel, LiveParticipantModel, LiveSessionModel
 from backend.storage import get_event_store, get_live_store, get_media_store, get_question_store
-from backend.utils.answer_eval import HybridEvaluator
+from backend.utils.answer_eval import EvalResult, get_answer_evaluator, is_fallback_result, question_hash
 
+logger = logging.getLogger(__name__)
 
-_evaluator = HybridEvaluator()
+_evaluator = get_answer_evaluator()
+
+# Background pool for speculative evaluation; created on first use so imports
+# (tests, scripts) don't spin up threads.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
 
 
 def _generate_join_code(length: int = 6) -> str:
@@ -53,6 +66,131 @@ def get_live_session_by_code(join_code: str) -> LiveSessionModel | None:
     return get_live_store().get_session_by_code(join_code.upper().strip())
 
 
+def get_session_version(session_id: str, include_answers: bool = False) -> int | None:
+    """Cheap change check for streaming clients; None if the session is gone.
+
+    Submitted answers only show in the presenter's view, so they move the
+    result only with ``include_answers``; players are not woken by every answer.
+    """
+    return _combined_version(get_live_store().get_session_versions(session_id), include_answers)
+
+
+def _combined_version(versions: tuple[int, int] | None, include_answers: bool) -> int | None:
+    if versions is None:
+        return None
+    version, answers_version = versions
+    return version + answers_version if include_answers else version
+
+
+# ---------------------------------------------------------------------------
+# Version watching (SSE streams)
+# ---------------------------------------------------------------------------
+
+class _VersionWatcher:
+    """Reads the versions of sessions with open streams on one thread and
+    wakes the streams waiting on them.
+
+    However many streams are open in this process, each watched session costs
+    one version lookup per ``poll_seconds``. The thread exits once nothing is
+    watched and is restarted by the next ``watch``.
+    """
+
+    def __init__(self, poll_seconds: float):
+        self._poll_seconds = poll_seconds
+        self._changed = threading.Condition()
+        self._watchers: dict[str, int] = {}
+        self._versions: dict[str, tuple[int, int] | None] = {}
+        self._thread: threading.Thread | None = None
+
+    @contextmanager
+    def watch(self, session_id: str):
+        with self._changed:
+            self._watchers[session_id] = self._watchers.get(session_id, 0) + 1
+            missing = session_id not in self._versions
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="live-version-watcher", daemon=True)
+                self._thread.start()
+        try:
+            if missing:
+                versions = get_live_store().get_session_versions(session_id)
+                with self._changed:
+                    self._versions.setdefault(session_id, versions)
+            yield
+        finally:
+            with self._changed:
+                self._watchers[session_id] -= 1
+                if not self._watchers[session_id]:
+                    del self._watchers[session_id]
+                    self._versions.pop(session_id, None)
+
+    def wait(self, session_id: str, last_version: int | None, include_answers: bool, timeout: float) -> int | None:
+        """The watched session's version once it differs from ``last_version``,
+        or after ``timeout`` seconds; None once the session is gone."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                if session_id in self._versions:
+                    version = _combined_version(self._versions[session_id], include_answers)
+                    if version is None or version != last_version:
+                        return version
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return last_version
+                self._changed.wait(remaining)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._poll_seconds)
+            with self._changed:
+                session_ids = list(self._watchers)
+                if not session_ids:
+                    self._thread = None
+                    return
+            fresh = {}
+            for session_id in session_ids:
+                try:
+                    fresh[session_id] = get_live_store().get_session_versions(session_id)
+                except Exception:
+                    logger.warning("Version check failed for live session %s", session_id, exc_info=True)
+            with self._changed:
+                changed = False
+                for session_id, versions in fresh.items():
+                    if session_id in self._watchers and self._versions.get(session_id) != versions:
+                        self._versions[session_id] = versions
+                        changed = True
+                if changed:
+                    self._changed.notify_all()
+
+
+_watcher: _VersionWatcher | None = None
+_watcher_lock = threading.Lock()
+
+
+def _version_watcher() -> _VersionWatcher:
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = _VersionWatcher(get_settings().live_stream_poll_seconds)
+        return _watcher
+
+
+def watch_session(session_id: str):
+    """Context manager that keeps ``session_id`` on this process's version
+    watcher while a stream is open; pair with ``wait_for_session_version``."""
+    return _version_watcher().watch(session_id)
+
+
+def wait_for_session_version(
+    session_id: str, last_version: int | None, include_answers: bool = False, timeout: float = 10.0
+) -> int | None:
+    """Block until a watched session's version differs from ``last_version``
+    or ``timeout`` passes, and return it; None if the session is gone.
+
+    Streams wait here instead of querying the store themselves.
+    """
+    return _version_watcher().wait(session_id, last_version, include_answers, timeout)
+
+
 def update_session_settings(
     session_id: str, username: str, updates: dict
 ) -> LiveSessionModel | None:
@@ -142,20 +280,29 @@ def reveal_question(session_id: str, question_index: int, username: str) -> dict
     # Get all answers for this question
     answers = live_store.get_answers(session_id, question_index)
 
-    # Batch evaluate all answers
-    eval_items = []
+    # Publish results computed at submit time against this exact question
+    # text, reference and points; only evaluate the stragglers
+    evaluations: dict[str, dict] = {}
+    stragglers: list[LiveAnswerModel] = []
+    current = _question_tag(question)
     for ans in answers:
-        eval_items.append((question.question, question.answer, ans.answer_text, question.points))
-
-    if eval_items:
-        results = _evaluator.evaluate_batch(eval_items)
-        for ans, result in zip(answers, results):
-            live_store.update_answer(ans.answer_id, {
-                "points_awarded": result.points_awarded,
-                "max_points": result.max_points,
-                "is_correct": result.is_correct,
-                "explanation": result.explanation,
-            })
+        speculative = dict(ans.speculative_result or {})
+        if speculative.pop("question_hash", None) == current and speculative.get("max_points") == question.points:
+            evaluations[ans.answer_id] = speculative
+        else:
+            stragglers.append(ans)
+    precomputed = len(evaluations)
+
+    if stragglers:
+        results = _evaluator.evaluate_batch([
+            (question.question, question.answer, ans.answer_text, question.points, question.language)
+            for ans in stragglers
+        ])
+        for ans, result in zip(stragglers, results):
+            evaluations[ans.answer_id] = _evaluation_fields(result)
+
+    if evaluations:
+        live_store.apply_evaluations(session_id, question_index, evaluations)
 
     # Mark question as revealed
     new_revealed = list(session.revealed_indices) + [question_index]
@@ -165,6 +312,8 @@ def reveal_question(session_id: str, question_index: int, username: str) -> dict
         "question_index": question_index,
         "correct_answer": question.answer,
         "results_count": len(answers),
+        "precomputed": precomputed,
+        "evaluated_on_demand": len(stragglers),
     }
 
 
@@ -204,6 +353,7 @@ def join_session(
         user_id=user_id,
     )
     if live_store.add_participant(participant):
+        live_store.bump_session_version(session.session_id)
         return participant
     return None
 
@@ -233,10 +383,14 @@ def override_answer_points(
     clamped = max(0.0, min(float(points), float(max_pts)))
     is_correct = clamped > 0
 
-    return live_store.update_answer(answer_id, {
+    updated = live_store.update_answer(answer_id, {
         "points_awarded": clamped,
         "is_correct": is_correct,
     })
+    if updated:
+        live_store.refresh_scores(session_id, [updated.participant_id])
+        live_store.bump_session_version(session_id)
+    return updated
 
 
 def submit_answer(
@@ -265,52 +419,160 @@ def submit_answer(
         answer_text=answer_text,
     )
     if live_store.save_answer(answer):
+        live_store.bump_answers_version(session_id)
+        if get_settings().live_speculative_eval:
+            _eval_executor().submit(
+                _evaluate_speculatively, session.event_id, session_id, participant_id,
+                question_index, answer_text,
+            )
         return answer
     return None
 
 
+# ---------------------------------------------------------------------------
+# Speculative evaluation
+# ---------------------------------------------------------------------------
+
+def _evaluation_fields(result: EvalResult) -> dict:
+    return {
+        "points_awarded": result.points_awarded,
+        "max_points": result.max_points,
+        "is_correct": result.is_correct,
+        "explanation": result.explanation,
+    }
+
+
+def _question_tag(question) -> str:
+    """Identifies what a speculative result was graded against; an edit to the
+    question, its answer or its language between submit and reveal changes it."""
+    return question_hash(question.question, question.answer, question.language)
+
+
+def _eval_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().live_eval_workers),
+                thread_name_prefix="live-eval",
+            )
+        return _executor
+
+
+def _evaluate_speculatively(
+    event_id: str,
+    session_id: str,
+    participant_id: str,
+    question_index: int,
+    answer_text: str,
+) -> None:
+    """Grade a freshly submitted answer ahead of the reveal.
+
+    The result is only stored while the answer text is unchanged and unscored,
+    so a resubmission or an earlier reveal simply discards it. It carries the
+    question's hash, so the reveal regrades it if the question was edited.
+    """
+    try:
+        event = get_event_store().get_by_id(event_id)
+        if not event or question_index >= len(event.question_ids):
+            return
+        question = get_question_store().get_by_id(event.question_ids[question_index])
+        if not question:
+            return
+        result = _evaluator.evaluate(question.question, question.answer, answer_text, question.points,
+                                     question.language)
+        # A failed or skipped LLM call is left for the reveal to retry.
+        if is_fallback_result(result):
+            return
+        get_live_store().save_speculative_result(
+            session_id, participant_id, question_index, answer_text,
+            {**_evaluation_fields(result), "question_hash": _question_tag(question)},
+        )
+    except Exception:
+        logger.warning("Speculative evaluation failed for session %s", session_id, exc_info=True)
+
+
 # ---------------------------------------------------------------------------
 # State & Leaderboard
 # ---------------------------------------------------------------------------
 
-def get_leaderboard(session_id: str) -> list[dict]:
-    live_store = get_live_store()
-    participants = live_store.get_participants(session_id)
-    all_answers = live_store.get_answers(session_id)
+def _leaderboard_entries(participants: list[LiveParticipantModel]) -> list[dict]:
+    return [
+        {"participant_id": p.participant_id, "display_name": p.display_name, "score": p.score}
+        for p in participants
+    ]
 
-    # Aggregate scores per participant
-    scores: dict[str, float] = {}
-    for ans in all_answers:
-        if ans.points_awarded is not None:
-            scores[ans.participant_id] = scores.get(ans.participant_id, 0) + ans.points_awarded
-
-    participant_map = {p.participant_id: p for p in participants}
-    board = []
-    for pid, score in scores.items():
-        p = participant_map.get(pid)
-        if p:
-            board.append({
-                "participant_id": pid,
-                "display_name": p.display_name,
-                "score": score,
-            })
-
-    # Include participants with 0 score
-    for p in participants:
-        if p.participant_id not in scores:
-            board.append({
-                "participant_id": p.participant_id,
-                "display_name": p.display_name,
-                "score": 0,
-            })
-
-    board.sort(key=lambda x: x["score"], reverse=True)
-    return board
 
+def get_leaderboard(session_id: str, limit: int | None = None) -> list[dict]:
+    """Top participants by running score, best first (all when limit is None)."""
+    return _leaderboard_entries(get_live_store().get_leaderboard(session_id, limit=limit))
 
-def get_session_state(
-    session_id: str, participant_id: str | None = None, is_presenter: bool = False
-) -> dict | None:
+
+def get_participant_rank(session_id: str, participant_id: str) -> dict | None:
+    """Return {"rank", "score"} for one participant, or None if not in the session."""
+    live_store = get_live_store()
+    participant = live_store.get_participant(participant_id)
+    if not participant or participant.session_id != session_id:
+        return None
+    rank = live_store.get_participant_rank(session_id, participant_id)
+    if rank is None:
+        return None
+    return {"rank": rank, "score": participant.score}
+
+
+# Shared per-session snapshots of everything in the state that does not
+# depend on who is asking. Keyed by session, tagged with the session version
+# plus answers_version: any mutation bumps one of them, so a stale snapshot
+# is simply rebuilt.
+_SNAPSHOT_CACHE_SIZE = 64
+_SNAPSHOT_MAX_AGE_SECONDS = 300  # bounds the life of presigned media URLs
+_snapshots: OrderedDict[str, dict] = OrderedDict()
+_snapshots_lock = threading.Lock()
+_build_locks: dict[str, threading.Lock] = {}
+
+
+def _cached_snapshot(session_id: str, version: int) -> dict | None:
+    with _snapshots_lock:
+        snapshot = _snapshots.get(session_id)
+        if snapshot is None or snapshot["version"] < version:
+            return None
+        if time.monotonic() - snapshot["built_at"] > _SNAPSHOT_MAX_AGE_SECONDS:
+            return None
+        _snapshots.move_to_end(session_id)
+        return snapshot
+
+
+def _get_snapshot(session_id: str, version: int) -> dict | None:
+    snapshot = _cached_snapshot(session_id, version)
+    if snapshot is not None:
+        return snapshot
+
+    # One builder per session; concurrent pollers wait and reuse its result.
+    with _snapshots_lock:
+        build_lock = _build_locks.setdefault(session_id, threading.Lock())
+    with build_lock:
+        snapshot = _cached_snapshot(session_id, version)
+        if snapshot is not None:
+            return snapshot
+        snapshot = _build_snapshot(session_id)
+        if snapshot is None:
+            return None
+        with _snapshots_lock:
+            _snapshots[session_id] = snapshot
+            _snapshots.move_to_end(session_id)
+            while len(_snapshots) > _SNAPSHOT_CACHE_SIZE:
+                evicted, _ = _snapshots.popitem(last=False)
+                _build_locks.pop(evicted, None)
+        return snapshot
+
+
+def clear_snapshot_cache() -> None:
+    with _snapshots_lock:
+        _snapshots.clear()
+        _build_locks.clear()
+
+
+def _build_snapshot(session_id: str) -> dict | None:
     live_store = get_live_store()
     session = live_store.get_session(session_id)
     if not session:
@@ -321,19 +583,27 @@ def get_session_state(
         return None
 
     total_questions = len(event.question_ids)
-    participants = live_store.get_participants(session_id)
+    # One ordered read on the running scores; join order is derived from it.
+    board = live_store.get_leaderboard(session_id)
+    participants = sorted(board, key=lambda p: p.joined_at)
+    all_answers = live_store.get_answers(session_id)
+
+    # Load the current question and every revealed one in a single fetch
+    current_idx = session.current_question_index
+    needed_indices = [
+        idx for idx in [current_idx, *session.revealed_indices] if 0 <= idx < total_questions
+    ]
+    questions = get_question_store().get_many([event.question_ids[idx] for idx in needed_indices])
 
     # Build current question data
     current_question = None
-    current_idx = session.current_question_index
     if 0 <= current_idx < total_questions:
-        qid = event.question_ids[current_idx]
-        q = get_question_store().get_by_id(qid)
+        q = questions.get(event.question_ids[current_idx])
         if q:
             media_url = get_media_store().get_url(q.media_path) if q.media_path else None
             current_question = {
                 "question_index": current_idx,
-                "question": q.question if (session.show_questions_on_devices or is_presenter) else None,
+                "question": q.question,
                 "media_path": media_url,
                 "media_text": q.media_text,
                 "points": q.points,
@@ -345,8 +615,7 @@ def get_session_state(
     revealed_answers = {}
     for idx in session.revealed_indices:
         if 0 <= idx < total_questions:
-            qid = event.question_ids[idx]
-            q = get_question_store().get_by_id(qid)
+            q = questions.get(event.question_ids[idx])
             if q:
                 revealed_answers[str(idx)] = {"correct_answer": q.answer, "points": q.points}
 
@@ -356,6 +625,7 @@ def get_session_state(
         "event_name": event.name,
         "join_code": session.join_code,
         "status": session.status,
+        "version": session.version,
         "current_question_index": current_idx,
         "total_questions": total_questions,
         "show_questions_on_devices": session.show_questions_on_devices,
@@ -367,51 +637,83 @@ def get_session_state(
             {"participant_id": p.participant_id, "display_name": p.display_name}
             for p in participants
         ],
-        "leaderboard": get_leaderboard(session_id),
+        "leaderboard": _leaderboard_entries(board),
+    }
+    ranks = {
+        p.participant_id: {"rank": i, "score": p.score} for i, p in enumerate(board, start=1)
     }
 
-    # Participant-specific data: their own answers
-    if participant_id:
-        my_answers = live_store.get_participant_answers(session_id, participant_id)
-        state["my_answers"] = {}
-        for ans in my_answers:
-            entry = {
-                "answer_text": ans.answer_text,
-                "is_locked": ans.is_locked,
+    # Participant-specific data: each participant's own answers
+    my_answers: dict[str, dict] = {}
+    for ans in sorted(all_answers, key=lambda a: a.question_index):
+        entry = {
+            "answer_text": ans.answer_text,
+            "is_locked": ans.is_locked,
+        }
+        if ans.points_awarded is not None:
+            entry["points_awarded"] = ans.points_awarded
+            entry["max_points"] = ans.max_points
+            entry["is_correct"] = ans.is_correct
+            entry["explanation"] = ans.explanation
+        my_answers.setdefault(ans.participant_id, {})[str(ans.question_index)] = entry
+
+    # Presenter-specific data: answer counts per question + all answers for current question
+    answer_counts: dict[str, int] = {}
+    for ans in all_answers:
+        idx = str(ans.question_index)
+        answer_counts[idx] = answer_counts.get(idx, 0) + 1
+
+    current_answers = None
+    if current_idx >= 0:
+        participant_map = {p.participant_id: p.display_name for p in participants}
+        current_answers = [
+            {
+                "answer_id": a.answer_id,
+                "participant_id": a.participant_id,
+                "display_name": participant_map.get(a.participant_id, "?"),
+                "answer_text": a.answer_text,
+                "is_locked": a.is_locked,
+                "points_awarded": a.points_awarded,
+                "max_points": a.max_points,
+                "is_correct": a.is_correct,
             }
-            if ans.points_awarded is not None:
-                entry["points_awarded"] = ans.points_awarded
-                entry["max_points"] = ans.max_points
-                entry["is_correct"] = ans.is_correct
-                entry["explanation"] = ans.explanation
-            state["my_answers"][str(ans.question_index)] = entry
-
-    # Presenter-specific data: all answers for current question + answer counts
+            for a in all_answers
+            if a.question_index == current_idx
+        ]
+
+    return {
+        "version": session.version + session.answers_version,
+        "built_at": time.monotonic(),
+        "state": state,
+        "my_answers": my_answers,
+        "ranks": ranks,
+        "answer_counts": answer_counts,
+        "current_answers": current_answers,
+    }
+
+
+def get_session_state(
+    session_id: str, participant_id: str | None = None, is_presenter: bool = False
+) -> dict | None:
+    version = get_session_version(session_id, include_answers=True)
+    if version is None:
+        return None
+    snapshot = _get_snapshot(session_id, version)
+    if snapshot is None:
+        return None
+
+    state = dict(snapshot["state"])
+    current_question = state["current_question"]
+    if current_question and not (state["show_questions_on_devices"] or is_presenter):
+        state["current_question"] = {**current_question, "question": None}
+
+    if participant_id:
+        state["my_answers"] = snapshot["my_answers"].get(participant_id, {})
+        state["my_rank"] = snapshot["ranks"].get(participant_id)
+
     if is_presenter:
-        # Answer counts per question (how many participants answered)
-        all_answers = live_store.get_answers(session_id)
-        answer_counts = {}
-        for ans in all_answers:
-            idx = str(ans.question_index)
-            answer_counts[idx] = answer_counts.get(idx, 0) + 1
-        state["answer_counts"] = answer_counts
-
-        # All answers for current question
-        if current_idx >= 0:
-            q_answers = live_store.get_answers(session_id, current_idx)
-            participant_map = {p.participant_id: p.display_name for p in participants}
-            state["current_answers"] = [
-                {
-                    "answer_id": a.answer_id,
-                    "participant_id": a.participant_id,
-                    "display_name": participant_map.get(a.participant_id, "?"),
-                    "answer_text": a.answer_text,
-                    "is_locked": a.is_locked,
-                    "points_awarded": a.points_awarded,
-                    "max_points": a.max_points,
-                    "is_correct": a.is_correct,
-                }
-                for a in q_answers
-            ]
+        state["answer_counts"] = snapshot["answer_counts"]
+        if snapshot["current_answers"] is not None:
+            state["current_answers"] = snapshot["current_answers"]
 
     return state
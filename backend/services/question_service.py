@@ -1,7 +1,19 @@
 import json
+import random
+import threading
+import time
 from base64 import urlsafe_b64encode, urlsafe_b64decode
+from datetime import datetime, timedelta, timezone
+
+from backend.core.settings import get_settings
+from backend.models.deck import PlayDeckModel
 from backend.models.question import QuestionModel
-from backend.storage import get_media_store, get_question_store
+from backend.storage import get_deck_store, get_media_store, get_question_store
+from backend.utils.answer_eval import get_answer_evaluator
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 def _encode_page_token(last_key):
@@ -11,12 +23,20 @@ def _encode_page_token(last_key):
 
 
 def _decode_page_token(token: str | None):
+    """The keyset cursor inside a page token.
+
+    Raises ValueError for anything _encode_page_token did not produce, such as
+    the old ``{"offset": N}`` tokens, rather than silently restarting at page 1.
+    """
     if not token:
         return None
     try:
-        return json.loads(urlsafe_b64decode(token.encode()).decode())
+        key = json.loads(urlsafe_b64decode(token.encode()).decode())
     except Exception:
-        return None
+        key = None
+    if not isinstance(key, dict) or not {"added_at", "question_id"} <= key.keys():
+        raise ValueError("Invalid or expired cursor; start again without it")
+    return key
 
 def get_question_by_id(question_id: str) -> QuestionModel | None:
     """Fetch a question by ID from the database."""
@@ -29,7 +49,10 @@ def get_all_questions(
     page_token: str | None = None,
     include_token: bool = False
 ) -> list[QuestionModel] | tuple[list[QuestionModel], str | None]:
-    """Fetch questions with optional pagination token."""
+    """Fetch questions with optional pagination token.
+
+    Raises ValueError if ``page_token`` is not a cursor returned by this function.
+    """
     if limit is None:
         limit = 10_000  # safety cap for unbounded fetch
 
@@ -38,18 +61,16 @@ def get_all_questions(
 
     collected: list[QuestionModel] = []
     last_key = start_key
-    skipped = 0
+    # offset only positions the first page; later pages follow the cursor.
+    skip = 0 if start_key else offset
 
     while len(collected) < limit:
-        result = store.list(filters, limit=limit, last_key=last_key)
+        result = store.list(filters, limit=limit - len(collected), last_key=last_key, offset=skip)
+        skip = 0
         if isinstance(result, tuple):
             batch, last_key = result
         else:
             batch, last_key = result, None
-        if skipped < offset:
-            to_skip = min(offset - skipped, len(batch))
-            batch = batch[to_skip:]
-            skipped += to_skip
         collected.extend(batch)
         if not last_key or len(collected) >= limit:
             break
@@ -75,7 +96,10 @@ def create_question(data: dict) -> QuestionModel | None:
     else:
         question.media_path = None
     success = question_store.add(question)
-    return question if success else None
+    if not success:
+        return None
+    invalidate_question_metadata()
+    return question
 
 def update_question(question_id: str, updates: dict, user: str | None = None, role: str | None = None) -> QuestionModel | None:
     """Update an existing question in the database."""
@@ -86,7 +110,14 @@ def update_question(question_id: str, updates: dict, user: str | None = None, ro
     media_file = updates.pop("media_file", None)
     remove_media = "media_path" in updates and updates.get("media_path") is None
 
-    existing = question_store.get_by_id(question_id) if (media_file or remove_media or user) else None
+    # Cached evaluations are keyed by the question text, answer, language and points
+    grading_changed = any(key in updates for key in ("question", "answer", "language", "points"))
+
+    existing = (
+        question_store.get_by_id(question_id)
+        if (media_file or remove_media or user or grading_changed)
+        else None
+    )
     if (media_file or remove_media) and not existing:
         return None
 
@@ -109,7 +140,12 @@ def update_question(question_id: str, updates: dict, user: str | None = None, ro
 
     if user:
         updates["updated_by"] = user  # Track who made the update when available
-    return question_store.update(question_id, updates)
+    updated = question_store.update(question_id, updates)
+    if updated:
+        invalidate_question_metadata()
+        if existing and grading_changed:
+            get_answer_evaluator().invalidate(existing.question, existing.answer, existing.language)
+    return updated
 
 def delete_question(question_id: str, confirm: bool = False) -> dict:
     """Delete a question. Returns a result dict with 'success' and optionally 'event_id'.
@@ -142,6 +178,9 @@ def delete_question(question_id: str, confirm: bool = False) -> dict:
         media_store.delete(media_path)
 
     deleted = question_store.delete(question_id)
+    if deleted:
+        invalidate_question_metadata()
+        get_answer_evaluator().invalidate(question.question, question.answer, question.language)
     return {"success": deleted}
 
 def count_questions(filters: dict | None = None) -> int:
@@ -156,15 +195,108 @@ def get_random_question_filtered(seen_ids: list = None, filters: dict = None):
     return get_question_store().random_reviewed(seen_ids or [], effective_filters)
 
 
+# Idle decks are purged from create_play_deck at most this often per process
+_DECK_PURGE_INTERVAL_SECONDS = 600
+_last_deck_purge = 0.0
+
+
+def create_play_deck(filters: dict | None = None, replaces: str | None = None) -> PlayDeckModel | None:
+    """Store a shuffled deck of the reviewed questions matching filters.
+
+    Returns None when nothing matches. The deck ``replaces`` (the caller's
+    previous one) is deleted, and idle decks are purged now and then.
+    """
+    global _last_deck_purge
+    settings = get_settings()
+    effective_filters = dict(filters) if filters else {}
+    effective_filters["review_status"] = True
+
+    question_ids = get_question_store().list_ids(effective_filters, limit=settings.play_deck_max_size)
+    if not question_ids:
+        return None
+    random.shuffle(question_ids)
+
+    deck_store = get_deck_store()
+    if replaces:
+        deck_store.delete(replaces)
+    now = time.monotonic()
+    if now - _last_deck_purge >= _DECK_PURGE_INTERVAL_SECONDS:
+        _last_deck_purge = now
+        deck_store.delete_idle(_utcnow() - timedelta(seconds=settings.play_deck_idle_seconds))
+    deck = PlayDeckModel(filters=effective_filters, question_ids=question_ids)
+    if not deck_store.create(deck):
+        return None
+    return deck
+
+
+def draw_from_deck(
+    deck_id: str, cursor: int = 0, count: int = 1
+) -> tuple[list[QuestionModel], int | None] | None:
+    """Return the next questions of a deck and the cursor to pass next time.
+
+    The cursor is None once the deck is exhausted. Returns None if the deck is
+    unknown or expired. Questions deleted or unreviewed since the deck was
+    built are skipped.
+    """
+    settings = get_settings()
+    active_since = _utcnow() - timedelta(seconds=settings.play_deck_idle_seconds)
+    deck_store = get_deck_store()
+    question_store = get_question_store()
+
+    questions: list[QuestionModel] = []
+    next_cursor: int | None = max(cursor, 0)
+    while next_cursor is not None and len(questions) < count:
+        drawn = deck_store.draw(deck_id, next_cursor, count - len(questions), active_since)
+        if drawn is None:
+            return None if not questions else (questions, next_cursor)
+        ids, size = drawn
+        found = question_store.get_many(ids)
+        questions.extend(q for q in found.values() if q.review_status)
+        next_cursor += len(ids)
+        if not ids or next_cursor >= size:
+            next_cursor = None
+    return questions, next_cursor
+
+
+# Facets are cached per filter set and dropped on every local question write.
+# The TTL bounds how stale another worker process's cache can get.
+_METADATA_TTL_SECONDS = 60
+_metadata_cache: dict[str, tuple[float, dict]] = {}
+_metadata_lock = threading.Lock()
+_metadata_generation = 0
+
+
+def invalidate_question_metadata() -> None:
+    """Drop cached facets after a create, update, review or delete."""
+    global _metadata_generation
+    with _metadata_lock:
+        _metadata_cache.clear()
+        _metadata_generation += 1
+
+
 def get_question_metadata(filters: dict | None = None) -> dict:
-    """Return distinct languages, topics, and tags for reviewed questions."""
+    """Return distinct languages, topics, and tags for reviewed questions,
+    plus per-value question counts under "counts"."""
     effective_filters = dict(filters) if filters else {}
     # Default to reviewed questions to match gameplay/admin expectations.
     effective_filters.setdefault("review_status", True)
-
-    items = get_all_questions(effective_filters, limit=None)
-    languages = sorted({q.language for q in items if q.language})
-    topics = sorted({q.question_topic for q in items if q.question_topic})
-    tags = sorted({tag for q in items for tag in (q.tags or [])})
-
-    return {"languages": languages, "topics": topics, "tags": tags}
+    key = json.dumps(effective_filters, sort_keys=True, default=str)
+
+    with _metadata_lock:
+        cached = _metadata_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _METADATA_TTL_SECONDS:
+            return cached[1]
+        generation = _metadata_generation
+
+    counts = get_question_store().facet_counts(effective_filters)
+    metadata = {
+        "languages": sorted(counts.get("languages", {})),
+        "topics": sorted(counts.get("topics", {})),
+        "tags": sorted(counts.get("tags", {})),
+        "counts": counts,
+    }
+    with _metadata_lock:
+        # Skip caching if a write landed while we were querying.
+        if generation == _metadata_generation:
+            _metadata_cache[key] = (time.monotonic(), metadata)
+    return metadata
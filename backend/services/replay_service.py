@@ -1,12 +1,36 @@
+import hashlib
+import logging
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+from itsdangerous import BadData, URLSafeTimedSerializer
+
+from backend.core.settings import get_settings
 from backend.models.replay import ReplayAttemptModel
 from backend.storage import get_event_store, get_media_store, get_question_store, get_replay_store
-from backend.utils.answer_eval import HybridEvaluator
+from backend.utils.answer_eval import EvalResult, answer_key, get_answer_evaluator, is_fallback_result
+
+logger = logging.getLogger(__name__)
+
+_evaluator = get_answer_evaluator()
+
+_EVALUATION_TOKEN_SALT = "replay-evaluation"
+_ATTEMPT_SALT = "replay-attempt"
+
+# Abandoned attempts are purged from start_replay at most this often per process
+_PURGE_INTERVAL_SECONDS = 600
+_last_purge = 0.0
 
 
-_evaluator = HybridEvaluator()
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 def start_replay(event_id: str) -> dict | None:
+    """Questions of an event without their answers, plus a signed ``attempt_id``
+    under which grade_replay_answer collects results during play."""
     event = get_event_store().get_by_id(event_id)
     if not event:
         return None
@@ -15,8 +39,9 @@ def start_replay(event_id: str) -> dict | None:
     media_store = get_media_store()
     questions = []
     total_points = 0
+    found = question_store.get_many(event.question_ids)
     for qid in event.question_ids:
-        q = question_store.get_by_id(qid)
+        q = found.get(qid)
         if q:
             media_url = media_store.get_url(q.media_path) if q.media_path else None
             questions.append({
@@ -28,8 +53,11 @@ def start_replay(event_id: str) -> dict | None:
             })
             total_points += q.points
 
+    _purge_idle_attempts()
+
     return {
         "event_id": event.event_id,
+        "attempt_id": _issue_attempt_id(event.event_id),
         "name": event.name,
         "description": event.description,
         "total": total_points,
@@ -40,20 +68,136 @@ def start_replay(event_id: str) -> dict | None:
 
 def _load_questions(question_store, user_answers: list[dict]) -> dict:
     """Pre-load all referenced questions into a dict keyed by question_id."""
-    questions = {}
-    for entry in user_answers:
-        qid = entry.get("question_id", "")
-        if qid and qid not in questions:
-            q = question_store.get_by_id(qid)
-            if q:
-                questions[qid] = q
-    return questions
+    return question_store.get_many([entry.get("question_id", "") for entry in user_answers])
+
+
+def _result_key(question, user_answer: str) -> str:
+    """Identify a graded answer: the question as graded plus the normalized answer.
+
+    Editing the answer, or the question's text, reference, points or language,
+    gives a new key, so a reused result is never stale.
+    """
+    parts = (question.question_id, question.question, question.answer, str(question.points),
+             question.language or "", answer_key(user_answer))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _token_serializer(salt: str = _EVALUATION_TOKEN_SALT) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(get_settings().secret_key, salt=salt)
+
+
+def _issue_attempt_id(event_id: str) -> str:
+    return _token_serializer(_ATTEMPT_SALT).dumps({"event_id": event_id, "attempt": uuid.uuid4().hex})
+
+
+def _read_attempt_id(event_id: str, attempt_id: str | None) -> str | None:
+    """The storage key inside a signed attempt ID; None if missing, expired or forged."""
+    if not attempt_id:
+        return None
+    try:
+        payload = _token_serializer(_ATTEMPT_SALT).loads(
+            attempt_id, max_age=get_settings().replay_attempt_idle_seconds
+        )
+    except BadData:
+        return None
+    if not isinstance(payload, dict) or payload.get("event_id") != event_id:
+        return None
+    attempt = payload.get("attempt")
+    return attempt if isinstance(attempt, str) else None
+
+
+def _purge_idle_attempts() -> None:
+    """Drop results of abandoned attempts; throttled, as it scans the whole table."""
+    global _last_purge
+    now = time.monotonic()
+    if now - _last_purge < _PURGE_INTERVAL_SECONDS:
+        return
+    _last_purge = now
+    idle_seconds = get_settings().replay_attempt_idle_seconds
+    try:
+        get_replay_store().delete_idle_attempt_results(_utcnow() - timedelta(seconds=idle_seconds))
+    except Exception as exc:
+        logger.warning("Purging idle replay attempts failed: %s", exc)
 
 
-def _batch_evaluate(user_answers: list[dict], questions: dict) -> list:
+def _issue_evaluation_token(event_id: str, graded: dict[str, EvalResult]) -> str:
+    """Sign the results of an evaluation so a later call can reuse them."""
+    results = {key: asdict(result) for key, result in graded.items() if not is_fallback_result(result)}
+    return _token_serializer().dumps({"event_id": event_id, "results": results})
+
+
+def _read_evaluation_token(event_id: str, token: str | None) -> dict[str, EvalResult]:
+    """Results carried by a token from evaluate_replay; empty if missing, expired or forged."""
+    if not token:
+        return {}
+    try:
+        payload = _token_serializer().loads(token, max_age=get_settings().replay_eval_token_ttl_seconds)
+    except BadData as exc:
+        logger.info("Ignoring replay evaluation token: %s", exc)
+        return {}
+    if not isinstance(payload, dict) or payload.get("event_id") != event_id:
+        return {}
+    try:
+        return {key: EvalResult(**value) for key, value in (payload.get("results") or {}).items()}
+    except TypeError:
+        return {}
+
+
+def grade_replay_answer(event_id: str, attempt_id: str, question_id: str, user_answer: str) -> bool | None:
+    """Grade one answer while the replay is still being played and keep the
+    result for the attempt, so evaluate/submit only assemble it.
+
+    The result is not returned, so answers stay hidden until the review.
+    Only the latest answer per question is kept. Returns None if the question
+    is not part of the event, False if the result was a fallback that is
+    better graded again at evaluate time. Raises ValueError for an attempt ID
+    that start_replay did not issue for this event, or that has expired.
+    """
+    attempt = _read_attempt_id(event_id, attempt_id)
+    if attempt is None:
+        raise ValueError("Invalid or expired replay attempt")
+    event = get_event_store().get_by_id(event_id)
+    if not event or question_id not in event.question_ids:
+        return None
+    question = get_question_store().get_by_id(question_id)
+    if not question:
+        return None
+
+    result = _evaluator.evaluate(question.question, question.answer, user_answer, question.points, question.language)
+    if is_fallback_result(result):
+        return False
+    get_replay_store().save_attempt_result(
+        attempt, event_id, question_id, _result_key(question, user_answer), asdict(result)
+    )
+    return True
+
+
+def _known_results(event_id: str, evaluation_token: str | None, attempt_id: str | None) -> dict[str, EvalResult]:
+    """Results graded earlier in this attempt, in the background or by a previous evaluate."""
+    known = {}
+    attempt = _read_attempt_id(event_id, attempt_id)
+    if attempt:
+        for key, value in get_replay_store().get_attempt_results(attempt, event_id).items():
+            try:
+                known[key] = EvalResult(**value)
+            except TypeError:
+                continue
+    known.update(_read_evaluation_token(event_id, evaluation_token))
+    return known
+
+
+def _batch_evaluate(user_answers: list[dict], questions: dict, known: dict[str, EvalResult] | None = None):
     """Run evaluate_batch for all entries that need it (no override, question exists).
-    Returns a list of EvalResult|None aligned with user_answers indices."""
+
+    Entries whose result is in ``known`` (see _known_results) are not
+    graded again. Returns ({index: EvalResult} for user_answers, {result key:
+    EvalResult} for every graded entry).
+    """
+    known = known or {}
+    result_map = {}
+    graded = {}
     eval_indices = []
+    eval_keys = []
     eval_items = []
     for i, entry in enumerate(user_answers):
         qid = entry.get("question_id", "")
@@ -61,12 +205,20 @@ def _batch_evaluate(user_answers: list[dict], questions: dict) -> list:
         q = questions.get(qid)
         if override is None and q:
             user_answer = entry.get("user_answer") or entry.get("answer", "")
+            key = _result_key(q, user_answer)
+            if key in known:
+                result_map[i] = graded[key] = known[key]
+                continue
             eval_indices.append(i)
-            eval_items.append((q.question, q.answer, user_answer, q.points))
+            eval_keys.append(key)
+            eval_items.append((q.question, q.answer, user_answer, q.points, q.language))
 
     batch_results = _evaluator.evaluate_batch(eval_items) if eval_items else []
-    result_map = {idx: result for idx, result in zip(eval_indices, batch_results)}
-    return result_map
+    for idx, key, result in zip(eval_indices, eval_keys, batch_results):
+        result_map[idx] = graded[key] = result
+    if known:
+        logger.debug("Replay evaluation reused %d result(s), graded %d", len(result_map) - len(eval_items), len(eval_items))
+    return result_map, graded
 
 
 def _resolve_override(override, max_points: int) -> int:
@@ -84,15 +236,23 @@ def _resolve_override(override, max_points: int) -> int:
         return max_points if override else 0
 
 
-def evaluate_replay(event_id: str, user_answers: list[dict]) -> dict | None:
-    """Evaluate answers without saving to DB. Returns score and per-question details."""
+def evaluate_replay(
+    event_id: str,
+    user_answers: list[dict],
+    evaluation_token: str | None = None,
+    attempt_id: str | None = None,
+) -> dict | None:
+    """Evaluate answers without saving to DB. Returns score, per-question details
+    and an ``evaluation_token`` that lets the next evaluate/submit skip unchanged answers."""
     event = get_event_store().get_by_id(event_id)
     if not event:
         return None
 
     question_store = get_question_store()
     questions = _load_questions(question_store, user_answers)
-    result_map = _batch_evaluate(user_answers, questions)
+    result_map, graded = _batch_evaluate(
+        user_answers, questions, _known_results(event_id, evaluation_token, attempt_id)
+    )
 
     answers_detail = []
     score = 0
@@ -147,6 +307,7 @@ def evaluate_replay(event_id: str, user_answers: list[dict]) -> dict | None:
         "score": score,
         "total": total_points,
         "answers": answers_detail,
+        "evaluation_token": _issue_evaluation_token(event_id, graded),
     }
 
 
@@ -155,6 +316,8 @@ def submit_replay(
     user_answers: list[dict],
     user_id: str | None = None,
     display_name: str | None = None,
+    evaluation_token: str | None = None,
+    attempt_id: str | None = None,
 ) -> ReplayAttemptModel | None:
     event = get_event_store().get_by_id(event_id)
     if not event:
@@ -162,9 +325,12 @@ def submit_replay(
 
     question_store = get_question_store()
     questions = _load_questions(question_store, user_answers)
-    result_map = _batch_evaluate(user_answers, questions)
+    result_map, _graded = _batch_evaluate(
+        user_answers, questions, _known_results(event_id, evaluation_token, attempt_id)
+    )
 
     answers_detail = []
+    stats: list[tuple[str, bool]] = []
     score = 0
     total_points = 0
 
@@ -199,11 +365,7 @@ def submit_replay(
             points_awarded = result.points_awarded
             explanation = result.explanation
 
-        # Update question stats
-        question_store.update(qid, {
-            "times_asked": question.times_asked + 1,
-            **({"times_correct": question.times_correct + 1} if is_correct else {"times_incorrect": question.times_incorrect + 1}),
-        })
+        stats.append((qid, is_correct))
 
         score += points_awarded
 
@@ -219,6 +381,9 @@ def submit_replay(
             detail["explanation"] = explanation
         answers_detail.append(detail)
 
+    # One atomic batch increment instead of a read-modify-write per question.
+    question_store.increment_stats(stats)
+
     replay = ReplayAttemptModel(
         event_id=event_id,
         user_id=user_id,
@@ -230,6 +395,9 @@ def submit_replay(
 
     replay_store = get_replay_store()
     replay_store.save(replay)
+    attempt = _read_attempt_id(event_id, attempt_id)
+    if attempt:
+        replay_store.delete_attempt_results(attempt)
 
     # Update event best_score if this is a new high
     if event.best_score is None or score > event.best_score:
@@ -1,5 +1,7 @@
-from backend.storage.base import EventStore, LiveStore, MediaStore, QuestionStore, ReplayStore, UserStore
+from backend.storage.base import DeckStore, EvalCacheStore, EventStore, LiveStore, MediaStore, QuestionStore, ReplayStore, UserStore
 from backend.storage.factory import (
+    get_deck_store,
+    get_eval_cache_store,
     get_event_store,
     get_live_store,
     get_media_store,
@@ -10,12 +12,16 @@ from backend.storage.factory import (
 )
 
 __all__ = [
+    "DeckStore",
+    "EvalCacheStore",
     "EventStore",
     "LiveStore",
     "MediaStore",
     "QuestionStore",
     "ReplayStore",
     "UserStore",
+    "get_deck_store",
+    "get_eval_cache_store",
     "get_event_store",
     "get_live_store",
     "get_media_store",
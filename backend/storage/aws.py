@@ -10,6 +10,8 @@ from backend.db.questiondb import (
     delete_question_from_db,
     get_all_questions_db,
     get_question_by_id_db,
+    get_questions_by_ids_db,
+    increment_question_stats_db,
     update_question_in_db,
 )
 from backend.db.userdb import (
@@ -30,8 +32,15 @@ class DynamoQuestionStore(QuestionStore):
     def get_by_id(self, question_id):
         return get_question_by_id_db(question_id)
 
-    def list(self, filters=None, limit: int = 50, last_key: dict | None = None):
-        return get_all_questions_db(filters, limit=limit, last_key=last_key)
+    def get_many(self, question_ids):
+        return get_questions_by_ids_db(question_ids)
+
+    def list(self, filters=None, limit: int = 50, last_key: dict | None = None, offset: int = 0):
+        if last_key or offset <= 0:
+            return get_all_questions_db(filters, limit=limit, last_key=last_key)
+        # Scans have no server-side offset; over-fetch the first page and slice.
+        items, next_key = get_all_questions_db(filters, limit=limit + offset)
+        return items[offset:], next_key
 
     def list_by_topic(self, topic: str, limit: int = 50, last_key: dict | None = None):
         return get_all_questions_db({"question_topic": topic}, limit=limit, last_key=last_key)
@@ -42,6 +51,9 @@ class DynamoQuestionStore(QuestionStore):
     def delete(self, question_id: str) -> bool:
         return delete_question_from_db(question_id)
 
+    def increment_stats(self, results: list[tuple[str, bool]]) -> int:
+        return increment_question_stats_db(self._stat_deltas(results))
+
 
 class DynamoUserStore(UserStore):
     def add(self, user):
@@ -4,6 +4,9 @@ import random as _random
 from abc import ABC, abstractmethod
 from typing import Optional, IO
 
+from datetime import datetime
+
+from backend.models.deck import PlayDeckModel
 from backend.models.event import EventModel
 from backend.models.live import LiveAnswerModel, LiveParticipantModel, LiveSessionModel
 from backend.models.question import QuestionModel
@@ -26,7 +29,10 @@ class QuestionStore(ABC):
         filters: dict | None = None,
         limit: int = 50,
         last_key: dict | None = None,
+        offset: int = 0,
     ) -> tuple[list[QuestionModel], dict | None]:
+        """Return one page and the key to pass as last_key for the next page.
+        offset skips rows before the first page and is ignored with last_key."""
         raise NotImplementedError
 
     @abstractmethod
@@ -51,6 +57,64 @@ class QuestionStore(ABC):
         items, _ = self.list(filters, limit=10_000)
         return len(items)
 
+    def get_many(self, question_ids: list[str]) -> dict[str, QuestionModel]:
+        """Return found questions keyed by ID, in the order of question_ids.
+        Missing IDs are omitted. Override for a single DB round trip."""
+        found: dict[str, QuestionModel] = {}
+        for qid in question_ids:
+            if not qid or qid in found:
+                continue
+            question = self.get_by_id(qid)
+            if question:
+                found[qid] = question
+        return found
+
+    def increment_stats(self, results: list[tuple[str, bool]]) -> int:
+        """Count one answer per (question_id, is_correct) pair into times_asked
+        and times_correct/times_incorrect. Does not touch update_history.
+        Returns the number of questions updated. Override with an atomic
+        increment; this fallback is read-modify-write."""
+        updated = 0
+        for qid, (asked, correct, incorrect) in self._stat_deltas(results).items():
+            question = self.get_by_id(qid)
+            if question and self.update(qid, {
+                "times_asked": question.times_asked + asked,
+                "times_correct": question.times_correct + correct,
+                "times_incorrect": question.times_incorrect + incorrect,
+            }):
+                updated += 1
+        return updated
+
+    @staticmethod
+    def _stat_deltas(results: list[tuple[str, bool]]) -> dict[str, tuple[int, int, int]]:
+        """Fold (question_id, is_correct) pairs into per-ID (asked, correct, incorrect)."""
+        deltas: dict[str, list[int]] = {}
+        for qid, is_correct in results:
+            if not qid:
+                continue
+            delta = deltas.setdefault(qid, [0, 0, 0])
+            delta[0] += 1
+            delta[1 if is_correct else 2] += 1
+        return {qid: (a, c, i) for qid, (a, c, i) in deltas.items()}
+
+    def facet_counts(self, filters: dict | None = None) -> dict[str, dict[str, int]]:
+        """Return {"languages", "topics", "tags"} -> {value: question count}.
+        Override to aggregate in the database."""
+        items, _ = self.list(filters, limit=10_000)
+        facets: dict[str, dict[str, int]] = {"languages": {}, "topics": {}, "tags": {}}
+        for q in items:
+            values = [("languages", q.language), ("topics", q.question_topic)]
+            values += [("tags", tag) for tag in set(q.tags or [])]
+            for facet, value in values:
+                if value:
+                    facets[facet][value] = facets[facet].get(value, 0) + 1
+        return facets
+
+    def list_ids(self, filters: dict | None = None, limit: int = 10_000) -> list[str]:
+        """Return IDs of questions matching filters. Override to skip loading rows."""
+        items, _ = self.list(filters, limit=limit)
+        return [q.question_id for q in items]
+
     def random_reviewed(
         self,
         seen_ids: list[str] | None = None,
@@ -59,7 +123,8 @@ class QuestionStore(ABC):
         """Return a random reviewed question not in seen_ids. Override for DB-level random."""
         items, _ = self.list(filters, limit=10_000)
         if seen_ids:
-            items = [q for q in items if q.question_id not in seen_ids]
+            seen = set(seen_ids)
+            items = [q for q in items if q.question_id not in seen]
         return _random.choice(items) if items else None
 
 
@@ -188,6 +253,28 @@ class ReplayStore(ABC):
     def delete(self, replay_id: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_attempt_result(
+        self, attempt_id: str, event_id: str, question_id: str, result_key: str, result: dict
+    ) -> bool:
+        """Store the graded answer to one question of an in-progress replay
+        attempt, replacing the previous answer to that question."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_attempt_results(self, attempt_id: str, event_id: str) -> dict[str, dict]:
+        """Return the attempt's graded answers keyed by result key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_attempt_results(self, attempt_id: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_idle_attempt_results(self, before: datetime) -> int:
+        """Purge results of abandoned attempts graded before ``before``."""
+        raise NotImplementedError
+
 
 class LiveStore(ABC):
     @abstractmethod
@@ -206,6 +293,24 @@ class LiveStore(ABC):
     def update_session(self, session_id: str, updates: dict) -> Optional[LiveSessionModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_session_versions(self, session_id: str) -> Optional[tuple[int, int]]:
+        """Return (version, answers_version) without loading the session."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump_session_version(self, session_id: str) -> Optional[int]:
+        """Atomically increment the session version and return the new value.
+        update_session bumps it implicitly; call this for changes that do not
+        touch the session row (joins, point overrides)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump_answers_version(self, session_id: str) -> Optional[int]:
+        """Atomically increment answers_version, for a submitted answer. Kept
+        apart from the version so an answer only wakes presenter views."""
+        raise NotImplementedError
+
     @abstractmethod
     def add_participant(self, participant: LiveParticipantModel) -> bool:
         raise NotImplementedError
@@ -218,6 +323,28 @@ class LiveStore(ABC):
     def get_participant(self, participant_id: str) -> Optional[LiveParticipantModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_leaderboard(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> list[LiveParticipantModel]:
+        """Participants ordered by score (desc), then join order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_participant_rank(
+        self, session_id: str, participant_id: str
+    ) -> Optional[int]:
+        """1-based position of the participant in get_leaderboard order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def refresh_scores(
+        self, session_id: str, participant_ids: Optional[list[str]] = None
+    ) -> int:
+        """Recompute running scores from awarded points (all participants of
+        the session when participant_ids is None). Returns rows updated."""
+        raise NotImplementedError
+
     @abstractmethod
     def save_answer(self, answer: LiveAnswerModel) -> bool:
         raise NotImplementedError
@@ -246,11 +373,76 @@ class LiveStore(ABC):
     ) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_speculative_result(
+        self,
+        session_id: str,
+        participant_id: str,
+        question_index: int,
+        answer_text: str,
+        result: dict,
+    ) -> bool:
+        """Stash a background evaluation on the answer, but only while it still
+        has this answer_text and has not been scored. Returns whether it stuck."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply_evaluations(
+        self, session_id: str, question_index: int, results: dict[str, dict]
+    ) -> int:
+        """Write evaluation results keyed by answer_id. Each value holds
+        points_awarded, max_points, is_correct and explanation. Answers that
+        are not in this session/question are skipped, and the running scores
+        of the affected participants are refreshed. Returns rows updated."""
+        raise NotImplementedError
+
     @abstractmethod
     def update_answer(self, answer_id: str, updates: dict) -> Optional[LiveAnswerModel]:
         raise NotImplementedError
 
 
+class DeckStore(ABC):
+    @abstractmethod
+    def create(self, deck: PlayDeckModel) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def draw(
+        self, deck_id: str, cursor: int, count: int, active_since: datetime
+    ) -> tuple[list[str], int] | None:
+        """Return (question_ids[cursor:cursor + count], deck size) and mark the
+        deck as used. None if the deck is unknown or idle since before active_since."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, deck_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_idle(self, before: datetime) -> int:
+        raise NotImplementedError
+
+
+class EvalCacheStore(ABC):
+    """Persistent tier of the answer evaluation cache.
+
+    Keys are (question_hash, normalized_answer, max_points) tuples; values are
+    EvalResult fields as dicts.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: list[tuple[str, str, int]]) -> dict[tuple[str, str, int], dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put_many(self, entries: dict[tuple[str, str, int], dict]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_question(self, question_hash: str) -> int:
+        raise NotImplementedError
+
+
 class MediaStore(ABC):
     @abstractmethod
     def upload(self, file) -> Optional[str]:
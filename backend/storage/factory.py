@@ -3,7 +3,7 @@ from __future__ import annotations
 from functools import lru_cache
 
 from backend.core.settings import get_settings
-from backend.storage.base import EventStore, LiveStore, MediaStore, QuestionStore, ReplayStore, UserStore
+from backend.storage.base import DeckStore, EvalCacheStore, EventStore, LiveStore, MediaStore, QuestionStore, ReplayStore, UserStore
 
 
 def _normalize_backend(value: str, default: str = "aws") -> str:
@@ -93,6 +93,20 @@ def get_live_store() -> LiveStore:
     return PostgresLiveStore()
 
 
+@lru_cache()
+def get_deck_store() -> DeckStore:
+    from backend.storage.postgres import PostgresDeckStore
+
+    return PostgresDeckStore()
+
+
+@lru_cache()
+def get_eval_cache_store() -> EvalCacheStore:
+    from backend.storage.postgres import PostgresEvalCacheStore
+
+    return PostgresEvalCacheStore()
+
+
 def reset_store_cache() -> None:
     get_question_store.cache_clear()
     get_user_store.cache_clear()
@@ -100,3 +114,5 @@ def reset_store_cache() -> None:
     get_event_store.cache_clear()
     get_replay_store.cache_clear()
     get_live_store.cache_clear()
+    get_deck_store.cache_clear()
+    get_eval_cache_store.cache_clear()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random as _random
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -7,6 +8,7 @@ from functools import lru_cache
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
+from pydantic import BaseModel
 from sqlalchemy import (
     Boolean,
     Column,
@@ -17,25 +19,35 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    and_,
+    any_,
+    cast,
+    column,
     create_engine,
+    delete,
     desc,
     func,
+    literal,
     or_,
     select,
     text,
+    tuple_,
+    update,
+    values,
 )
 from sqlalchemy.engine import URL
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
 
 from backend.core.settings import get_settings
+from backend.models.deck import PlayDeckModel
 from backend.models.event import EventModel
 from backend.models.live import LiveAnswerModel, LiveParticipantModel, LiveSessionModel
 from backend.models.question import QuestionModel
 from backend.models.replay import ReplayAttemptModel
 from backend.models.user import UserModel
-from backend.storage.base import EventStore, LiveStore, QuestionStore, ReplayStore, UserStore
+from backend.storage.base import DeckStore, EvalCacheStore, EventStore, LiveStore, QuestionStore, ReplayStore, UserStore
 
 Base = declarative_base()
 
@@ -67,11 +79,17 @@ class QuestionRecord(Base):
     media_path = Column(String)
     media_text = Column(Text)
     points = Column(Integer, nullable=False, default=1, server_default=text("1"))
+    # Uniform [0, 1) sort key for index-backed random selection. Set once;
+    # picks choose among a batch of neighbours so gaps between keys do not
+    # bias them.
+    random_key = Column(Float, nullable=False, default=_random.random, server_default=text("random()"))
 
     __table_args__ = (
         Index("ix_questions_topic_id", "question_topic", "question_id"),
         Index("ix_questions_review_status", "review_status"),
         Index("ix_questions_language", "language"),
+        Index("ix_questions_added_at_id", "added_at", "question_id"),
+        Index("ix_questions_review_random", "review_status", "random_key"),
     )
 
 
@@ -137,6 +155,21 @@ class ReplayRecord(Base):
     completed_at = Column(DateTime, nullable=False, default=_utcnow)
 
 
+class ReplayAttemptResultRecord(Base):
+    __tablename__ = "replay_attempt_results"
+
+    attempt_id = Column(String, primary_key=True)
+    question_id = Column(String, primary_key=True)
+    result_key = Column(String(32), nullable=False)
+    event_id = Column(String, nullable=False)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+
+    __table_args__ = (
+        Index("ix_replay_attempt_results_created_at", "created_at"),
+    )
+
+
 class LiveSessionRecord(Base):
     __tablename__ = "live_sessions"
 
@@ -148,6 +181,8 @@ class LiveSessionRecord(Base):
     locked_indices = Column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))
     show_questions_on_devices = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     status = Column(String, nullable=False, default="lobby")
+    version = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    answers_version = Column(Integer, nullable=False, default=0, server_default=text("0"))
     created_by = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False, default=_utcnow)
     updated_at = Column(DateTime, nullable=False, default=_utcnow)
@@ -165,10 +200,12 @@ class LiveParticipantRecord(Base):
     session_id = Column(String, nullable=False)
     display_name = Column(String, nullable=False)
     user_id = Column(String, nullable=True)
+    score = Column(Float, nullable=False, default=0, server_default=text("0"))
     joined_at = Column(DateTime, nullable=False, default=_utcnow)
 
     __table_args__ = (
         Index("ix_live_participants_session_id", "session_id"),
+        Index("ix_live_participants_session_score", "session_id", desc("score"), "joined_at"),
     )
 
 
@@ -185,6 +222,7 @@ class LiveAnswerRecord(Base):
     max_points = Column(Float, nullable=True)
     is_correct = Column(Boolean, nullable=True)
     explanation = Column(Text, nullable=True)
+    speculative_result = Column(JSONB, nullable=True)
     submitted_at = Column(DateTime, nullable=False, default=_utcnow)
 
     __table_args__ = (
@@ -197,6 +235,30 @@ class LiveAnswerRecord(Base):
     )
 
 
+class PlayDeckRecord(Base):
+    __tablename__ = "play_decks"
+
+    deck_id = Column(String, primary_key=True)
+    filters = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
+    question_ids = Column(ARRAY(String), nullable=False, default=list, server_default=text("'{}'"))
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+    last_used_at = Column(DateTime, nullable=False, default=_utcnow)
+
+    __table_args__ = (
+        Index("ix_play_decks_last_used_at", "last_used_at"),
+    )
+
+
+class EvalCacheRecord(Base):
+    __tablename__ = "eval_cache"
+
+    question_hash = Column(String(64), primary_key=True)
+    answer_norm = Column(Text, primary_key=True)
+    max_points = Column(Integer, primary_key=True)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+
+
 def _build_url() -> URL | str:
     settings = get_settings()
     if settings.postgres_dsn:
@@ -248,8 +310,29 @@ def session_scope(commit: bool = False):
         session.close()
 
 
+# Rows read back from our own tables were validated and sanitized on the way
+# in, so the *_from_record helpers build models with model_construct and skip
+# re-running the field validators. Anything written goes through the models'
+# normal validation: new rows arrive as models, and update() methods run their
+# changes through _validated_updates.
+
+def _validated_updates(current: BaseModel, updates: dict) -> dict:
+    """Run the changed fields through the model's validators before writing.
+
+    The whole row is re-validated so cross-field rules still hold; keys that
+    are not model fields pass through unchanged. Raises ValidationError (a
+    ValueError) for values the model rejects.
+    """
+    model_cls = type(current)
+    changed = {key: value for key, value in updates.items() if key in model_cls.model_fields}
+    if not changed:
+        return updates
+    validated = model_cls.model_validate({**current.model_dump(), **changed})
+    return {**updates, **{key: getattr(validated, key) for key in changed}}
+
+
 def _question_from_record(record: QuestionRecord) -> QuestionModel:
-    return QuestionModel(
+    return QuestionModel.model_construct(
         question_id=record.question_id,
         question=record.question,
         answer=record.answer,
@@ -275,7 +358,7 @@ def _question_from_record(record: QuestionRecord) -> QuestionModel:
 
 
 def _user_from_record(record: UserRecord) -> UserModel:
-    return UserModel(
+    return UserModel.model_construct(
         user_id=record.user_id,
         username=record.username,
         email=record.email,
@@ -343,6 +426,58 @@ def _apply_user_filters(query, filters: dict | None):
     return query
 
 
+def _parse_question_cursor(last_key: dict | None) -> tuple[datetime, str] | None:
+    if not last_key:
+        return None
+    try:
+        return datetime.fromisoformat(last_key["added_at"]), str(last_key["question_id"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid or expired cursor; start again without it") from exc
+
+
+_RANDOM_PROBES = 3
+_RANDOM_PROBE_BATCH = 20
+_RANDOM_SCAN_BATCH = 500
+
+
+def _probe_random(session, base, start: float, seen: set[str]) -> QuestionRecord | None:
+    """A random unseen row among the _RANDOM_PROBE_BATCH rows at or after start.
+
+    A batch cut short by the end of the key range is topped up from its start,
+    so every row belongs to the same number of batches. Picking within the
+    batch rather than its first row keeps a row behind a wide key gap from
+    being favoured.
+    """
+    query = base.order_by(QuestionRecord.random_key)
+    ahead = query.where(QuestionRecord.random_key >= start).limit(_RANDOM_PROBE_BATCH)
+    records = list(session.execute(ahead).scalars())
+    if len(records) < _RANDOM_PROBE_BATCH:
+        wrapped = query.where(QuestionRecord.random_key < start).limit(_RANDOM_PROBE_BATCH - len(records))
+        records.extend(session.execute(wrapped).scalars())
+    unseen = [r for r in records if r.question_id not in seen]
+    return _random.choice(unseen) if unseen else None
+
+
+def _scan_unseen(session, base, seen: set[str]) -> QuestionRecord | None:
+    """Walk the whole filtered range in random_key order and return a random
+    unseen row, or None once the caller has seen everything. Only keys are
+    read during the walk; the chosen row is loaded on its own."""
+    keys = base.with_only_columns(QuestionRecord.question_id, QuestionRecord.random_key)
+    unseen: list[str] = []
+    cursor: tuple[float, str] | None = None
+    while True:
+        query = keys
+        if cursor:
+            query = query.where(tuple_(QuestionRecord.random_key, QuestionRecord.question_id) > tuple_(*cursor))
+        query = query.order_by(QuestionRecord.random_key, QuestionRecord.question_id).limit(_RANDOM_SCAN_BATCH)
+        rows = session.execute(query).all()
+        unseen.extend(question_id for question_id, _ in rows if question_id not in seen)
+        if len(rows) < _RANDOM_SCAN_BATCH:
+            break
+        cursor = (rows[-1][1], rows[-1][0])
+    return session.get(QuestionRecord, _random.choice(unseen)) if unseen else None
+
+
 class PostgresQuestionStore(QuestionStore):
     def add(self, question: QuestionModel) -> bool:
         record = QuestionRecord(
@@ -382,23 +517,48 @@ class PostgresQuestionStore(QuestionStore):
             record = session.get(QuestionRecord, question_id)
             return _question_from_record(record) if record else None
 
-    def list(self, filters: dict | None = None, limit: int = 50, last_key: dict | None = None):
-        offset = 0
-        if last_key and "offset" in last_key:
-            try:
-                offset = int(last_key["offset"])
-            except (TypeError, ValueError):
-                offset = 0
+    def get_many(self, question_ids: list[str]) -> dict[str, QuestionModel]:
+        ids = list(dict.fromkeys(qid for qid in question_ids if qid))
+        if not ids:
+            return {}
+        with session_scope() as session:
+            query = select(QuestionRecord).where(
+                QuestionRecord.question_id == any_(literal(ids, type_=ARRAY(String)))
+            )
+            records = {r.question_id: r for r in session.execute(query).scalars().all()}
+            return {qid: _question_from_record(records[qid]) for qid in ids if qid in records}
+
+    def list(
+        self,
+        filters: dict | None = None,
+        limit: int = 50,
+        last_key: dict | None = None,
+        offset: int = 0,
+    ):
+        """Keyset pagination on (added_at, question_id), newest first.
+
+        last_key is the {"added_at", "question_id"} of the previous page's last
+        row, so every page is an index range scan regardless of depth. offset is
+        only honoured when no last_key is given (legacy offset links).
+        """
+        cursor = _parse_question_cursor(last_key)
         with session_scope() as session:
             query = select(QuestionRecord)
             query = _apply_question_filters(query, filters)
-            query = query.order_by(QuestionRecord.added_at.desc(), QuestionRecord.question_id)
-            query = query.offset(offset).limit(limit + 1)
+            if cursor:
+                query = query.where(
+                    tuple_(QuestionRecord.added_at, QuestionRecord.question_id) < tuple_(*cursor)
+                )
+            elif offset > 0:
+                query = query.offset(offset)
+            query = query.order_by(QuestionRecord.added_at.desc(), QuestionRecord.question_id.desc())
+            query = query.limit(limit + 1)
             records = session.execute(query).scalars().all()
             next_key = None
             if len(records) > limit:
                 records = records[:limit]
-                next_key = {"offset": offset + limit}
+                last = records[-1]
+                next_key = {"added_at": last.added_at.isoformat(), "question_id": last.question_id}
             return [_question_from_record(record) for record in records], next_key
 
     def list_by_topic(self, topic: str, limit: int = 50, last_key: dict | None = None):
@@ -414,6 +574,7 @@ class PostgresQuestionStore(QuestionStore):
             timestamp = _utcnow().isoformat()
             updated_by = updates.get("updated_by")
             changes = {k: v for k, v in updates.items() if k != "updated_by"}
+            changes = _validated_updates(_question_from_record(record), changes)
             update_entry = {"timestamp": timestamp, "changes": changes}
             if updated_by is not None:
                 update_entry["updated_by"] = updated_by
@@ -444,19 +605,81 @@ class PostgresQuestionStore(QuestionStore):
             query = _apply_question_filters(query, filters)
             return session.execute(query).scalar() or 0
 
+    def increment_stats(self, results: list[tuple[str, bool]]) -> int:
+        deltas = self._stat_deltas(results)
+        if not deltas:
+            return 0
+        # One UPDATE ... FROM (VALUES ...) for the whole batch: increments are
+        # applied in the database, so concurrent submissions cannot lose counts.
+        rows = values(
+            column("question_id", String),
+            column("asked", Integer),
+            column("correct", Integer),
+            column("incorrect", Integer),
+            name="deltas",
+        ).data([(qid, *delta) for qid, delta in deltas.items()])
+        query = (
+            update(QuestionRecord)
+            .where(QuestionRecord.question_id == rows.c.question_id)
+            .values(
+                times_asked=QuestionRecord.times_asked + rows.c.asked,
+                times_correct=QuestionRecord.times_correct + rows.c.correct,
+                times_incorrect=QuestionRecord.times_incorrect + rows.c.incorrect,
+            )
+        )
+        with session_scope(commit=True) as session:
+            return session.execute(query).rowcount or 0
+
+    def facet_counts(self, filters: dict | None = None) -> dict[str, dict[str, int]]:
+        with session_scope() as session:
+            facets: dict[str, dict[str, int]] = {}
+            for facet, field in (("languages", QuestionRecord.language), ("topics", QuestionRecord.question_topic)):
+                query = _apply_question_filters(select(field, func.count()), filters)
+                query = query.where(field.isnot(None), field != "").group_by(field)
+                facets[facet] = {value: count for value, count in session.execute(query)}
+            tag = func.jsonb_array_elements_text(QuestionRecord.tags).label("tag")
+            tags = _apply_question_filters(select(QuestionRecord.question_id, tag), filters).subquery()
+            query = (
+                select(tags.c.tag, func.count(tags.c.question_id.distinct()))
+                .where(tags.c.tag != "")
+                .group_by(tags.c.tag)
+            )
+            facets["tags"] = {value: count for value, count in session.execute(query)}
+            return facets
+
+    def list_ids(self, filters: dict | None = None, limit: int = 10_000) -> list[str]:
+        with session_scope() as session:
+            query = _apply_question_filters(select(QuestionRecord.question_id), filters)
+            query = query.order_by(QuestionRecord.random_key).limit(limit)
+            return list(session.execute(query).scalars().all())
+
     def random_reviewed(
         self,
         seen_ids: list[str] | None = None,
         filters: dict | None = None,
     ) -> QuestionModel | None:
+        """Pick a random row by seeking to a random point on random_key.
+
+        Each probe is an index range scan of at most _RANDOM_PROBE_BATCH rows
+        starting at a uniform random key (wrapping to the start of the range),
+        with seen IDs skipped in Python instead of an ever-growing NOT IN.
+        Only when every probe lands on seen rows does it walk the remaining
+        key range in batches to tell "mostly seen" apart from "all seen".
+        Read-only: keys are never re-rolled.
+        """
+        seen = set(seen_ids or [])
         with session_scope() as session:
-            query = select(QuestionRecord)
-            query = _apply_question_filters(query, filters)
-            if seen_ids:
-                query = query.where(~QuestionRecord.question_id.in_(seen_ids))
-            query = query.order_by(func.random()).limit(1)
-            record = session.execute(query).scalars().first()
-            return _question_from_record(record) if record else None
+            base = _apply_question_filters(select(QuestionRecord), filters)
+            record = None
+            for _ in range(_RANDOM_PROBES):
+                record = _probe_random(session, base, _random.random(), seen)
+                if record is not None:
+                    break
+            if record is None and seen:
+                record = _scan_unseen(session, base, seen)
+            if record is None:
+                return None
+            return _question_from_record(record)
 
 
 class PostgresUserStore(UserStore):
@@ -515,6 +738,7 @@ class PostgresUserStore(UserStore):
             if not record:
                 return None
 
+            updates = _validated_updates(_user_from_record(record), updates)
             for key, value in updates.items():
                 if hasattr(record, key):
                     setattr(record, key, value)
@@ -567,7 +791,7 @@ class PostgresUserStore(UserStore):
 # ---------------------------------------------------------------------------
 
 def _event_from_record(record: EventRecord) -> EventModel:
-    return EventModel(
+    return EventModel.model_construct(
         event_id=record.event_id,
         slug=record.slug or "",
         name=record.name,
@@ -587,7 +811,7 @@ def _event_from_record(record: EventRecord) -> EventModel:
 
 
 def _replay_from_record(record: ReplayRecord) -> ReplayAttemptModel:
-    return ReplayAttemptModel(
+    return ReplayAttemptModel.model_construct(
         replay_id=record.replay_id,
         event_id=record.event_id,
         user_id=record.user_id,
@@ -673,6 +897,7 @@ class PostgresEventStore(EventStore):
             record = session.get(EventRecord, event_id)
             if not record:
                 return None
+            updates = _validated_updates(_event_from_record(record), updates)
             for key, value in updates.items():
                 if hasattr(record, key):
                     setattr(record, key, value)
@@ -773,13 +998,55 @@ class PostgresReplayStore(ReplayStore):
             session.delete(record)
             return True
 
+    def save_attempt_result(
+        self, attempt_id: str, event_id: str, question_id: str, result_key: str, result: dict
+    ) -> bool:
+        query = pg_insert(ReplayAttemptResultRecord).values(
+            attempt_id=attempt_id,
+            question_id=question_id,
+            result_key=result_key,
+            event_id=event_id,
+            result=result,
+            created_at=_utcnow(),
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["attempt_id", "question_id"],
+            set_={
+                "result_key": query.excluded.result_key,
+                "result": query.excluded.result,
+                "created_at": query.excluded.created_at,
+            },
+        )
+        with session_scope(commit=True) as session:
+            return session.execute(query).rowcount > 0
+
+    def get_attempt_results(self, attempt_id: str, event_id: str) -> dict[str, dict]:
+        query = select(ReplayAttemptResultRecord.result_key, ReplayAttemptResultRecord.result).where(
+            ReplayAttemptResultRecord.attempt_id == attempt_id,
+            ReplayAttemptResultRecord.event_id == event_id,
+        )
+        with session_scope() as session:
+            rows = session.execute(query).all()
+        return {row[0]: row[1] for row in rows}
+
+    def delete_attempt_results(self, attempt_id: str) -> int:
+        with session_scope(commit=True) as session:
+            return session.execute(
+                delete(ReplayAttemptResultRecord).where(ReplayAttemptResultRecord.attempt_id == attempt_id)
+            ).rowcount
+
+    def delete_idle_attempt_results(self, before: datetime) -> int:
+        with session_scope(commit=True) as session:
+            query = delete(ReplayAttemptResultRecord).where(ReplayAttemptResultRecord.created_at < before)
+            return session.execute(query).rowcount or 0
+
 
 # ---------------------------------------------------------------------------
 # Live session helpers
 # ---------------------------------------------------------------------------
 
 def _live_session_from_record(record: LiveSessionRecord) -> LiveSessionModel:
-    return LiveSessionModel(
+    return LiveSessionModel.model_construct(
         session_id=record.session_id,
         event_id=record.event_id,
         join_code=record.join_code,
@@ -788,6 +1055,8 @@ def _live_session_from_record(record: LiveSessionRecord) -> LiveSessionModel:
         locked_indices=list(record.locked_indices or []),
         show_questions_on_devices=record.show_questions_on_devices,
         status=record.status,
+        version=record.version or 0,
+        answers_version=record.answers_version or 0,
         created_by=record.created_by,
         created_at=record.created_at,
         updated_at=record.updated_at,
@@ -795,17 +1064,18 @@ def _live_session_from_record(record: LiveSessionRecord) -> LiveSessionModel:
 
 
 def _live_participant_from_record(record: LiveParticipantRecord) -> LiveParticipantModel:
-    return LiveParticipantModel(
+    return LiveParticipantModel.model_construct(
         participant_id=record.participant_id,
         session_id=record.session_id,
         display_name=record.display_name,
         user_id=record.user_id,
+        score=record.score or 0,
         joined_at=record.joined_at,
     )
 
 
 def _live_answer_from_record(record: LiveAnswerRecord) -> LiveAnswerModel:
-    return LiveAnswerModel(
+    return LiveAnswerModel.model_construct(
         answer_id=record.answer_id,
         session_id=record.session_id,
         participant_id=record.participant_id,
@@ -816,6 +1086,7 @@ def _live_answer_from_record(record: LiveAnswerRecord) -> LiveAnswerModel:
         max_points=record.max_points,
         is_correct=record.is_correct,
         explanation=record.explanation,
+        speculative_result=record.speculative_result,
         submitted_at=record.submitted_at,
     )
 
@@ -824,6 +1095,30 @@ def _live_answer_from_record(record: LiveAnswerRecord) -> LiveAnswerModel:
 # PostgresLiveStore
 # ---------------------------------------------------------------------------
 
+_LEADERBOARD_ORDER = (
+    LiveParticipantRecord.score.desc(),
+    LiveParticipantRecord.joined_at,
+    LiveParticipantRecord.participant_id,
+)
+
+
+def _refresh_scores(session, session_id: str, participant_ids) -> int:
+    """Set score = sum(points_awarded) for the given participants (a list or a
+    subquery of IDs; None means the whole session) in the caller's transaction."""
+    total = (
+        select(func.coalesce(func.sum(LiveAnswerRecord.points_awarded), 0))
+        .where(
+            LiveAnswerRecord.session_id == session_id,
+            LiveAnswerRecord.participant_id == LiveParticipantRecord.participant_id,
+        )
+        .scalar_subquery()
+    )
+    query = update(LiveParticipantRecord).where(LiveParticipantRecord.session_id == session_id)
+    if participant_ids is not None:
+        query = query.where(LiveParticipantRecord.participant_id.in_(participant_ids))
+    return session.execute(query.values(score=total)).rowcount or 0
+
+
 class PostgresLiveStore(LiveStore):
     def create_session(self, live_session: LiveSessionModel) -> bool:
         record = LiveSessionRecord(
@@ -835,6 +1130,8 @@ class PostgresLiveStore(LiveStore):
             locked_indices=list(live_session.locked_indices or []),
             show_questions_on_devices=live_session.show_questions_on_devices,
             status=live_session.status,
+            version=live_session.version,
+            answers_version=live_session.answers_version,
             created_by=live_session.created_by,
             created_at=live_session.created_at,
             updated_at=live_session.updated_at,
@@ -870,19 +1167,51 @@ class PostgresLiveStore(LiveStore):
             record = session.get(LiveSessionRecord, session_id)
             if not record:
                 return None
+            updates = _validated_updates(_live_session_from_record(record), updates)
             for key, value in updates.items():
                 if hasattr(record, key):
                     setattr(record, key, value)
+            record.version = (record.version or 0) + 1
             record.updated_at = _utcnow()
             session.add(record)
             return _live_session_from_record(record)
 
+    def get_session_versions(self, session_id: str) -> tuple[int, int] | None:
+        with session_scope() as session:
+            query = (
+                select(LiveSessionRecord.version, LiveSessionRecord.answers_version)
+                .where(LiveSessionRecord.session_id == session_id)
+            )
+            row = session.execute(query).first()
+            return (row[0], row[1]) if row else None
+
+    def bump_session_version(self, session_id: str) -> int | None:
+        with session_scope(commit=True) as session:
+            query = (
+                update(LiveSessionRecord)
+                .where(LiveSessionRecord.session_id == session_id)
+                .values(version=LiveSessionRecord.version + 1)
+                .returning(LiveSessionRecord.version)
+            )
+            return session.execute(query).scalar_one_or_none()
+
+    def bump_answers_version(self, session_id: str) -> int | None:
+        with session_scope(commit=True) as session:
+            query = (
+                update(LiveSessionRecord)
+                .where(LiveSessionRecord.session_id == session_id)
+                .values(answers_version=LiveSessionRecord.answers_version + 1)
+                .returning(LiveSessionRecord.answers_version)
+            )
+            return session.execute(query).scalar_one_or_none()
+
     def add_participant(self, participant: LiveParticipantModel) -> bool:
         record = LiveParticipantRecord(
             participant_id=participant.participant_id,
             session_id=participant.session_id,
             display_name=participant.display_name,
             user_id=participant.user_id,
+            score=participant.score,
             joined_at=participant.joined_at,
         )
         with session_scope() as session:
@@ -904,6 +1233,42 @@ class PostgresLiveStore(LiveStore):
             records = session.execute(query).scalars().all()
             return [_live_participant_from_record(r) for r in records]
 
+    def get_leaderboard(
+        self, session_id: str, limit: int | None = None
+    ) -> list[LiveParticipantModel]:
+        with session_scope() as session:
+            query = (
+                select(LiveParticipantRecord)
+                .where(LiveParticipantRecord.session_id == session_id)
+                .order_by(*_LEADERBOARD_ORDER)
+            )
+            if limit is not None:
+                query = query.limit(limit)
+            records = session.execute(query).scalars().all()
+            return [_live_participant_from_record(r) for r in records]
+
+    def get_participant_rank(self, session_id: str, participant_id: str) -> int | None:
+        with session_scope() as session:
+            me = session.get(LiveParticipantRecord, participant_id)
+            if not me or me.session_id != session_id:
+                return None
+            # Rows strictly ahead of us in leaderboard order, counted on the
+            # (session_id, score, joined_at) index.
+            ahead = or_(
+                LiveParticipantRecord.score > me.score,
+                and_(
+                    LiveParticipantRecord.score == me.score,
+                    tuple_(LiveParticipantRecord.joined_at, LiveParticipantRecord.participant_id)
+                    < tuple_(me.joined_at, me.participant_id),
+                ),
+            )
+            query = select(func.count()).where(LiveParticipantRecord.session_id == session_id, ahead)
+            return (session.execute(query).scalar() or 0) + 1
+
+    def refresh_scores(self, session_id: str, participant_ids: list[str] | None = None) -> int:
+        with session_scope(commit=True) as session:
+            return _refresh_scores(session, session_id, participant_ids)
+
     def get_participant(self, participant_id: str) -> LiveParticipantModel | None:
         with session_scope() as session:
             record = session.get(LiveParticipantRecord, participant_id)
@@ -919,6 +1284,8 @@ class PostgresLiveStore(LiveStore):
             )
             existing = session.execute(query).scalar_one_or_none()
             if existing:
+                if existing.answer_text != answer.answer_text:
+                    existing.speculative_result = None
                 existing.answer_text = answer.answer_text
                 existing.submitted_at = answer.submitted_at
                 session.add(existing)
@@ -982,29 +1349,186 @@ class PostgresLiveStore(LiveStore):
     def update_answers_bulk(
         self, session_id: str, question_index: int, updates: dict
     ) -> int:
+        columns = LiveAnswerRecord.__table__.columns
+        changes = {key: value for key, value in updates.items() if key in columns}
+        if not changes:
+            return 0
+        query = (
+            update(LiveAnswerRecord)
+            .where(
+                LiveAnswerRecord.session_id == session_id,
+                LiveAnswerRecord.question_index == question_index,
+            )
+            .values(**changes)
+        )
         with session_scope(commit=True) as session:
-            query = (
-                select(LiveAnswerRecord)
-                .where(
-                    LiveAnswerRecord.session_id == session_id,
-                    LiveAnswerRecord.question_index == question_index,
-                )
+            return session.execute(query).rowcount or 0
+
+    def save_speculative_result(
+        self,
+        session_id: str,
+        participant_id: str,
+        question_index: int,
+        answer_text: str,
+        result: dict,
+    ) -> bool:
+        query = (
+            update(LiveAnswerRecord)
+            .where(
+                LiveAnswerRecord.session_id == session_id,
+                LiveAnswerRecord.participant_id == participant_id,
+                LiveAnswerRecord.question_index == question_index,
+                LiveAnswerRecord.answer_text == answer_text,
+                LiveAnswerRecord.points_awarded.is_(None),
             )
-            records = session.execute(query).scalars().all()
-            for record in records:
-                for key, value in updates.items():
-                    if hasattr(record, key):
-                        setattr(record, key, value)
-                session.add(record)
-            return len(records)
+            .values(speculative_result=result)
+        )
+        with session_scope(commit=True) as session:
+            return bool(session.execute(query).rowcount)
+
+    def apply_evaluations(
+        self, session_id: str, question_index: int, results: dict[str, dict]
+    ) -> int:
+        if not results:
+            return 0
+        rows = values(
+            column("answer_id", String),
+            column("points_awarded", Float),
+            column("max_points", Float),
+            column("is_correct", Boolean),
+            column("explanation", Text),
+            name="results",
+        ).data([
+            (
+                answer_id,
+                result.get("points_awarded"),
+                result.get("max_points"),
+                result.get("is_correct"),
+                result.get("explanation"),
+            )
+            for answer_id, result in results.items()
+        ])
+        # A VALUES column that is NULL in every row is typed as text, so cast
+        # back to the target column types.
+        query = (
+            update(LiveAnswerRecord)
+            .where(
+                LiveAnswerRecord.answer_id == rows.c.answer_id,
+                LiveAnswerRecord.session_id == session_id,
+                LiveAnswerRecord.question_index == question_index,
+            )
+            .values(
+                points_awarded=cast(rows.c.points_awarded, Float),
+                max_points=cast(rows.c.max_points, Float),
+                is_correct=cast(rows.c.is_correct, Boolean),
+                explanation=cast(rows.c.explanation, Text),
+            )
+        )
+        with session_scope(commit=True) as session:
+            updated = session.execute(query).rowcount or 0
+            affected = select(LiveAnswerRecord.participant_id).where(
+                LiveAnswerRecord.answer_id.in_(list(results))
+            )
+            _refresh_scores(session, session_id, affected)
+            return updated
 
     def update_answer(self, answer_id: str, updates: dict) -> LiveAnswerModel | None:
         with session_scope(commit=True) as session:
             record = session.get(LiveAnswerRecord, answer_id)
             if not record:
                 return None
+            updates = _validated_updates(_live_answer_from_record(record), updates)
             for key, value in updates.items():
                 if hasattr(record, key):
                     setattr(record, key, value)
             session.add(record)
             return _live_answer_from_record(record)
+
+
+class PostgresDeckStore(DeckStore):
+    def create(self, deck: PlayDeckModel) -> bool:
+        record = PlayDeckRecord(
+            deck_id=deck.deck_id,
+            filters=dict(deck.filters or {}),
+            question_ids=list(deck.question_ids),
+            created_at=deck.created_at,
+            last_used_at=deck.last_used_at,
+        )
+        with session_scope() as session:
+            session.add(record)
+            try:
+                session.commit()
+                return True
+            except IntegrityError:
+                session.rollback()
+                return False
+
+    def draw(
+        self, deck_id: str, cursor: int, count: int, active_since: datetime
+    ) -> tuple[list[str], int] | None:
+        # One primary-key UPDATE both refreshes the idle timer and returns
+        # just the requested slice (Postgres arrays are 1-based, inclusive).
+        with session_scope(commit=True) as session:
+            query = (
+                update(PlayDeckRecord)
+                .where(
+                    PlayDeckRecord.deck_id == deck_id,
+                    PlayDeckRecord.last_used_at >= active_since,
+                )
+                .values(last_used_at=_utcnow())
+                .returning(
+                    PlayDeckRecord.question_ids[cursor + 1:cursor + count],
+                    func.cardinality(PlayDeckRecord.question_ids),
+                )
+            )
+            row = session.execute(query).first()
+            if row is None:
+                return None
+            return list(row[0] or []), row[1] or 0
+
+    def delete(self, deck_id: str) -> bool:
+        with session_scope(commit=True) as session:
+            query = delete(PlayDeckRecord).where(PlayDeckRecord.deck_id == deck_id)
+            return bool(session.execute(query).rowcount)
+
+    def delete_idle(self, before: datetime) -> int:
+        with session_scope(commit=True) as session:
+            query = delete(PlayDeckRecord).where(PlayDeckRecord.last_used_at < before)
+            return session.execute(query).rowcount or 0
+
+
+class PostgresEvalCacheStore(EvalCacheStore):
+    def get_many(self, keys: list[tuple[str, str, int]]) -> dict[tuple[str, str, int], dict]:
+        if not keys:
+            return {}
+        key_columns = (EvalCacheRecord.question_hash, EvalCacheRecord.answer_norm, EvalCacheRecord.max_points)
+        query = select(*key_columns, EvalCacheRecord.result).where(tuple_(*key_columns).in_(keys))
+        with session_scope() as session:
+            rows = session.execute(query).all()
+        return {(row[0], row[1], row[2]): row[3] for row in rows}
+
+    def put_many(self, entries: dict[tuple[str, str, int], dict]) -> int:
+        if not entries:
+            return 0
+        query = pg_insert(EvalCacheRecord).values([
+            {
+                "question_hash": question_hash,
+                "answer_norm": answer_norm,
+                "max_points": max_points,
+                "result": result,
+                "created_at": _utcnow(),
+            }
+            for (question_hash, answer_norm, max_points), result in entries.items()
+        ])
+        query = query.on_conflict_do_update(
+            index_elements=["question_hash", "answer_norm", "max_points"],
+            set_={"result": query.excluded.result, "created_at": query.excluded.created_at},
+        )
+        with session_scope(commit=True) as session:
+            return session.execute(query).rowcount
+
+    def delete_question(self, question_hash: str) -> int:
+        with session_scope(commit=True) as session:
+            return session.execute(
+                delete(EvalCacheRecord).where(EvalCacheRecord.question_hash == question_hash)
+            ).rowcount
@@ -1,13 +1,48 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from difflib import SequenceMatcher
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING
+import hashlib
 import json
 import logging
+import queue
 import re
 import string
+import threading
+import time
+
+from backend.utils.phonetics import folded_forms, phonetic_key
+from backend.utils import similarity
+from backend.utils.quantities import (
+    Quantity,
+    Tolerance,
+    parse_quantity,
+    parse_tolerance,
+    partial_date_match,
+    quantities_match,
+)
+
+if TYPE_CHECKING:
+    from backend.storage.base import EvalCacheStore
 
 logger = logging.getLogger(__name__)
 
+# Appended to the simple result's explanation when the LLM fallback fails or
+# is skipped because the circuit breaker is open.
+LLM_FALLBACK_NOTE = "(LLM fallback: call failed)"
+LLM_SKIPPED_NOTE = "(LLM fallback: unavailable)"
+
+
+def is_fallback_result(result: EvalResult | None) -> bool:
+    """True if the LLM should have weighed in but didn't; such results are not cached."""
+    explanation = (result.explanation or "") if result is not None else ""
+    return explanation.endswith(LLM_FALLBACK_NOTE) or explanation.endswith(LLM_SKIPPED_NOTE)
+
 
 @dataclass
 class EvalResult:
@@ -16,59 +51,343 @@ class EvalResult:
     explanation: str | None = None
     points_awarded: int = 0
     max_points: int = 1
+    # Set when the result is certain (e.g. a numeric comparison); no LLM second opinion
+    decisive: bool = False
+    # Set on a plausible match the LLM should confirm (e.g. one listed option of a
+    # multi-point answer); without an LLM the simple result stands
+    tentative: bool = False
+
+
+# (question, correct_answer, user_answer, max_points[, language])
+EvalItem = tuple[str, str, str, int] | tuple[str, str, str, int, str | None]
 
 
 class AnswerEvaluator(ABC):
     @abstractmethod
-    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1) -> EvalResult:
+    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1,
+                 language: str | None = None) -> EvalResult:
         raise NotImplementedError
 
-    def evaluate_batch(self, items: list[tuple[str, str, str, int]]) -> list[EvalResult]:
-        """Evaluate multiple (question, correct_answer, user_answer, max_points) tuples.
+    def evaluate_batch(self, items: list[EvalItem]) -> list[EvalResult]:
+        """Evaluate multiple (question, correct_answer, user_answer, max_points[, language]) tuples.
         Default implementation calls evaluate() in a loop; subclasses may override for efficiency.
         """
-        return [self.evaluate(q, ca, ua, mp) for q, ca, ua, mp in items]
+        return [self.evaluate(*item) for item in items]
+
+    def stats(self) -> dict:
+        """Counters for /health; evaluators without any report nothing."""
+        return {}
+
+
+_PUNCTUATION_RE = re.compile(r"[" + re.escape(string.punctuation) + r"]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# "A / B", "A; B", "A | B"; a slash or bar needs spaces around it, so "AC/DC"
+# and "Either/Or" stay whole
+_ALTERNATIVE_SEPARATORS = re.compile(r"\s*;\s*|\s+[/|]\s+")
+# "or" only lists options in "A, B or C" of single words or between quantities
+# ("3 or 4"), so titles like "Tom or Jerry" or "The Good, the Bad or the Ugly"
+# stay whole; "Paris, France" and "1,969" too
+_LIST_SEPARATORS = re.compile(r"\s*,\s+|\s+or\s+", re.IGNORECASE)
+_OR_RE = re.compile(r"\s+or\s+", re.IGNORECASE)
+# Punctuation that changes what a number means: "3.14", "-40", "1/2", "$5", "40%"
+_NUMERIC_PUNCTUATION_RE = re.compile(r"(?<=\d)[.,:/-](?=\d)|[-+$](?=\d)|(?<=\d)%")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@dataclass(frozen=True)
+class AnswerAlternative:
+    text: str
+    normalized: str
+    tokens: frozenset[str]
+    sorted_tokens: str
+    quantity: Quantity | None
+    folded: frozenset[str]  # accent-folded / transliterated normalized forms
+    phonetic: tuple[str, ...] | None  # per-word phonetic keys, if the language has them
+    numbers: tuple[str, ...]  # digit runs, sorted ("apollo 11" -> ("11",), "h2o2" -> ("2", "2"))
+    # One option of an "A, B or C" list, which may still be a title ("Earth, Wind or Fire")
+    or_listed: bool = False
+
+
+@dataclass(frozen=True)
+class AnswerIndex:
+    """A reference answer parsed once into its accepted alternatives.
+
+    The whole reference is always the first alternative, followed by the
+    options it lists ("Lennon, McCartney, Harrison or Starr", "USA / United
+    States").
+    """
+
+    alternatives: tuple[AnswerAlternative, ...]
+    tolerance: Tolerance | None
+    language: str | None = None
+
+    @property
+    def whole(self) -> AnswerAlternative:
+        return self.alternatives[0]
+
+
+def _normalize_text(text: str) -> str:
+    text = _PUNCTUATION_RE.sub("", text.strip().lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def answer_key(text: str) -> str:
+    """Normalized answer for cache, dedup and replay result keys.
+
+    Like SimpleEvaluator's normalization, except that signs, decimal points
+    and other punctuation inside numbers are kept: "3.14" and "314", or "-40"
+    and "40", are graded differently and must never share a key.
+    """
+    text = text.strip().lower()
+    parts = []
+    last = 0
+    for match in _NUMERIC_PUNCTUATION_RE.finditer(text):
+        parts.append(_PUNCTUATION_RE.sub("", text[last:match.start()]))
+        parts.append(match.group())
+        last = match.end()
+    parts.append(_PUNCTUATION_RE.sub("", text[last:]))
+    return _WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+
+
+def _folded_normalized(text: str, language: str | None) -> frozenset[str]:
+    return frozenset(filter(None, (_normalize_text(form) for form in folded_forms(text, language))))
+
+
+def _phonetic_keys(normalized: str, language: str | None) -> tuple[str, ...] | None:
+    if not normalized:
+        return None
+    keys = tuple(phonetic_key(word, language) for word in normalized.split())
+    return keys if all(keys) else None
+
+
+def _numbers(normalized: str) -> tuple[str, ...]:
+    return tuple(sorted(run.lstrip("0") or "0" for run in _DIGITS_RE.findall(normalized)))
+
+
+def _numbers_differ(reference: tuple[str, ...], answer: tuple[str, ...]) -> bool:
+    """True if both sides name numbers and they are not the same ones.
+
+    One edit apart is a high similarity for "Apollo 11"/"Apollo 12" or
+    "H2O"/"H2O2", but a different number is a different answer.
+    """
+    return bool(reference) and bool(answer) and reference != answer
+
+
+def _list_options(text: str) -> list[str]:
+    """Split "A, B or C" (single words only) and "3 or 4" into options; anything else stays whole."""
+    if not _OR_RE.search(text):
+        return [text]
+    options = [option.strip() for option in _LIST_SEPARATORS.split(text)]
+    if all(parse_quantity(option) is not None for option in options):
+        return options
+    if "," in text and len(options) > 2 and all(len(option.split()) == 1 for option in options):
+        return options
+    return [text]
+
+
+@lru_cache(maxsize=4096)
+def answer_index(correct_answer: str, language: str | None = None) -> AnswerIndex:
+    """Parse (and memoise) a reference answer; keyed by its text, so edits re-index."""
+    reference_text, tolerance = parse_tolerance(correct_answer)
+    texts = [reference_text]
+    parts = []
+    or_listed = set()
+    for part in _ALTERNATIVE_SEPARATORS.split(reference_text):
+        options = _list_options(part.strip())
+        if len(options) > 1:
+            or_listed.update(options)
+        parts.extend(options)
+    if len(parts) > 1:
+        texts.extend(part for part in parts if part)
+
+    alternatives = []
+    seen = set()
+    for text in texts:
+        normalized = _normalize_text(text)
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        alternatives.append(AnswerAlternative(
+            text=text,
+            normalized=normalized,
+            tokens=frozenset(normalized.split()),
+            sorted_tokens=similarity.sort_tokens(normalized),
+            quantity=parse_quantity(text),
+            folded=_folded_normalized(text, language),
+            phonetic=_phonetic_keys(normalized, language),
+            numbers=_numbers(normalized),
+            or_listed=text in or_listed,
+        ))
+    if not alternatives:
+        alternatives.append(AnswerAlternative(text=reference_text, normalized="", tokens=frozenset(), sorted_tokens="", quantity=None,
+                                              folded=frozenset(), phonetic=None, numbers=()))
+    return AnswerIndex(alternatives=tuple(alternatives), tolerance=tolerance, language=language)
 
 
 class SimpleEvaluator(AnswerEvaluator):
+    """Exact, word-order, fuzzy and then accent/phonetic matching; no network.
+
+    ``phonetic_matching=False`` turns off the accent-folding and phonetic tier
+    (e.g. to measure how many answers it keeps away from the LLM).
+    """
+
     FUZZY_THRESHOLD = 0.85
+    # A phonetic key match must still look roughly like the reference. Even
+    # then "Niger"/"Nigeria" pass, so such a match is only tentative
+    PHONETIC_MIN_RATIO = 0.5
+    PHONETIC_CONFIDENCE = 0.8
+    # Fuzzy matching never bridges different numbers; the LLM may still disagree
+    NUMBER_MISMATCH_CONFIDENCE = 0.9
+
+    def __init__(self, phonetic_matching: bool = True):
+        self._phonetic_matching = phonetic_matching
 
-    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1) -> EvalResult:
-        norm_correct = self._normalize(correct_answer)
+    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1,
+                 language: str | None = None) -> EvalResult:
         norm_user = self._normalize(user_answer)
 
         if not norm_user:
             return EvalResult(is_correct=False, confidence=1.0, explanation="No answer provided",
                               points_awarded=0, max_points=max_points)
 
-        if norm_correct == norm_user:
-            return EvalResult(is_correct=True, confidence=1.0, explanation="Exact match",
-                              points_awarded=max_points, max_points=max_points)
+        index = answer_index(correct_answer, language)
+        typed = self._evaluate_typed(index, user_answer, max_points)
+        if typed is not None:
+            return typed
 
-        ratio = SequenceMatcher(None, norm_correct, norm_user).ratio()
-        if ratio >= self.FUZZY_THRESHOLD:
-            return EvalResult(
-                is_correct=True,
-                confidence=round(ratio, 3),
-                explanation=f"Fuzzy match ({ratio:.0%} similarity)",
-                points_awarded=max_points,
-                max_points=max_points,
-            )
+        user_tokens = None
+        user_sorted = None
+        user_numbers = _numbers(norm_user)
+        numbers_differ = False
+        best_ratio = 0.0
+        best: AnswerAlternative | None = None
+        reordered = False
+        for alternative in index.alternatives:
+            if alternative.normalized == norm_user:
+                return self._match(alternative, index, "Exact match", 1.0, max_points)
+            if user_tokens is None:
+                user_tokens = frozenset(norm_user.split())
+            if len(alternative.tokens) > 1 and alternative.tokens == user_tokens:
+                return self._match(alternative, index, "Exact match (word order)", 1.0, max_points)
+            if _numbers_differ(alternative.numbers, user_numbers):
+                numbers_differ = True
+                continue
+            # Only scores that can still win matter, so the ratio may stop early
+            cutoff = max(self.FUZZY_THRESHOLD, best_ratio)
+            ratio = similarity.ratio(alternative.normalized, norm_user, cutoff)
+            if ratio > best_ratio:
+                best_ratio, best, reordered = ratio, alternative, False
+            if len(alternative.tokens) > 1 and len(user_tokens) > 1:
+                if user_sorted is None:
+                    user_sorted = similarity.sort_tokens(norm_user)
+                ratio = similarity.ratio(alternative.sorted_tokens, user_sorted, max(cutoff, best_ratio))
+                if ratio > best_ratio:
+                    best_ratio, best, reordered = ratio, alternative, True
+
+        if best is not None:
+            label = "Fuzzy match (word order, " if reordered else "Fuzzy match ("
+            return self._match(best, index, f"{label}{best_ratio:.0%} similarity)", round(best_ratio, 3), max_points)
 
+        if self._phonetic_matching:
+            folded = self._evaluate_folded(index, user_answer, max_points)
+            if folded is not None:
+                return folded
+
+        if numbers_differ:
+            return EvalResult(is_correct=False, confidence=self.NUMBER_MISMATCH_CONFIDENCE,
+                              explanation="No match (different numbers)", points_awarded=0, max_points=max_points)
+
+        # Scores below the threshold are not computed exactly; the lengths
+        # still bound how similar the answer could have been
+        bound = min(self.FUZZY_THRESHOLD, max(
+            similarity.ratio_bound(alternative.normalized, norm_user) for alternative in index.alternatives
+        ))
         return EvalResult(
             is_correct=False,
-            confidence=round(1.0 - ratio, 3),
-            explanation=f"No match ({ratio:.0%} similarity)",
+            confidence=round(1.0 - bound, 3),
+            explanation=f"No match (below {self.FUZZY_THRESHOLD:.0%} similarity)",
             points_awarded=0,
             max_points=max_points,
         )
 
+    @staticmethod
+    def _match(alternative: AnswerAlternative, index: AnswerIndex, explanation: str,
+               confidence: float, max_points: int) -> EvalResult:
+        listed = alternative is not index.whole
+        if listed:
+            explanation = f"{explanation} with listed option '{alternative.text}'"
+        # One option of a multi-point answer may deserve only partial credit,
+        # and an "A, B or C" list may really be one title
+        return EvalResult(is_correct=True, confidence=confidence, explanation=explanation,
+                          points_awarded=max_points, max_points=max_points,
+                          tentative=listed and (max_points > 1 or alternative.or_listed))
+
+    def _evaluate_folded(self, index: AnswerIndex, user_answer: str, max_points: int) -> EvalResult | None:
+        """Retry after folding accents and transliterating, then by phonetic key."""
+        user_forms = _folded_normalized(user_answer, index.language)
+        user_keys = _phonetic_keys(_normalize_text(user_answer), index.language)
+        user_numbers = _numbers(_normalize_text(user_answer))
+        best_ratio = 0.0
+        best: AnswerAlternative | None = None
+        phonetic: tuple[float, AnswerAlternative] | None = None
+        for alternative in index.alternatives:
+            if alternative.folded & user_forms:
+                return self._match(alternative, index, "Exact match (accents folded)", 1.0, max_points)
+            if _numbers_differ(alternative.numbers, user_numbers):
+                continue
+            ratio = max(
+                (similarity.ratio(reference, answer, self.PHONETIC_MIN_RATIO)
+                 for reference in alternative.folded for answer in user_forms),
+                default=0.0,
+            )
+            if ratio > best_ratio:
+                best_ratio, best = ratio, alternative
+            if (user_keys is not None and alternative.phonetic == user_keys
+                    and ratio >= self.PHONETIC_MIN_RATIO and (phonetic is None or ratio > phonetic[0])):
+                phonetic = (ratio, alternative)
+
+        if best is not None and best_ratio >= self.FUZZY_THRESHOLD:
+            return self._match(best, index, f"Fuzzy match (accents folded, {best_ratio:.0%} similarity)",
+                               round(best_ratio, 3), max_points)
+        if phonetic is not None:
+            return replace(self._match(phonetic[1], index, "Phonetic match", self.PHONETIC_CONFIDENCE, max_points),
+                           tentative=True)
+        return None
+
+    @staticmethod
+    def _evaluate_typed(index: AnswerIndex, user_answer: str, max_points: int) -> EvalResult | None:
+        """Decide numeric, year and date answers exactly.
+
+        None unless the user answer and the reference (or every option it
+        lists) are quantities. A correct but less precise date ("1969" for
+        "July 20, 1969") is a tentative miss for the LLM to judge.
+        """
+        quantities = [alternative.quantity for alternative in index.alternatives]
+        if quantities[0] is not None:
+            candidates = quantities[:1]
+        elif len(quantities) > 1 and all(quantity is not None for quantity in quantities[1:]):
+            candidates = quantities[1:]
+        else:
+            return None
+        answer = parse_quantity(user_answer)
+        if answer is None:
+            return None
+        correct = any(quantities_match(reference, answer, index.tolerance) for reference in candidates)
+        if not correct and any(partial_date_match(reference, answer) for reference in candidates):
+            return EvalResult(is_correct=False, confidence=0.5, explanation="Date incomplete",
+                              points_awarded=0, max_points=max_points, tentative=True)
+        return EvalResult(
+            is_correct=correct,
+            confidence=1.0,
+            explanation=f"{candidates[0].kind.capitalize()} {'match' if correct else 'mismatch'}",
+            points_awarded=max_points if correct else 0,
+            max_points=max_points,
+            decisive=True,
+        )
+
     @staticmethod
     def _normalize(text: str) -> str:
-        text = text.strip().lower()
-        text = re.sub(r"[" + re.escape(string.punctuation) + r"]", "", text)
-        text = re.sub(r"\s+", " ", text)
-        return text
+        return _normalize_text(text)
 
 
 _LLM_SYSTEM_PROMPT = (
@@ -127,54 +446,284 @@ _LLM_SYSTEM_PROMPT_BATCH_MULTIPOINT = (
     '[{"points_awarded": <0 to max_points>, "explanation": "brief reason"}, ...]'
 )
 
+_LLM_SYSTEM_PROMPT_GROUPED = (
+    "You are a trivia quiz answer evaluator. Below are one or more questions, each with its "
+    "reference answer and a numbered list of user answers. Evaluate every numbered answer "
+    "against the question it is listed under.\n\n"
+    "Be lenient like a fair quizmaster:\n"
+    "- Accept answers that show the user knew the correct answer, even with different formulations or minor typos\n"
+    "- Accept alternative phrasings and synonyms\n"
+    "- If the reference answer lists multiple options, accept any single valid option\n"
+    "- Accept common abbreviations and title variations (Prof./Professor, Dr./Doctor)\n"
+    "- However, if the question requires a precise detail (e.g. a first name), require it\n"
+    "- Accept answers that provide one of multiple correct options\n\n"
+    "Respond with ONLY a raw JSON array with one object per numbered answer, in numeric order. "
+    "No markdown, no code fences:\n"
+    '[{"correct": true, "explanation": "brief reason"}, ...]'
+)
+
+_LLM_SYSTEM_PROMPT_GROUPED_MULTIPOINT = (
+    "You are a trivia quiz answer evaluator. Below are one or more questions, each with its "
+    "reference answer, maximum points and a numbered list of user answers. Evaluate every "
+    "numbered answer against the question it is listed under, awarding partial credit when "
+    "the user got part of the answer right.\n\n"
+    "Be lenient like a fair quizmaster:\n"
+    "- Accept alternative phrasings, synonyms, and minor typos\n"
+    "- Accept common abbreviations and title variations\n"
+    "- However, if the question requires a precise detail, require it\n\n"
+    "Respond with ONLY a raw JSON array with one object per numbered answer, in numeric order. "
+    "No markdown, no code fences:\n"
+    '[{"points_awarded": <0 to max_points>, "explanation": "brief reason"}, ...]'
+)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class LLMBusyError(RuntimeError):
+    """Every request slot stayed taken for the whole request timeout."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for the LLM API.
+
+    ``failure_threshold`` failures or slow calls in a row open the circuit;
+    after ``reset_seconds`` a single half-open probe is let through, and its
+    outcome closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0, slow_call_seconds: float = 8.0):
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._slow_call_seconds = slow_call_seconds
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._trips = 0
+
+    def available(self) -> bool:
+        """Whether a call could currently go through (does not claim the probe)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN:
+                return not self._probe_in_flight
+            return time.monotonic() - self._opened_at >= self._reset_seconds
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self._reset_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self, duration: float) -> None:
+        if duration > self._slow_call_seconds:
+            logger.warning("LLM call took %.1fs (slow threshold %.1fs)", duration, self._slow_call_seconds)
+            self.record_failure()
+            return
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("LLM circuit breaker closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    self._trips += 1
+                    logger.warning("LLM circuit breaker opened after %d failure(s)", self._failures)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = {"state": self._state, "consecutive_failures": self._failures, "trips": self._trips}
+            if self._state == self.OPEN:
+                remaining = self._reset_seconds - (time.monotonic() - self._opened_at)
+                snapshot["retry_in_seconds"] = round(max(0.0, remaining), 1)
+            return snapshot
+
 
 class LLMEvaluator(AnswerEvaluator):
-    """Evaluates answers using an LLM (Claude API) for semantic understanding."""
+    """Evaluates answers using an LLM (Claude API) for semantic understanding.
+
+    Batches are split into chunks of ``chunk_size`` answers that run
+    concurrently on one pool shared by all callers within a latency budget of
+    ``deadline_seconds``. At most ``max_concurrency`` requests are in flight per
+    evaluator, whichever path (batch, single answer, dispatcher) they come from. A chunk whose request fails is retried once while
+    time remains; chunks that still fail or miss the deadline come back as
+    ``None`` so the caller can fall back for just those answers. Every request
+    is capped at ``timeout_seconds`` and goes through a CircuitBreaker.
+    ``client`` replaces the Anthropic client (e.g. a local fake for benchmarks).
+    """
+
+    CHUNK_RETRIES = 1
 
-    def __init__(self, api_key: str, model: str = "claude-haiku-4-5-20251001"):
-        import anthropic
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-haiku-4-5-20251001",
+        chunk_size: int = 25,
+        max_concurrency: int = 4,
+        deadline_seconds: float = 20.0,
+        timeout_seconds: float = 10.0,
+        breaker: CircuitBreaker | None = None,
+        client=None,
+    ):
+        if client is None:
+            import anthropic
 
-        self._client = anthropic.Anthropic(api_key=api_key)
+            # No SDK-level retries: chunk retries and the breaker decide instead
+            client = anthropic.Anthropic(api_key=api_key, timeout=timeout_seconds, max_retries=0)
+        self._client = client
         self._model = model
+        self._timeout_seconds = timeout_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self._chunk_size = max(1, chunk_size)
+        self._max_concurrency = max(1, max_concurrency)
+        self._deadline_seconds = deadline_seconds
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._grouped_calls = 0
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._prompt_chars = 0
+        self._flat_prompt_chars = 0
 
-    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1) -> EvalResult:
+    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1,
+                 language: str | None = None) -> EvalResult:
         results = self.evaluate_batch([(question, correct_answer, user_answer, max_points)])
         return results[0]
 
-    def evaluate_batch(self, items: list[tuple[str, str, str, int]]) -> list[EvalResult]:
+    def evaluate_batch(self, items: list[EvalItem]) -> list[EvalResult]:
         if not items:
             return []
+        items = [item[:4] for item in items]  # the prompt does not use the language
 
         if len(items) == 1:
             q, ca, ua, mp = items[0]
             result = self._evaluate_single(q, ca, ua, mp)
             return [result] if result is not None else [None]
 
+        chunks = [items[i:i + self._chunk_size] for i in range(0, len(items), self._chunk_size)]
+        return self._evaluate_chunks(chunks)
+
+    def available(self) -> bool:
+        return self.breaker.available()
+
+    def _create(self, **kwargs):
+        if not self.breaker.available():
+            raise CircuitOpenError("LLM circuit breaker is open")
+        # Waiting for a slot is not the API's fault, so it never trips the
+        # breaker. The half-open probe is only claimed once a slot is held, so a
+        # busy timeout cannot leave it claimed with no outcome recorded.
+        if not self._slots.acquire(timeout=self._timeout_seconds):
+            logger.warning("LLM request skipped: all %d request slots busy", self._max_concurrency)
+            raise LLMBusyError("LLM concurrency limit reached")
+        try:
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM circuit breaker is open")
+            started = time.monotonic()
+            try:
+                response = self._client.messages.create(timeout=self._timeout_seconds, **kwargs)
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success(time.monotonic() - started)
+            return response
+        finally:
+            self._slots.release()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="llm-eval")
+            return self._pool
+
+    def _evaluate_chunks(self, chunks: list[list[tuple[str, str, str, int]]]) -> list[EvalResult | None]:
+        deadline = time.monotonic() + self._deadline_seconds
+        chunk_results: list[list[EvalResult | None] | None] = [None] * len(chunks)
+        pool = self._executor()
+        pending = {pool.submit(self._evaluate_chunk, chunk): (index, 0) for index, chunk in enumerate(chunks)}
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning("LLM batch deadline reached with %d of %d chunks outstanding",
+                                   len(pending), len(chunks))
+                    break
+                for future in done:
+                    index, attempt = pending.pop(future)
+                    results = future.result()
+                    failed = all(result is None for result in results)
+                    if failed and attempt < self.CHUNK_RETRIES and time.monotonic() < deadline:
+                        logger.info("Retrying LLM batch chunk %d (%d answers)", index, len(chunks[index]))
+                        pending[pool.submit(self._evaluate_chunk, chunks[index])] = (index, attempt + 1)
+                    else:
+                        chunk_results[index] = results
+        finally:
+            # Don't let a straggling request hold the caller past the deadline;
+            # chunks still queued behind other callers are dropped
+            for future in pending:
+                future.cancel()
+
+        return [
+            result
+            for chunk, results in zip(chunks, chunk_results)
+            for result in (results if results is not None else [None] * len(chunk))
+        ]
+
+    def _evaluate_chunk(self, items: list[tuple[str, str, str, int]]) -> list[EvalResult | None]:
         # Check if any items are multi-point
         has_multipoint = any(mp > 1 for _, _, _, mp in items)
+        flat_msg = self._flat_prompt(items, has_multipoint)
 
-        if has_multipoint:
-            parts = [
-                f"Answer {i}:\nQuestion: {q}\nReference: {ca}\nMax points: {mp}\nUser: {ua}"
-                for i, (q, ca, ua, mp) in enumerate(items, 1)
-            ]
-            system_prompt = _LLM_SYSTEM_PROMPT_BATCH_MULTIPOINT
-        else:
-            parts = [
-                f"Answer {i}:\nQuestion: {q}\nReference: {ca}\nUser: {ua}"
-                for i, (q, ca, ua, mp) in enumerate(items, 1)
-            ]
-            system_prompt = _LLM_SYSTEM_PROMPT_BATCH
+        # When several answers share a question (always the case on a live
+        # reveal), state each question once and list its answers underneath.
+        groups: dict[tuple[str, str, int], list[int]] = {}
+        for i, (q, ca, _, mp) in enumerate(items):
+            groups.setdefault((q, ca, mp), []).append(i)
 
-        user_msg = "\n\n".join(parts)
+        grouped = len(groups) < len(items)
+        if grouped:
+            user_msg, order = self._grouped_prompt(items, groups, has_multipoint)
+            system_prompt = (
+                _LLM_SYSTEM_PROMPT_GROUPED_MULTIPOINT if has_multipoint else _LLM_SYSTEM_PROMPT_GROUPED
+            )
+        else:
+            user_msg, order = flat_msg, list(range(len(items)))
+            system_prompt = _LLM_SYSTEM_PROMPT_BATCH_MULTIPOINT if has_multipoint else _LLM_SYSTEM_PROMPT_BATCH
 
         try:
-            response = self._client.messages.create(
+            response = self._create(
                 model=self._model,
                 max_tokens=min(80 * len(items), 4096),
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_msg}],
             )
+            self._record_usage(response, user_msg, flat_msg, grouped)
 
             text = response.content[0].text.strip()
             if not text:
@@ -193,11 +742,14 @@ class LLMEvaluator(AnswerEvaluator):
                 )
                 return [None] * len(items)
 
-            results = []
-            for entry, (_, _, _, mp) in zip(parsed, items):
-                results.append(self._parse_llm_entry(entry, mp))
+            # Entries follow the prompt order; map them back to item positions
+            results: list[EvalResult | None] = [None] * len(items)
+            for entry, index in zip(parsed, order):
+                results[index] = self._parse_llm_entry(entry, items[index][3])
             return results
 
+        except (CircuitOpenError, LLMBusyError):
+            return [None] * len(items)
         except (json.JSONDecodeError, KeyError, IndexError) as exc:
             logger.warning("LLM batch evaluator failed to parse response: %s | raw text: %r", exc, locals().get("text", "<not set>"))
             return [None] * len(items)
@@ -205,6 +757,73 @@ class LLMEvaluator(AnswerEvaluator):
             logger.warning("LLM batch evaluator API error: %s", exc, exc_info=True)
             return [None] * len(items)
 
+    @staticmethod
+    def _flat_prompt(items: list[tuple[str, str, str, int]], has_multipoint: bool) -> str:
+        if has_multipoint:
+            parts = [
+                f"Answer {i}:\nQuestion: {q}\nReference: {ca}\nMax points: {mp}\nUser: {ua}"
+                for i, (q, ca, ua, mp) in enumerate(items, 1)
+            ]
+        else:
+            parts = [
+                f"Answer {i}:\nQuestion: {q}\nReference: {ca}\nUser: {ua}"
+                for i, (q, ca, ua, mp) in enumerate(items, 1)
+            ]
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _grouped_prompt(
+        items: list[tuple[str, str, str, int]],
+        groups: dict[tuple[str, str, int], list[int]],
+        has_multipoint: bool,
+    ) -> tuple[str, list[int]]:
+        """Return the prompt and, for each numbered answer in it, the item index."""
+        parts = []
+        order: list[int] = []
+        for group_number, ((q, ca, mp), indices) in enumerate(groups.items(), 1):
+            lines = [f"Question {group_number}: {q}", f"Reference: {ca}"]
+            if has_multipoint:
+                lines.append(f"Max points: {mp}")
+            lines.append("Answers:")
+            for index in indices:
+                order.append(index)
+                lines.append(f"{len(order)}. {items[index][2]}")
+            parts.append("\n".join(lines))
+        return "\n\n".join(parts), order
+
+    def _record_usage(self, response, user_msg: str, flat_msg: str, grouped: bool) -> None:
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", None)
+        output_tokens = getattr(usage, "output_tokens", None)
+        input_tokens = input_tokens if isinstance(input_tokens, int) else 0
+        output_tokens = output_tokens if isinstance(output_tokens, int) else 0
+        with self._stats_lock:
+            self._calls += 1
+            self._grouped_calls += int(grouped)
+            self._input_tokens += input_tokens
+            self._output_tokens += output_tokens
+            self._prompt_chars += len(user_msg)
+            self._flat_prompt_chars += len(flat_msg)
+        logger.info(
+            "LLM batch call: %s prompt, %d chars (flat %d), %d input / %d output tokens",
+            "grouped" if grouped else "flat", len(user_msg), len(flat_msg), input_tokens, output_tokens,
+        )
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "calls": self._calls,
+                "grouped_calls": self._grouped_calls,
+                "input_tokens": self._input_tokens,
+                "output_tokens": self._output_tokens,
+                "prompt_chars": self._prompt_chars,
+                "flat_prompt_chars": self._flat_prompt_chars,
+                "prompt_reduction": (
+                    round(1 - self._prompt_chars / self._flat_prompt_chars, 3) if self._flat_prompt_chars else 0.0
+                ),
+                "breaker": self.breaker.snapshot(),
+            }
+
     def _evaluate_single(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1) -> EvalResult | None:
         if max_points > 1:
             system_prompt = _LLM_SYSTEM_PROMPT_MULTIPOINT.format(max_points=max_points)
@@ -223,7 +842,7 @@ class LLMEvaluator(AnswerEvaluator):
             )
 
         try:
-            response = self._client.messages.create(
+            response = self._create(
                 model=self._model,
                 max_tokens=150,
                 system=system_prompt,
@@ -239,6 +858,8 @@ class LLMEvaluator(AnswerEvaluator):
                 text = re.sub(r"\n?```$", "", text).strip()
             parsed = json.loads(text)
             return self._parse_llm_entry(parsed, max_points)
+        except (CircuitOpenError, LLMBusyError):
+            return None
         except (json.JSONDecodeError, KeyError, IndexError) as exc:
             logger.warning("LLM evaluator failed to parse response: %s | raw text: %r | prompt: %s", exc, locals().get("text", "<not set>"), user_msg)
             return None
@@ -274,13 +895,142 @@ class LLMEvaluator(AnswerEvaluator):
         )
 
 
+class Histogram:
+    """Non-cumulative bucket counts (``le`` upper bounds) plus count and mean."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self._bounds) if value <= bound), len(self._bounds))
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{bound:g}" for bound in self._bounds] + ["inf"]
+            return {
+                "buckets": dict(zip(labels, self._counts)),
+                "count": self._count,
+                "mean": round(self._sum / self._count, 3) if self._count else 0.0,
+            }
+
+
+@dataclass
+class _PendingItem:
+    item: tuple[str, str, str, int]
+    future: Future
+    enqueued_at: float
+
+
+class LLMBatchDispatcher:
+    """Coalesces small LLM evaluations from concurrent callers into shared requests.
+
+    Items wait at most ``window_seconds`` (or until ``max_items`` are queued)
+    before one batched ``LLMEvaluator.evaluate_batch`` call is made for all of
+    them; each caller then receives its own results. Submissions that already
+    fill a batch skip the queue.
+    """
+
+    BATCH_SIZE_BOUNDS = (1, 2, 5, 10, 25, 50, 100)
+    QUEUE_WAIT_MS_BOUNDS = (10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, llm: LLMEvaluator, window_seconds: float = 0.075, max_items: int = 25,
+                 max_concurrency: int = 4, timeout_seconds: float = 20.0):
+        self._llm = llm
+        self._window_seconds = window_seconds
+        self._max_items = max(1, max_items)
+        self._timeout_seconds = timeout_seconds
+        self._queue: queue.Queue[_PendingItem] = queue.Queue()
+        self._senders = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="llm-dispatch")
+        self._collector: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self.batch_sizes = Histogram(self.BATCH_SIZE_BOUNDS)
+        self.queue_wait_ms = Histogram(self.QUEUE_WAIT_MS_BOUNDS)
+
+    def evaluate_batch(self, items: list[tuple[str, str, str, int]]) -> list[EvalResult | None]:
+        if len(items) >= self._max_items:
+            self.batch_sizes.observe(len(items))
+            return self._llm.evaluate_batch(items)
+
+        self._ensure_collector()
+        futures = []
+        for item in items:
+            future: Future = Future()
+            self._queue.put(_PendingItem(item, future, time.monotonic()))
+            futures.append(future)
+
+        deadline = time.monotonic() + self._timeout_seconds
+        results: list[EvalResult | None] = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                results.append(None)
+        return results
+
+    def _ensure_collector(self) -> None:
+        with self._start_lock:
+            if self._collector is None or not self._collector.is_alive():
+                self._collector = threading.Thread(target=self._collect, name="llm-dispatch-collector", daemon=True)
+                self._collector.start()
+
+    def _collect(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            window_ends = batch[0].enqueued_at + self._window_seconds
+            while len(batch) < self._max_items:
+                remaining = window_ends - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._senders.submit(self._send, batch)
+
+    def _send(self, batch: list[_PendingItem]) -> None:
+        started = time.monotonic()
+        for pending in batch:
+            self.queue_wait_ms.observe((started - pending.enqueued_at) * 1000)
+        self.batch_sizes.observe(len(batch))
+        try:
+            results = self._llm.evaluate_batch([pending.item for pending in batch])
+        except Exception as exc:
+            logger.warning("LLM dispatcher batch failed: %s", exc, exc_info=True)
+            results = [None] * len(batch)
+        for pending, result in zip(batch, results):
+            pending.future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+        }
+
+
 class HybridEvaluator(AnswerEvaluator):
-    """Runs SimpleEvaluator first; falls back to LLM for answers marked wrong."""
+    """Runs SimpleEvaluator first; falls back to LLM for answers marked wrong.
 
-    def __init__(self):
-        self._simple = SimpleEvaluator()
-        self._llm: LLMEvaluator | None = None
-        self._llm_init_attempted = False
+    Without an explicit ``llm`` the LLM tier is configured lazily from settings.
+    """
+
+    def __init__(self, simple: SimpleEvaluator | None = None, llm: LLMEvaluator | None = None,
+                 dispatcher: LLMBatchDispatcher | None = None):
+        self._simple = simple or SimpleEvaluator()
+        self._llm = llm
+        self._dispatcher = dispatcher
+        self._llm_init_attempted = llm is not None
+        self._stats_lock = threading.Lock()
+        self._llm_candidates = 0
+        self._llm_unique = 0
 
     def _get_llm(self) -> LLMEvaluator | None:
         if self._llm_init_attempted:
@@ -295,7 +1045,24 @@ class HybridEvaluator(AnswerEvaluator):
                 self._llm = LLMEvaluator(
                     api_key=settings.llm_eval_api_key,
                     model=settings.llm_eval_model,
+                    chunk_size=settings.llm_eval_chunk_size,
+                    max_concurrency=settings.llm_eval_concurrency,
+                    deadline_seconds=settings.llm_eval_deadline_seconds,
+                    timeout_seconds=settings.llm_eval_timeout_seconds,
+                    breaker=CircuitBreaker(
+                        failure_threshold=settings.llm_eval_breaker_failures,
+                        reset_seconds=settings.llm_eval_breaker_reset_seconds,
+                        slow_call_seconds=settings.llm_eval_slow_call_seconds,
+                    ),
                 )
+                if settings.llm_eval_batch_window_ms > 0:
+                    self._dispatcher = LLMBatchDispatcher(
+                        self._llm,
+                        window_seconds=settings.llm_eval_batch_window_ms / 1000,
+                        max_items=settings.llm_eval_batch_max_items,
+                        max_concurrency=settings.llm_eval_concurrency,
+                        timeout_seconds=settings.llm_eval_deadline_seconds,
+                    )
                 logger.info("LLM answer evaluator enabled (model=%s)", settings.llm_eval_model)
             else:
                 logger.debug("LLM answer evaluator disabled")
@@ -303,49 +1070,55 @@ class HybridEvaluator(AnswerEvaluator):
             logger.warning("Failed to initialise LLM evaluator: %s", exc)
         return self._llm
 
-    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1) -> EvalResult:
+    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1,
+                 language: str | None = None) -> EvalResult:
         # Empty answer is always wrong — skip LLM entirely
         if not user_answer or not user_answer.strip():
             return EvalResult(is_correct=False, confidence=1.0, explanation="No answer provided",
                               points_awarded=0, max_points=max_points)
 
-        simple_result = self._simple.evaluate(question, correct_answer, user_answer, max_points)
+        simple_result = self._simple.evaluate(question, correct_answer, user_answer, max_points, language)
 
-        # Simple match succeeded — no need to call the LLM (for 1-point questions)
-        # For multi-point questions, simple can't do partial scoring, so always try LLM
-        if simple_result.is_correct and max_points == 1:
+        # Simple match succeeded — no need to call the LLM unless it wants confirming
+        if simple_result.is_correct and not simple_result.tentative:
             return simple_result
 
-        # For multi-point questions with exact match, still return full points
-        if simple_result.is_correct and max_points > 1:
+        # Typed (numeric/year/date) answers are settled without the LLM
+        if simple_result.decisive:
             return simple_result
 
         # Simple match failed — try LLM if available
         llm = self._get_llm()
         if llm is None:
             return simple_result
+        if not llm.available():
+            simple_result.explanation = (simple_result.explanation or "") + " " + LLM_SKIPPED_NOTE
+            return simple_result
 
-        llm_result = llm._evaluate_single(question, correct_answer, user_answer, max_points)
+        if self._dispatcher is not None:
+            llm_result = self._dispatcher.evaluate_batch([(question, correct_answer, user_answer, max_points)])[0]
+        else:
+            llm_result = llm._evaluate_single(question, correct_answer, user_answer, max_points)
         if llm_result is None:
             # LLM call failed; fall back to simple result with note
-            simple_result.explanation = (simple_result.explanation or "") + " (LLM fallback: call failed)"
+            simple_result.explanation = (simple_result.explanation or "") + " " + LLM_FALLBACK_NOTE
             return simple_result
 
         return llm_result
 
-    def evaluate_batch(self, items: list[tuple[str, str, str, int]]) -> list[EvalResult]:
+    def evaluate_batch(self, items: list[EvalItem]) -> list[EvalResult]:
         if not items:
             return []
 
         # Run simple evaluator on all items
-        results: list[EvalResult] = [self._simple.evaluate(q, ca, ua, mp) for q, ca, ua, mp in items]
+        results: list[EvalResult] = [self._simple.evaluate(*item) for item in items]
 
         # Find indices that need LLM evaluation:
-        # - Failed simple matching and have a non-empty answer
+        # - Failed simple matching (or a tentative match) and have a non-empty answer
         # - OR multi-point questions that failed (for partial credit)
         llm_needed = [
-            i for i, ((_, _, ua, mp), r) in enumerate(zip(items, results))
-            if not r.is_correct and ua.strip()
+            i for i, (item, r) in enumerate(zip(items, results))
+            if (not r.is_correct or r.tentative) and not r.decisive and item[2].strip()
         ]
 
         if not llm_needed:
@@ -354,17 +1127,219 @@ class HybridEvaluator(AnswerEvaluator):
         llm = self._get_llm()
         if llm is None:
             return results
+        if not llm.available():
+            for i in llm_needed:
+                results[i].explanation = (results[i].explanation or "") + " " + LLM_SKIPPED_NOTE
+            return results
+
+        # Teams often type the same wrong answer: send each distinct
+        # (question, reference, answer_key, points) to the LLM once.
+        groups: dict[tuple[str, str, str, int], list[int]] = {}
+        for i in llm_needed:
+            q, ca, ua, mp = items[i][:4]
+            groups.setdefault((q, ca, answer_key(ua), mp), []).append(i)
+        llm_items = [items[indices[0]][:4] for indices in groups.values()]
+        self._record_dedup(len(llm_needed), len(llm_items))
 
-        llm_items = [items[i] for i in llm_needed]
-        llm_results = llm.evaluate_batch(llm_items)
+        if self._dispatcher is not None:
+            llm_results = self._dispatcher.evaluate_batch(llm_items)
+        else:
+            llm_results = llm.evaluate_batch(llm_items)
 
-        if len(llm_results) == len(llm_needed):
-            for idx, llm_result in zip(llm_needed, llm_results):
-                if llm_result is not None:
-                    results[idx] = llm_result
-                else:
-                    results[idx].explanation = (results[idx].explanation or "") + " (LLM fallback: call failed)"
+        if len(llm_results) == len(llm_items):
+            for indices, llm_result in zip(groups.values(), llm_results):
+                for idx in indices:
+                    if llm_result is not None:
+                        results[idx] = replace(llm_result)
+                    else:
+                        results[idx].explanation = (results[idx].explanation or "") + " " + LLM_FALLBACK_NOTE
         else:
-            logger.warning("LLM batch returned unexpected length %d (expected %d); keeping simple results", len(llm_results), len(llm_needed))
+            logger.warning("LLM batch returned unexpected length %d (expected %d); keeping simple results", len(llm_results), len(llm_items))
+
+        return results
+
+    def _record_dedup(self, candidates: int, unique: int) -> None:
+        with self._stats_lock:
+            self._llm_candidates += candidates
+            self._llm_unique += unique
+        if unique < candidates:
+            logger.debug("LLM batch deduplicated %d answers to %d", candidates, unique)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = {
+                "llm_candidates": self._llm_candidates,
+                "llm_unique": self._llm_unique,
+                "dedup_ratio": round(1 - self._llm_unique / self._llm_candidates, 3) if self._llm_candidates else 0.0,
+            }
+        if self._llm is not None:
+            stats["llm"] = self._llm.stats()
+        if self._dispatcher is not None:
+            stats["dispatcher"] = self._dispatcher.stats()
+        return stats
+
+
+def question_hash(question: str, correct_answer: str, language: str | None = None) -> str:
+    """Stable cache key for a question's text, reference answer and (if set) language."""
+    key = f"{question}\x1f{correct_answer}" + (f"\x1f{language}" if language else "")
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class CachingEvaluator(AnswerEvaluator):
+    """Memoises another evaluator by (question hash, answer_key, max_points).
+
+    Lookups go through an in-process LRU first and then, when enabled, a shared
+    EvalCacheStore so every worker process benefits from one LLM call. Editing a
+    question's text or answer changes its hash, and a points change changes
+    max_points, so stale entries are never served; ``invalidate`` just reclaims
+    them. Failed LLM fallbacks are not cached.
+    """
+
+    def __init__(self, inner: AnswerEvaluator, max_entries: int | None = None,
+                 store: EvalCacheStore | None = None):
+        self._inner = inner
+        self._max_entries = max_entries
+        self._store = store
+        self._store_init_attempted = store is not None
+        self._memory: OrderedDict[tuple[str, str, int], dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+    def _get_store(self) -> EvalCacheStore | None:
+        if self._store_init_attempted:
+            return self._store
+
+        self._store_init_attempted = True
+        try:
+            from backend.core.settings import get_settings
+
+            if get_settings().eval_cache_persistent:
+                from backend.storage import get_eval_cache_store
+
+                self._store = get_eval_cache_store()
+        except Exception as exc:
+            logger.warning("Failed to initialise persistent evaluation cache: %s", exc)
+        return self._store
+
+    def _capacity(self) -> int:
+        if self._max_entries is None:
+            from backend.core.settings import get_settings
 
+            self._max_entries = get_settings().eval_cache_size
+        return self._max_entries
+
+    @staticmethod
+    def _key(question: str, correct_answer: str, user_answer: str, max_points: int,
+             language: str | None = None) -> tuple[str, str, int]:
+        return (question_hash(question, correct_answer, language), answer_key(user_answer), max_points)
+
+    def _remember(self, entries: dict[tuple[str, str, int], dict]) -> None:
+        capacity = self._capacity()
+        with self._lock:
+            for key, value in entries.items():
+                self._memory[key] = value
+                self._memory.move_to_end(key)
+            while len(self._memory) > capacity:
+                self._memory.popitem(last=False)
+
+    def evaluate(self, question: str, correct_answer: str, user_answer: str, max_points: int = 1,
+                 language: str | None = None) -> EvalResult:
+        item = (question, correct_answer, user_answer, max_points) + ((language,) if language else ())
+        return self.evaluate_batch([item])[0]
+
+    def evaluate_batch(self, items: list[EvalItem]) -> list[EvalResult]:
+        if not items:
+            return []
+
+        keys = [self._key(*item) for item in items]
+        found: dict[tuple[str, str, int], dict] = {}
+        with self._lock:
+            for key in keys:
+                cached = self._memory.get(key)
+                if cached is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = cached
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        store = self._get_store() if missing else None
+        stored: dict[tuple[str, str, int], dict] = {}
+        if store is not None:
+            try:
+                stored = store.get_many(missing)
+            except Exception as exc:
+                logger.warning("Persistent evaluation cache read failed: %s", exc)
+                stored = {}
+            if stored:
+                self._remember(stored)
+                found.update(stored)
+
+        pending = [i for i, key in enumerate(keys) if key not in found]
+        fresh: dict[tuple[str, str, int], dict] = {}
+        results: list[EvalResult | None] = [None] * len(items)
+        if pending:
+            computed = self._inner.evaluate_batch([items[i] for i in pending])
+            for i, result in zip(pending, computed):
+                results[i] = result
+                if result is not None and not is_fallback_result(result):
+                    fresh[keys[i]] = asdict(result)
+            if fresh:
+                self._remember(fresh)
+                if store is not None:
+                    try:
+                        store.put_many(fresh)
+                    except Exception as exc:
+                        logger.warning("Persistent evaluation cache write failed: %s", exc)
+
+        with self._lock:
+            self._hits += len(items) - len(pending)
+            self._persistent_hits += sum(1 for key in keys if key in stored)
+            self._misses += len(pending)
+
+        for i, key in enumerate(keys):
+            if results[i] is None and key in found:
+                results[i] = EvalResult(**found[key])
         return results
+
+    def invalidate(self, question: str, correct_answer: str, language: str | None = None) -> int:
+        """Drop every cached result for this question text, reference answer and language."""
+        qhash = question_hash(question, correct_answer, language)
+        with self._lock:
+            stale = [key for key in self._memory if key[0] == qhash]
+            for key in stale:
+                del self._memory[key]
+        removed = len(stale)
+        store = self._get_store()
+        if store is not None:
+            try:
+                removed += store.delete_question(qhash)
+            except Exception as exc:
+                logger.warning("Persistent evaluation cache invalidation failed: %s", exc)
+        return removed
+
+    @property
+    def inner(self) -> AnswerEvaluator:
+        return self._inner
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._memory),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._hits = self._persistent_hits = self._misses = 0
+
+
+@lru_cache()
+def get_answer_evaluator() -> CachingEvaluator:
+    """Process-wide evaluator shared by live and replay scoring."""
+    return CachingEvaluator(HybridEvaluator())
@@ -0,0 +1,203 @@
+"""Accent folding, transliteration and phonetic keys for answer matching.
+
+Used by SimpleEvaluator as a deterministic tier between fuzzy matching and the
+LLM, so "Muller" / "Müller" / "Mueller", "Strasse" / "Straße" or a phonetically
+misspelled surname are settled locally. Folding applies to every language;
+transliteration tables and the phonetic algorithm are chosen by the question's
+language (Cologne phonetics for German, Metaphone for English). Questions
+without a known language get folding only.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Characters NFKD does not decompose into a base letter plus marks
+_FOLD_TABLE = str.maketrans({
+    "ß": "ss", "ẞ": "ss", "æ": "ae", "Æ": "ae", "œ": "oe", "Œ": "oe",
+    "ø": "o", "Ø": "o", "ł": "l", "Ł": "l", "đ": "d", "Đ": "d", "þ": "th", "Þ": "th",
+})
+
+# Applied before folding, so the spelled-out forms compare equal
+_TRANSLITERATIONS: dict[str, dict[int, str]] = {
+    "de": str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "Ä": "ae", "Ö": "oe", "Ü": "ue"}),
+}
+
+_LANGUAGE_ALIASES = {
+    "de": "de", "deu": "de", "ger": "de", "german": "de", "deutsch": "de",
+    "en": "en", "eng": "en", "english": "en",
+}
+
+_NON_LETTERS = re.compile(r"[^a-z]")
+
+
+def language_code(language: str | None) -> str | None:
+    """Map a free-form QuestionModel.language ("German", "de-AT") to "de"/"en"/None."""
+    if not language:
+        return None
+    language = language.strip().lower()
+    return _LANGUAGE_ALIASES.get(language) or _LANGUAGE_ALIASES.get(re.split(r"[-_]", language)[0])
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents: "Müller" -> "muller", "Straße" -> "strasse"."""
+    decomposed = unicodedata.normalize("NFKD", text.translate(_FOLD_TABLE))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def folded_forms(text: str, language: str | None = None) -> frozenset[str]:
+    """The accent-folded text plus, for languages with a table, its transliteration."""
+    forms = {fold(text)}
+    table = _TRANSLITERATIONS.get(language_code(language) or "")
+    if table is not None:
+        forms.add(fold(text.translate(table)))
+    return frozenset(forms)
+
+
+def phonetic_key(word: str, language: str | None) -> str | None:
+    """Phonetic code of a single word, or None if the language has no algorithm."""
+    code = language_code(language)
+    word = _NON_LETTERS.sub("", fold(word))
+    if not word:
+        return None
+    if code == "de":
+        return cologne_phonetics(word)
+    if code == "en":
+        return metaphone(word)
+    return None
+
+
+def cologne_phonetics(word: str) -> str:
+    """Kölner Phonetik of a folded, letters-only word."""
+    word = word.upper()
+    digits = []
+    for i, ch in enumerate(word):
+        prev = word[i - 1] if i > 0 else ""
+        nxt = word[i + 1] if i + 1 < len(word) else ""
+        if ch in "AEIJOUY":
+            digit = "0"
+        elif ch == "H":
+            continue
+        elif ch == "B":
+            digit = "1"
+        elif ch == "P":
+            digit = "3" if nxt == "H" else "1"
+        elif ch in "DT":
+            digit = "8" if nxt in ("C", "S", "Z") and nxt else "2"
+        elif ch in "FVW":
+            digit = "3"
+        elif ch in "GKQ":
+            digit = "4"
+        elif ch == "C":
+            if i == 0:
+                digit = "4" if nxt and nxt in "AHKLOQRUX" else "8"
+            else:
+                digit = "4" if nxt and nxt in "AHKOQUX" and prev not in ("S", "Z") else "8"
+        elif ch == "X":
+            digit = "8" if prev in ("C", "K", "Q") and prev else "48"
+        elif ch == "L":
+            digit = "5"
+        elif ch in "MN":
+            digit = "6"
+        elif ch == "R":
+            digit = "7"
+        elif ch in "SZ":
+            digit = "8"
+        else:
+            continue
+        digits.append(digit)
+
+    collapsed = []
+    for digit in "".join(digits):
+        if not collapsed or collapsed[-1] != digit:
+            collapsed.append(digit)
+    if not collapsed:
+        return ""
+    return collapsed[0] + "".join(d for d in collapsed[1:] if d != "0")
+
+
+_VOWELS = "AEIOU"
+
+
+def metaphone(word: str) -> str:
+    """Original (Philips 1990) Metaphone of a folded, letters-only word."""
+    word = word.upper()
+    if word[:2] in ("AE", "GN", "KN", "PN", "WR"):
+        word = word[1:]
+    elif word[:1] == "X":
+        word = "S" + word[1:]
+    elif word[:2] == "WH":
+        word = "W" + word[2:]
+
+    def at(i: int) -> str:
+        return word[i] if 0 <= i < len(word) else ""
+
+    key = []
+    for i, ch in enumerate(word):
+        if ch == at(i - 1) and ch != "C":
+            continue
+        prev, nxt, after = at(i - 1), at(i + 1), at(i + 2)
+        if ch in _VOWELS:
+            if i == 0:
+                key.append(ch)
+        elif ch == "B":
+            if not (prev == "M" and i == len(word) - 1):
+                key.append("B")
+        elif ch == "C":
+            if nxt == "I" and after == "A":
+                key.append("X")
+            elif nxt == "H":
+                key.append("K" if prev == "S" else "X")
+            elif nxt and nxt in "IEY":
+                if prev != "S":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif ch == "D":
+            key.append("J" if nxt == "G" and after and after in "EIY" else "T")
+        elif ch == "G":
+            if nxt == "H" and after and after not in _VOWELS:
+                continue
+            if nxt == "N" and (i + 2 == len(word) or word[i + 2:] == "ED"):
+                continue
+            if prev == "D" and nxt and nxt in "EIY":
+                continue
+            key.append("J" if nxt and nxt in "IEY" and prev != "G" else "K")
+        elif ch == "H":
+            if prev and prev in "CSPTG":
+                continue
+            if prev and prev in _VOWELS and not (nxt and nxt in _VOWELS):
+                continue
+            key.append("H")
+        elif ch == "K":
+            if prev != "C":
+                key.append("K")
+        elif ch == "P":
+            key.append("F" if nxt == "H" else "P")
+        elif ch == "Q":
+            key.append("K")
+        elif ch == "S":
+            if nxt == "H" or (nxt == "I" and after in ("O", "A")):
+                key.append("X")
+            else:
+                key.append("S")
+        elif ch == "T":
+            if nxt == "I" and after in ("O", "A"):
+                key.append("X")
+            elif nxt == "H":
+                key.append("0")
+            elif not (nxt == "C" and after == "H"):
+                key.append("T")
+        elif ch == "V":
+            key.append("F")
+        elif ch in "WY":
+            if nxt and nxt in _VOWELS:
+                key.append(ch)
+        elif ch == "X":
+            key.append("KS")
+        elif ch == "Z":
+            key.append("S")
+        else:
+            key.append(ch)
+    return "".join(key)
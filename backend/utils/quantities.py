@@ -0,0 +1,354 @@
+"""Typed answer parsing: numbers, number words, years, dates and units.
+
+Used by SimpleEvaluator to decide numeric answers deterministically instead of
+fuzzy-matching digits ("1969" vs "1968") or sending them to the LLM.
+
+A reference answer may carry its own tolerance, e.g. ``"384,400 km (±1%)"`` or
+``"100 +/- 5"``. Without one, a user answer matches if it rounds to the
+reference at the precision the reference was written in ("3.14" accepts
+"3.14159"; "12 million" accepts "12,000,000"). Years and dates must match
+exactly.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Quantity:
+    kind: str  # "number", "year" or "date"
+    value: float = 0.0
+    unit: str | None = None
+    step: float = 1.0  # precision the value was written with, in its own unit
+    date: tuple[int, int | None, int | None] | None = None  # (year, month, day)
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    amount: float
+    relative: bool
+
+
+# canonical unit -> (dimension, factor to base unit, offset to base unit)
+_UNITS: dict[str, tuple[str, float, float]] = {
+    "km": ("length", 1000.0, 0.0),
+    "m": ("length", 1.0, 0.0),
+    "cm": ("length", 0.01, 0.0),
+    "mm": ("length", 0.001, 0.0),
+    "mi": ("length", 1609.344, 0.0),
+    "ft": ("length", 0.3048, 0.0),
+    "in": ("length", 0.0254, 0.0),
+    "yd": ("length", 0.9144, 0.0),
+    "kg": ("mass", 1.0, 0.0),
+    "g": ("mass", 0.001, 0.0),
+    "t": ("mass", 1000.0, 0.0),
+    "lb": ("mass", 0.45359237, 0.0),
+    "oz": ("mass", 0.028349523125, 0.0),
+    "l": ("volume", 1.0, 0.0),
+    "ml": ("volume", 0.001, 0.0),
+    "s": ("time", 1.0, 0.0),
+    "min": ("time", 60.0, 0.0),
+    "h": ("time", 3600.0, 0.0),
+    "day": ("time", 86400.0, 0.0),
+    "week": ("time", 604800.0, 0.0),
+    "year": ("time", 31557600.0, 0.0),
+    "km/h": ("speed", 1 / 3.6, 0.0),
+    "mph": ("speed", 0.44704, 0.0),
+    "m/s": ("speed", 1.0, 0.0),
+    "c": ("temperature", 1.0, 0.0),
+    "f": ("temperature", 5 / 9, -32 * 5 / 9),
+    "k": ("temperature", 1.0, -273.15),
+    "%": ("percent", 1.0, 0.0),
+    "usd": ("usd", 1.0, 0.0),
+    "gbp": ("gbp", 1.0, 0.0),
+    "eur": ("eur", 1.0, 0.0),
+}
+
+_UNIT_ALIASES: dict[str, str] = {
+    "kilometre": "km", "kilometres": "km", "kilometer": "km", "kilometers": "km", "kms": "km",
+    "metre": "m", "metres": "m", "meter": "m", "meters": "m",
+    "centimetre": "cm", "centimetres": "cm", "centimeter": "cm", "centimeters": "cm",
+    "millimetre": "mm", "millimetres": "mm", "millimeter": "mm", "millimeters": "mm",
+    "mile": "mi", "miles": "mi",
+    "foot": "ft", "feet": "ft",
+    "inch": "in", "inches": "in",
+    "yard": "yd", "yards": "yd",
+    "kilogram": "kg", "kilograms": "kg", "kilo": "kg", "kilos": "kg", "kgs": "kg",
+    "gram": "g", "grams": "g",
+    "tonne": "t", "tonnes": "t", "ton": "t", "tons": "t",
+    "pound": "lb", "pounds": "lb", "lbs": "lb",
+    "ounce": "oz", "ounces": "oz",
+    "litre": "l", "litres": "l", "liter": "l", "liters": "l",
+    "millilitre": "ml", "millilitres": "ml", "milliliter": "ml", "milliliters": "ml",
+    "second": "s", "seconds": "s", "sec": "s", "secs": "s",
+    "minute": "min", "minutes": "min", "mins": "min",
+    "hour": "h", "hours": "h", "hr": "h", "hrs": "h",
+    "days": "day", "weeks": "week", "years": "year", "yrs": "year",
+    "kmh": "km/h", "kph": "km/h",
+    "°c": "c", "celsius": "c", "degrees celsius": "c", "degrees c": "c",
+    "°f": "f", "fahrenheit": "f", "degrees fahrenheit": "f", "degrees f": "f",
+    "kelvin": "k",
+    "percent": "%", "per cent": "%", "pct": "%",
+    "dollars": "usd", "dollar": "usd", "$": "usd",
+    "pounds sterling": "gbp", "£": "gbp",
+    "euros": "eur", "euro": "eur", "€": "eur",
+}
+_UNIT_ALIASES.update({unit: unit for unit in _UNITS})
+
+_CURRENCY_PREFIXES = {"$": "usd", "£": "gbp", "€": "eur"}
+
+_SCALES = {
+    "thousand": 1e3, "k": 1e3,
+    "million": 1e6, "mn": 1e6,
+    "billion": 1e9, "bn": 1e9,
+    "trillion": 1e12,
+}
+
+_SMALL_NUMBERS = {
+    word: value
+    for value, word in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen "
+        "fourteen fifteen sixteen seventeen eighteen nineteen".split()
+    )
+}
+_TENS = {
+    word: value * 10
+    for value, word in enumerate("twenty thirty forty fifty sixty seventy eighty ninety".split(), 2)
+}
+_NUMBER_WORDS = {
+    **_SMALL_NUMBERS, **_TENS, "dozen": 12, "hundred": 100,
+    "thousand": 1e3, "million": 1e6, "billion": 1e9, "trillion": 1e12,
+}
+
+_MONTHS = {
+    name: index
+    for index, names in enumerate(
+        [("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"), ("may",),
+         ("june", "jun"), ("july", "jul"), ("august", "aug"), ("september", "sep", "sept"),
+         ("october", "oct"), ("november", "nov"), ("december", "dec")],
+        1,
+    )
+    for name in names
+}
+
+_HEDGES = re.compile(r"^(?:approximately|approx\.?|about|around|roughly|circa|ca\.?|c\.|~)\s*")
+_TOLERANCE = re.compile(r"\(?\s*(?:±|\+/-|\+-)\s*(\d+(?:\.\d+)?)\s*(%)?\s*\)?")
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_NUMERAL = re.compile(r"^(-?)(\d{1,3}(?:,\d{3})+|\d+)?(?:\.(\d+))?$")
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?"
+_MONTH = r"([a-z]+)\.?"
+_YEAR = r"(\d{3,4})"
+
+
+def parse_tolerance(text: str) -> tuple[str, Tolerance | None]:
+    """Strip a ``±x`` / ``±x%`` tolerance from a reference answer."""
+    match = _TOLERANCE.search(text)
+    if not match:
+        return text, None
+    tolerance = Tolerance(amount=float(match.group(1)), relative=bool(match.group(2)))
+    return (text[:match.start()] + text[match.end():]).strip(), tolerance
+
+
+def parse_quantity(text: str) -> Quantity | None:
+    """Parse a whole answer as a single number, year or date, or return None."""
+    text = _PARENTHETICAL.sub(" ", text.strip().lower())
+    text = _HEDGES.sub("", text.strip())
+    text = re.sub(r"\s+", " ", text).strip().rstrip(".")
+    # Decades ("1960s") are ranges, not quantities
+    if not text or re.fullmatch(r"\d+0'?s", text):
+        return None
+    return _parse_date(text) or _parse_year(text) or _parse_number(text)
+
+
+def _parse_date(text: str) -> Quantity | None:
+    match = re.fullmatch(r"(\d{4})-(\d{1,2})-(\d{1,2})", text)
+    if match:
+        return _date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    text = text.replace(",", " ")
+    text = re.sub(r"\s+", " ", text)
+    for pattern, order in (
+        (rf"{_DAY} (?:of )?{_MONTH} {_YEAR}", ("day", "month", "year")),
+        (rf"{_MONTH} {_DAY} {_YEAR}", ("month", "day", "year")),
+        (rf"{_MONTH} {_YEAR}", ("month", "year")),
+    ):
+        match = re.fullmatch(pattern, text)
+        if not match:
+            continue
+        parts = dict(zip(order, match.groups()))
+        month = _MONTHS.get(parts["month"])
+        if month is None:
+            continue
+        day = int(parts["day"]) if "day" in parts else None
+        return _date(int(parts["year"]), month, day)
+    return None
+
+
+def _date(year: int, month: int | None, day: int | None) -> Quantity | None:
+    if month is not None and not 1 <= month <= 12:
+        return None
+    if day is not None and not 1 <= day <= 31:
+        return None
+    return Quantity(kind="date", value=float(year), date=(year, month, day))
+
+
+def _parse_year(text: str) -> Quantity | None:
+    match = re.fullmatch(r"(\d{1,4}) ?(bc|bce|ad|ce)", text) or re.fullmatch(r"(ad|ce) ?(\d{1,4})", text)
+    if match:
+        digits = next(group for group in match.groups() if group.isdigit())
+        era = next(group for group in match.groups() if not group.isdigit())
+        year = int(digits)
+        return Quantity(kind="year", value=float(-year if era in ("bc", "bce") else year))
+    if re.fullmatch(r"\d{4}", text) and 1000 <= int(text) <= 2100:
+        return Quantity(kind="year", value=float(text))
+    return _year_from_words(text)
+
+
+def _year_from_words(text: str) -> Quantity | None:
+    """A year spoken as two pairs of digits: "nineteen eighty-four" -> 1984."""
+    tokens = text.replace("-", " ").split()
+    groups = []
+    while tokens:
+        value = _SMALL_NUMBERS.get(tokens[0]) or _TENS.get(tokens[0])
+        if value is None or value < 10:
+            return None
+        tokens = tokens[1:]
+        if value in _TENS.values() and tokens and 0 < _SMALL_NUMBERS.get(tokens[0], 0) < 10:
+            value += _SMALL_NUMBERS[tokens[0]]
+            tokens = tokens[1:]
+        groups.append(value)
+    if len(groups) != 2 or not 10 <= groups[0] <= 20:
+        return None
+    return Quantity(kind="year", value=float(groups[0] * 100 + groups[1]))
+
+
+def _parse_number(text: str) -> Quantity | None:
+    unit = None
+    if text[0] in _CURRENCY_PREFIXES:
+        unit = _CURRENCY_PREFIXES[text[0]]
+        text = text[1:].strip()
+
+    # Split "12.5km", "12 km/h", "-3 °c" into number part and trailing words
+    match = re.fullmatch(r"(-?[\d,]*\.?\d+)\s*(.*)", text)
+    if match:
+        numeral = _NUMERAL.fullmatch(match.group(1))
+        if not numeral or not (numeral.group(2) or numeral.group(3)):
+            return None
+        decimals = numeral.group(3) or ""
+        value = float((numeral.group(2) or "0").replace(",", "") + "." + (decimals or "0"))
+        if numeral.group(1):
+            value = -value
+        step = 10.0 ** -len(decimals)
+        rest = match.group(2).strip()
+    else:
+        words = _take_number_words(text)
+        if words is None:
+            return None
+        value, rest = words
+        step = 1.0
+
+    # "k" after a number is read as thousands; kelvin has to be spelled out
+    scale_match = re.match(r"(thousand|million|billion|trillion|mn|bn|k)\b\s*(.*)", rest)
+    if scale_match:
+        scale = _SCALES[scale_match.group(1)]
+        value *= scale
+        step *= scale
+        rest = scale_match.group(2).strip()
+
+    if rest:
+        rest_unit = _UNIT_ALIASES.get(rest) or _UNIT_ALIASES.get(rest.removeprefix("degrees ").strip())
+        if rest_unit is None or (unit is not None and rest_unit != unit):
+            return None
+        unit = rest_unit
+    return Quantity(kind="number", value=value, unit=unit, step=step)
+
+
+def _take_number_words(text: str) -> tuple[float, str] | None:
+    """Read leading number words ("twenty-one", "a hundred and five") off text."""
+    tokens = text.replace("-", " ").split()
+    total = 0.0
+    current = 0.0
+    consumed = 0
+    seen_number = False
+    for index, token in enumerate(tokens):
+        if token == "and" and seen_number:
+            continue
+        if token == "a" and index + 1 < len(tokens) and tokens[index + 1] in ("hundred", "dozen", "thousand", "million", "billion"):
+            current = max(current, 1)
+            continue
+        value = _NUMBER_WORDS.get(token)
+        if value is None:
+            break
+        seen_number = True
+        consumed = index + 1
+        if token == "hundred":
+            current = max(current, 1) * 100
+        elif token == "dozen":
+            current = max(current, 1) * 12
+        elif value >= 1000:
+            total += max(current, 1) * value
+            current = 0
+        else:
+            # Only a tens word takes a following unit ("twenty-one"); "nineteen
+            # eighty" or "one two" are two numbers, not their sum
+            low = current % 100
+            if low and not (low >= 20 and low % 10 == 0 and value < 10):
+                return None
+            current += value
+    if not seen_number:
+        return None
+    return total + current, " ".join(tokens[consumed:])
+
+
+def quantities_match(reference: Quantity, answer: Quantity, tolerance: Tolerance | None = None) -> bool:
+    if reference.kind == "date":
+        if answer.kind != "date":
+            return False
+        # The user must give (at least) every part the reference gives
+        return all(ref is None or ref == ans for ref, ans in zip(reference.date, answer.date))
+
+    if reference.kind == "year":
+        if answer.kind == "date":
+            return answer.date[0] == reference.value
+        return answer.unit is None and answer.value == reference.value
+
+    if answer.kind == "date":
+        return False
+    value = answer.value
+    if reference.unit and answer.unit and answer.unit != reference.unit:
+        converted = _convert(value, answer.unit, reference.unit)
+        if converted is None:
+            return False
+        value = converted
+
+    if tolerance is not None:
+        allowed = abs(reference.value) * tolerance.amount / 100 if tolerance.relative else tolerance.amount
+        return abs(value - reference.value) <= allowed + 1e-9
+    # Accept anything that rounds to the reference at the precision it was written in
+    return abs(value - reference.value) <= reference.step / 2 + 1e-9 * max(1.0, abs(reference.value))
+
+
+def partial_date_match(reference: Quantity, answer: Quantity) -> bool:
+    """True if ``answer`` gives fewer parts of a reference date but every one it gives is right."""
+    if reference.kind != "date":
+        return False
+    if answer.kind == "year":
+        given = (int(answer.value), None, None)
+    elif answer.kind == "date":
+        given = answer.date
+    else:
+        return False
+    return all(ans is None or ans == ref for ref, ans in zip(reference.date, given)) and any(
+        ref is not None and ans is None for ref, ans in zip(reference.date, given)
+    )
+
+
+def _convert(value: float, from_unit: str, to_unit: str) -> float | None:
+    from_dimension, from_factor, from_offset = _UNITS[from_unit]
+    to_dimension, to_factor, to_offset = _UNITS[to_unit]
+    if from_dimension != to_dimension:
+        return None
+    base = value * from_factor + from_offset
+    return (base - to_offset) / to_factor
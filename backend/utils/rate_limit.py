@@ -93,3 +93,9 @@ signup_limiter = RateLimiter(max_calls=10, window_seconds=3600)
 
 # Question generation: 10 per admin per hour
 question_gen_limiter = RateLimiter(max_calls=10, window_seconds=3600)
+
+# Free-play deck creation: 30 per IP per 10 minutes
+deck_create_limiter = RateLimiter(max_calls=30, window_seconds=600)
+
+# Background grading during replays: 60 answers per IP per minute
+replay_grade_limiter = RateLimiter(max_calls=60, window_seconds=60)
@@ -0,0 +1,106 @@
+"""String similarity for fuzzy answer matching.
+
+``ratio`` replaces ``difflib.SequenceMatcher(None, a, b).ratio()`` in the
+evaluator. It is an edit-distance similarity on the same scale:
+``1 - distance / (len(a) + len(b))``, where inserting or deleting a character
+costs 1, substituting costs 2 (a delete plus an insert) and swapping two
+adjacent characters costs 1. Without transpositions this is exactly
+``2 * LCS / total length``, the quantity SequenceMatcher approximates, so the
+existing 0.85 threshold keeps its meaning.
+
+With a ``score_cutoff`` the distance is computed only inside the diagonal band
+that can still reach the cutoff, and the computation stops as soon as a whole
+row exceeds it. This makes the usual wrong answer cost O(len * band) rather
+than the quadratic SequenceMatcher worst case.
+"""
+
+from __future__ import annotations
+
+
+def ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """Similarity in [0, 1]; 0.0 if it would be below ``score_cutoff``."""
+    total = len(a) + len(b)
+    if total == 0:
+        return 1.0
+    max_distance = int((1.0 - score_cutoff) * total + 1e-9)
+    distance = _distance(a, b, max_distance)
+    if distance > max_distance:
+        return 0.0
+    similarity = 1.0 - distance / total
+    return similarity if similarity >= score_cutoff else 0.0
+
+
+def sort_tokens(text: str) -> str:
+    """Words in sorted order, for comparing reordered multi-word answers with
+    ``ratio``. The evaluator keeps the sorted reference with its index."""
+    return " ".join(sorted(text.split()))
+
+
+def ratio_bound(a: str, b: str) -> float:
+    """Upper bound of ``ratio`` from the lengths alone."""
+    total = len(a) + len(b)
+    return 2 * min(len(a), len(b)) / total if total else 1.0
+
+
+def _distance(a: str, b: str, max_distance: int) -> int:
+    """Weighted OSA distance, or ``max_distance + 1`` once it is exceeded."""
+    # Common prefixes and suffixes never change the distance
+    start = 0
+    shortest = min(len(a), len(b))
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shortest - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a = a[start:len(a) - end]
+    b = b[start:len(b) - end]
+
+    if len(a) > len(b):
+        a, b = b, a
+    len_a, len_b = len(a), len(b)
+    over = max_distance + 1
+    # Every step off the diagonal costs at least one insertion or deletion
+    if len_b - len_a > max_distance:
+        return over
+    if len_a == 0:
+        return len_b
+
+    band = max_distance
+    previous2: list[int] = []
+    previous = [j if j <= band else over for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        current = [over] * (len_b + 1)
+        if i <= band:
+            current[0] = i
+        low = max(1, i - band)
+        high = min(len_b, i + band)
+        char_a = a[i - 1]
+        before_a = a[i - 2] if i > 1 else ""
+        row_min = left = current[low - 1]
+        diagonal = previous[low - 1]
+        for j in range(low, high + 1):
+            char_b = b[j - 1]
+            above = previous[j]
+            if char_a == char_b:
+                cost = diagonal
+            else:
+                cost = diagonal + 2
+                if above < left:
+                    if above + 1 < cost:
+                        cost = above + 1
+                elif left + 1 < cost:
+                    cost = left + 1
+                if char_a == b[j - 2] and before_a == char_b and j > 1:
+                    transposed = previous2[j - 2] + 1
+                    if transposed < cost:
+                        cost = transposed
+                if cost > over:
+                    cost = over
+            current[j] = left = cost
+            diagonal = above
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return over
+        previous2, previous = previous, current
+    return min(previous[len_b], over)
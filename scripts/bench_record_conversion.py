@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark Postgres row -> model conversion.
+
+Compares the validated constructor (what the stores used to do on every read)
+with the trusted model_construct path now used by the *_from_record helpers,
+for questions, replay attempts and live answers (the rows read in bulk).
+Runs entirely in memory: records are built as unsaved ORM objects, so no
+database is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.models.live import LiveAnswerModel  # noqa: E402
+from backend.models.question import QuestionModel  # noqa: E402
+from backend.models.replay import ReplayAttemptModel  # noqa: E402
+from backend.storage.postgres import (  # noqa: E402
+    LiveAnswerRecord,
+    QuestionRecord,
+    ReplayRecord,
+    _live_answer_from_record,
+    _question_from_record,
+    _replay_from_record,
+)
+
+
+def _make_questions(count: int) -> list[QuestionRecord]:
+    start = datetime(2024, 1, 1)
+    return [
+        QuestionRecord(
+            question_id=f"q-{i:06d}",
+            question=(f"Which river flows through city number {i}? " * 2).strip(),
+            answer=f"River {i}",
+            added_by="bench",
+            added_at=start + timedelta(minutes=i),
+            question_topic="geography",
+            event_id=None,
+            source_note="benchmark fixture",
+            answer_source=None,
+            incorrect_answers=[f"Wrong {i}", f"Also wrong {i}", "Nile"],
+            times_asked=i % 17,
+            times_correct=i % 7,
+            times_incorrect=i % 5,
+            update_history=[{"timestamp": start.isoformat(), "changes": {"review_status": True}}],
+            last_updated_at=start + timedelta(minutes=i),
+            language="english",
+            tags=["rivers", "cities", "europe"],
+            review_status=True,
+            media_path=None,
+            media_text=None,
+            points=1,
+        )
+        for i in range(count)
+    ]
+
+
+def _make_replays(count: int) -> list[ReplayRecord]:
+    start = datetime(2024, 1, 1)
+    return [
+        ReplayRecord(
+            replay_id=f"r-{i:06d}",
+            event_id="event-1",
+            user_id=f"user-{i % 50}" if i % 3 else None,
+            display_name=f"Player {i}",
+            score=i % 20,
+            total=20,
+            answers=[
+                {
+                    "question_id": f"q-{n:03d}",
+                    "user_answer": f"Answer {n}",
+                    "correct_answer": f"River {n}",
+                    "is_correct": n % 2 == 0,
+                    "points_awarded": n % 2,
+                    "max_points": 1,
+                }
+                for n in range(20)
+            ],
+            completed_at=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _make_live_answers(count: int) -> list[LiveAnswerRecord]:
+    start = datetime(2024, 1, 1)
+    return [
+        LiveAnswerRecord(
+            answer_id=f"a-{i:06d}",
+            session_id="session-1",
+            participant_id=f"p-{i % 150}",
+            question_index=i // 150,
+            answer_text=f"River {i}",
+            is_locked=True,
+            points_awarded=float(i % 2),
+            max_points=1.0,
+            is_correct=i % 2 == 1,
+            explanation="LLM: close enough" if i % 2 else None,
+            speculative_result=None,
+            submitted_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+# kind -> (model, record factory, trusted conversion)
+KINDS = {
+    "question": (QuestionModel, _make_questions, _question_from_record),
+    "replay": (ReplayAttemptModel, _make_replays, _replay_from_record),
+    "live_answer": (LiveAnswerModel, _make_live_answers, _live_answer_from_record),
+}
+
+
+def _validator(model):
+    """The validated constructor fed straight from the record's columns."""
+    fields = list(model.model_fields)
+
+    def convert(record):
+        return model(**{name: getattr(record, name) for name in fields if hasattr(record, name)})
+
+    return convert
+
+
+def _rate(convert, records: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for record in records:
+            convert(record)
+        best = min(best, time.perf_counter() - started)
+    return len(records) / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="Records per run (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; best is reported (default: 5)")
+    parser.add_argument("--kind", choices=[*KINDS, "all"], default="all", help="Row type to convert (default: all)")
+    args = parser.parse_args()
+
+    print(f"rows per run: {args.rows}")
+    print(f"{'kind':<12} {'validated (before)':>20} {'trusted (after)':>18} {'speedup':>8}")
+    for kind, (model, make_records, trusted_convert) in KINDS.items():
+        if args.kind not in (kind, "all"):
+            continue
+        records = make_records(args.rows)
+        validated_convert = _validator(model)
+        if validated_convert(records[0]).model_dump() != trusted_convert(records[0]).model_dump():
+            print(f"ERROR: trusted {kind} conversion differs from validated conversion")
+            return 1
+        validated = _rate(validated_convert, records, args.repeat)
+        trusted = _rate(trusted_convert, records, args.repeat)
+        print(f"{kind:<12} {validated:>14,.0f} rows/s {trusted:>12,.0f} rows/s {trusted / validated:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
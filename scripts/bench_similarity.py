@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark fuzzy answer similarity: difflib vs backend.utils.similarity.
+
+Scores every (reference, user answer) pair of a corpus with the
+``difflib.SequenceMatcher`` ratio the evaluator used to call and with the
+banded ``similarity.ratio`` that replaced it (at the evaluator's 0.85 cutoff),
+and reports throughput plus how often the two disagree about the threshold.
+
+The corpus is a JSON-lines file with ``reference`` and ``user_answer`` keys,
+e.g. the export written by ``scripts/eval_harness.py --export``. Without one,
+a synthetic corpus of names, titles and typos is generated.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.utils import similarity  # noqa: E402
+from backend.utils.answer_eval import SimpleEvaluator  # noqa: E402
+
+_REFERENCES = [
+    "Ludwig van Beethoven", "Wolfgang Amadeus Mozart", "Bohemian Rhapsody", "Stairway to Heaven",
+    "Mount Kilimanjaro", "Photosynthesis", "The Good, the Bad and the Ugly", "Johann Sebastian Bach",
+    "Leonardo da Vinci", "Mississippi", "Australia", "Paris", "Albert Einstein", "Hydrogen",
+    "Smells Like Teen Spirit", "Gabriel Garcia Marquez", "Pyotr Ilyich Tchaikovsky", "Canberra",
+]
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        if len(chars) < 2:
+            break
+        i = rng.randrange(len(chars) - 1)
+        op = rng.choice(("drop", "swap", "double", "replace"))
+        if op == "drop":
+            del chars[i]
+        elif op == "swap":
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        elif op == "double":
+            chars.insert(i, chars[i])
+        else:
+            chars[i] = rng.choice("aeioulnrst")
+    return "".join(chars)
+
+
+def _synthetic_corpus(size: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(size):
+        reference = rng.choice(_REFERENCES)
+        kind = rng.random()
+        if kind < 0.4:
+            answer = _typo(reference, rng)
+        elif kind < 0.8:
+            answer = rng.choice(_REFERENCES)
+        else:
+            answer = " ".join(reversed(reference.split()))
+        pairs.append((reference, answer))
+    return pairs
+
+
+def _load_corpus(path: Path) -> list[tuple[str, str]]:
+    pairs = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                row = json.loads(line)
+                pairs.append((row["reference"], row["user_answer"]))
+    return pairs
+
+
+def _time(score, pairs: list[tuple[str, str]], repeat: int) -> tuple[float, list[float]]:
+    best = float("inf")
+    scores: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        scores = [score(reference, answer) for reference, answer in pairs]
+        best = min(best, time.perf_counter() - started)
+    return len(pairs) / best, scores
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="JSON-lines file with reference/user_answer pairs")
+    parser.add_argument("--size", type=int, default=20_000, help="Synthetic corpus size (default: 20000)")
+    parser.add_argument("--seed", type=int, default=7, help="Synthetic corpus seed (default: 7)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; best is reported (default: 3)")
+    args = parser.parse_args()
+
+    raw = _load_corpus(args.corpus) if args.corpus else _synthetic_corpus(args.size, args.seed)
+    normalize = SimpleEvaluator._normalize
+    pairs = [(normalize(reference), normalize(answer)) for reference, answer in raw]
+    if not pairs:
+        print("ERROR: empty corpus")
+        return 1
+
+    threshold = SimpleEvaluator.FUZZY_THRESHOLD
+    before, old_scores = _time(lambda a, b: SequenceMatcher(None, a, b).ratio(), pairs, args.repeat)
+    after, new_scores = _time(lambda a, b: similarity.ratio(a, b, threshold), pairs, args.repeat)
+    disagreements = sum((old >= threshold) != (new >= threshold) for old, new in zip(old_scores, new_scores))
+
+    print(f"pairs:                {len(pairs)}")
+    print(f"difflib (before):     {before:,.0f} pairs/s")
+    print(f"similarity (after):   {after:,.0f} pairs/s")
+    print(f"speedup:              {after / before:.1f}x")
+    print(f"threshold disagreements: {disagreements} ({disagreements / len(pairs):.2%})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
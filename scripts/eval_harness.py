@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""Benchmark and accuracy harness for the answer evaluators.
+
+Replays stored answers through a chosen evaluator configuration and reports
+throughput, per-batch latency (p50/p95), LLM calls and tokens, how often the
+LLM tier was needed, and agreement with the grading that was actually stored.
+
+The corpus comes from Postgres (``--from-db``: graded ``live_answers`` and the
+per-answer details in ``event_replays.answers``) or from a JSON-lines file
+written earlier with ``--export``. Each row has ``source``, ``batch``,
+``question``, ``reference``, ``user_answer``, ``points``, ``final_points`` and
+``language``; rows sharing a ``batch`` (one replay attempt, or one revealed
+live question) are evaluated together, as the services do.
+
+The LLM is never called: a local fake client with configurable latency grades
+every answer it is sent with the stored final points, so the LLM tier always
+"agrees" and agreement figures measure what the deterministic tiers decided
+on their own. Token counts are estimated from prompt size (4 chars/token).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.utils.answer_eval import (  # noqa: E402
+    AnswerEvaluator,
+    CachingEvaluator,
+    HybridEvaluator,
+    LLMBatchDispatcher,
+    LLMEvaluator,
+    SimpleEvaluator,
+    answer_key,
+)
+
+
+def _export_from_db(limit: int | None) -> list[dict]:
+    from sqlalchemy import select
+
+    from backend.storage.postgres import (
+        EventRecord,
+        LiveAnswerRecord,
+        LiveSessionRecord,
+        QuestionRecord,
+        ReplayRecord,
+        session_scope,
+    )
+
+    rows: list[dict] = []
+    with session_scope() as session:
+        replays = session.execute(
+            select(ReplayRecord.replay_id, ReplayRecord.answers).order_by(ReplayRecord.completed_at.desc()).limit(limit)
+        ).all()
+        question_ids = {entry.get("question_id") for _, answers in replays for entry in answers or []}
+        questions = {
+            record.question_id: record
+            for record in session.scalars(select(QuestionRecord).where(QuestionRecord.question_id.in_(question_ids)))
+        } if question_ids else {}
+        for replay_id, answers in replays:
+            for entry in answers or []:
+                question = questions.get(entry.get("question_id"))
+                if question is None or not entry.get("correct_answer"):
+                    continue
+                rows.append({
+                    "source": "replay",
+                    "batch": f"replay:{replay_id}",
+                    "question": question.question,
+                    "reference": entry["correct_answer"],
+                    "user_answer": entry.get("user_answer") or "",
+                    "points": int(entry.get("max_points") or question.points or 1),
+                    "final_points": int(entry.get("points_awarded") or 0),
+                    "language": question.language,
+                })
+
+        live = session.execute(
+            select(LiveAnswerRecord, EventRecord.question_ids)
+            .join(LiveSessionRecord, LiveSessionRecord.session_id == LiveAnswerRecord.session_id)
+            .join(EventRecord, EventRecord.event_id == LiveSessionRecord.event_id)
+            .where(LiveAnswerRecord.points_awarded.is_not(None))
+            .order_by(LiveAnswerRecord.submitted_at.desc())
+            .limit(limit)
+        ).all()
+        live_question_ids = {
+            ids[answer.question_index] for answer, ids in live if 0 <= answer.question_index < len(ids or [])
+        }
+        questions = {
+            record.question_id: record
+            for record in session.scalars(select(QuestionRecord).where(QuestionRecord.question_id.in_(live_question_ids)))
+        } if live_question_ids else {}
+        for answer, ids in live:
+            if not 0 <= answer.question_index < len(ids or []):
+                continue
+            question = questions.get(ids[answer.question_index])
+            if question is None:
+                continue
+            rows.append({
+                "source": "live",
+                "batch": f"live:{answer.session_id}:{answer.question_index}",
+                "question": question.question,
+                "reference": question.answer,
+                "user_answer": answer.answer_text or "",
+                "points": int(answer.max_points or question.points or 1),
+                "final_points": int(round(answer.points_awarded)),
+                "language": question.language,
+            })
+    return rows
+
+
+def _load_corpus(path: Path) -> list[dict]:
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def _write_corpus(path: Path, rows: list[dict]) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class OracleLLMClient:
+    """Anthropic-compatible fake that answers with the stored grading."""
+
+    def __init__(self, rows: list[dict], latency_seconds: float):
+        self._grades = {
+            (answer_key(row["reference"]), answer_key(row["user_answer"])): row["final_points"] for row in rows
+        }
+        self._latency = latency_seconds
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _points(self, reference: str, answer: str) -> int:
+        return int(self._grades.get((answer_key(reference), answer_key(answer)), 0))
+
+    def _create(self, **kwargs):
+        user_msg = kwargs["messages"][0]["content"]
+        if self._latency:
+            time.sleep(self._latency)
+        if "\nUser's answer: " in user_msg:
+            reference = re.search(r"^Reference answer: (.*)$", user_msg, re.MULTILINE).group(1)
+            answer = re.search(r"^User's answer: (.*)$", user_msg, re.MULTILINE).group(1)
+            graded = {"points_awarded": self._points(reference, answer), "explanation": "oracle"}
+        else:
+            graded = []
+            reference = ""
+            for line in user_msg.splitlines():
+                if line.startswith("Reference: "):
+                    reference = line[len("Reference: "):]
+                    continue
+                match = re.match(r"^(?:User: |\d+\. )(.*)$", line)
+                if match:
+                    graded.append({"points_awarded": self._points(reference, match.group(1)), "explanation": "oracle"})
+        text = json.dumps(graded)
+        usage = SimpleNamespace(
+            input_tokens=(len(kwargs.get("system", "")) + len(user_msg)) // 4, output_tokens=len(text) // 4
+        )
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += usage.input_tokens
+            self.output_tokens += usage.output_tokens
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason="end_turn", usage=usage)
+
+
+def _build_evaluator(args, client: OracleLLMClient) -> tuple[AnswerEvaluator, HybridEvaluator | None]:
+    simple = SimpleEvaluator(phonetic_matching=not args.no_phonetic)
+    if args.evaluator == "simple":
+        return simple, None
+
+    llm = LLMEvaluator(
+        api_key="",
+        chunk_size=args.chunk_size,
+        max_concurrency=args.concurrency,
+        deadline_seconds=args.deadline_seconds,
+        timeout_seconds=args.deadline_seconds,
+        client=client,
+    )
+    dispatcher = None
+    if args.batch_window_ms > 0:
+        dispatcher = LLMBatchDispatcher(
+            llm,
+            window_seconds=args.batch_window_ms / 1000,
+            max_items=args.chunk_size,
+            max_concurrency=args.concurrency,
+            timeout_seconds=args.deadline_seconds,
+        )
+    hybrid = HybridEvaluator(simple=simple, llm=llm, dispatcher=dispatcher)
+    if args.evaluator == "cached":
+        return CachingEvaluator(hybrid, max_entries=args.cache_size), hybrid
+    return hybrid, hybrid
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _run(evaluator: AnswerEvaluator, rows: list[dict], workers: int) -> tuple[list, list[float], float]:
+    batches: dict[str, list[int]] = {}
+    for i, row in enumerate(rows):
+        batches.setdefault(row.get("batch") or f"row:{i}", []).append(i)
+
+    results: list = [None] * len(rows)
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def evaluate(indices: list[int]) -> None:
+        items = [
+            (rows[i]["question"], rows[i]["reference"], rows[i]["user_answer"], rows[i]["points"], rows[i].get("language"))
+            for i in indices
+        ]
+        started = time.perf_counter()
+        batch_results = evaluator.evaluate_batch(items)
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed * 1000)
+            for i, result in zip(indices, batch_results):
+                results[i] = result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(evaluate, batches.values()))
+    return results, latencies, time.perf_counter() - started
+
+
+def _agreement(rows: list[dict], results: list) -> dict:
+    counts = {"items": len(rows), "agree": 0, "decided_locally": 0, "local_agree": 0,
+              "false_accepts": 0, "false_rejects": 0}
+    for row, result in zip(rows, results):
+        awarded = result.points_awarded if result is not None else 0
+        agrees = awarded == row["final_points"]
+        counts["agree"] += agrees
+        if result is not None and not (result.explanation or "").startswith("LLM"):
+            counts["decided_locally"] += 1
+            counts["local_agree"] += agrees
+            counts["false_accepts"] += awarded > row["final_points"]
+            counts["false_rejects"] += awarded < row["final_points"]
+    counts["agreement"] = round(counts["agree"] / len(rows), 4) if rows else 0.0
+    counts["local_agreement"] = (
+        round(counts["local_agree"] / counts["decided_locally"], 4) if counts["decided_locally"] else 0.0
+    )
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--from-db", action="store_true", help="Read graded answers from Postgres")
+    source.add_argument("--corpus", type=Path, help="JSON-lines corpus written by --export")
+    parser.add_argument("--export", type=Path, help="Write the loaded corpus to this JSON-lines file")
+    parser.add_argument("--limit", type=int, help="With --from-db, newest N replays and N live answers")
+    parser.add_argument("--evaluator", choices=("simple", "hybrid", "cached"), default="hybrid",
+                        help="Configuration to measure (default: hybrid)")
+    parser.add_argument("--no-phonetic", action="store_true", help="Disable the accent/phonetic matching tier")
+    parser.add_argument("--llm-latency-ms", type=float, default=400, help="Fake LLM latency per call (default: 400)")
+    parser.add_argument("--chunk-size", type=int, default=25, help="LLM answers per request (default: 25)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel LLM requests (default: 4)")
+    parser.add_argument("--deadline-seconds", type=float, default=20, help="LLM latency budget (default: 20)")
+    parser.add_argument("--batch-window-ms", type=float, default=0,
+                        help="Micro-batch small evaluations across batches (default: 0, off)")
+    parser.add_argument("--cache-size", type=int, default=5000, help="Entries for --evaluator cached (default: 5000)")
+    parser.add_argument("--workers", type=int, default=1, help="Batches evaluated concurrently (default: 1)")
+    parser.add_argument("--label", default="", help="Free-form name stored with the results")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    rows = _export_from_db(args.limit) if args.from_db else _load_corpus(args.corpus)
+    if args.export:
+        _write_corpus(args.export, rows)
+    if not rows:
+        print("ERROR: empty corpus", file=sys.stderr)
+        return 1
+
+    client = OracleLLMClient(rows, args.llm_latency_ms / 1000)
+    evaluator, hybrid = _build_evaluator(args, client)
+    results, latencies, elapsed = _run(evaluator, rows, args.workers)
+    hybrid_stats = hybrid.stats() if hybrid is not None else {}
+
+    report = {
+        "label": args.label,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in ("from_db", "corpus", "export", "output", "label")
+        },
+        "corpus": {
+            "items": len(rows),
+            "batches": len(latencies),
+            "sources": {name: sum(row.get("source") == name for row in rows) for name in ("replay", "live")},
+        },
+        "throughput_items_per_s": round(len(rows) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 2),
+            "p95": round(_percentile(latencies, 95), 2),
+            "max": round(max(latencies), 2),
+        },
+        "llm": {
+            "candidates": hybrid_stats.get("llm_candidates", 0),
+            "fallback_rate": round(hybrid_stats.get("llm_candidates", 0) / len(rows), 4),
+            "sent": hybrid_stats.get("llm_unique", 0),
+            "calls": client.calls,
+            "input_tokens_est": client.input_tokens,
+            "output_tokens_est": client.output_tokens,
+        },
+        "agreement": _agreement(rows, results),
+    }
+    if args.evaluator == "cached":
+        report["cache"] = evaluator.stats()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
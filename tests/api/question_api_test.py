@@ -58,10 +58,32 @@ def test_list_questions_pagination_and_filters(client, monkeypatch):
     mock_count.assert_called_once_with({"tags": ["a", "b"], "review_status": True, "language": "en"})
 
     data = resp.get_json()
-    assert data["pagination"] == {"limit": 2, "offset": 1, "count": 2, "total": 3, "next_page_token": "token-123"}
+    assert data["pagination"] == {
+        "limit": 2, "offset": 1, "count": 2, "total": 3,
+        "next_cursor": "token-123", "next_page_token": "token-123",
+    }
     assert [item["id"] for item in data["items"]] == ["2", "3"]
 
 
+def test_list_questions_cursor_param(client, monkeypatch):
+    mock_get_all = MagicMock(return_value=([], None))
+    monkeypatch.setattr("backend.api.questions.get_all_questions", mock_get_all)
+    monkeypatch.setattr("backend.api.questions.count_questions", MagicMock(return_value=0))
+
+    resp = client.get("/questions/?limit=2&cursor=abc")
+
+    assert resp.status_code == 200
+    mock_get_all.assert_called_once_with({}, limit=2, offset=0, page_token="abc", include_token=True)
+    assert resp.get_json()["pagination"]["next_cursor"] is None
+
+
+def test_list_questions_rejects_invalid_cursor(client, monkeypatch):
+    monkeypatch.setattr("backend.api.questions.get_all_questions", MagicMock(side_effect=ValueError("Invalid or expired cursor")))
+    resp = client.get("/questions/?cursor=old")
+    assert resp.status_code == 400
+    assert "cursor" in resp.get_json()["error"]
+
+
 def test_create_question_validation(client):
     _login_session(client)
     # added_by is auto-filled from the session, so omit `question` to trigger validation failure
@@ -187,6 +209,66 @@ def test_random_question_invalid_filters(client):
     assert "error" in resp.get_json()
 
 
+def test_create_deck(client, monkeypatch):
+    from backend.models.deck import PlayDeckModel
+    deck = PlayDeckModel(deck_id="deck-1", question_ids=["a", "b", "c"])
+    create = MagicMock(return_value=deck)
+    monkeypatch.setattr("backend.api.questions.create_play_deck", create)
+
+    resp = client.post("/questions/decks", json={"filters": {"language": "English", "tags": "history"}})
+
+    assert resp.status_code == 201
+    assert resp.get_json() == {"deck_id": "deck-1", "size": 3, "next_cursor": 0}
+    create.assert_called_once_with({"language": "english", "tags": ["history"]}, replaces=None)
+
+    # The next deck of the same browser session replaces this one
+    client.post("/questions/decks", json={})
+    assert create.call_args.kwargs["replaces"] == "deck-1"
+
+
+def test_create_deck_is_rate_limited(client, monkeypatch):
+    from backend.models.deck import PlayDeckModel
+    from backend.utils.rate_limit import RateLimiter
+    monkeypatch.setattr("backend.api.questions.deck_create_limiter", RateLimiter(max_calls=2, window_seconds=60))
+    create = MagicMock(return_value=PlayDeckModel(deck_id="deck-1", question_ids=["a"]))
+    monkeypatch.setattr("backend.api.questions.create_play_deck", create)
+
+    assert [client.post("/questions/decks", json={}).status_code for _ in range(3)] == [201, 201, 429]
+    assert create.call_count == 2
+
+
+def test_create_deck_no_matches(client, monkeypatch):
+    monkeypatch.setattr("backend.api.questions.create_play_deck", MagicMock(return_value=None))
+    resp = client.post("/questions/decks", json={})
+    assert resp.status_code == 404
+
+
+def test_next_from_deck(client, monkeypatch):
+    q = QuestionModel(question_id="q1", question="Q", answer="A", added_by="tester")
+    draw = MagicMock(return_value=([q], 4))
+    monkeypatch.setattr("backend.api.questions.draw_from_deck", draw)
+
+    resp = client.get("/questions/decks/deck-1/next?cursor=3&count=1")
+
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert [item["id"] for item in data["items"]] == ["q1"]
+    assert data["next_cursor"] == 4
+    draw.assert_called_once_with("deck-1", cursor=3, count=1)
+
+
+def test_next_from_deck_expired(client, monkeypatch):
+    monkeypatch.setattr("backend.api.questions.draw_from_deck", MagicMock(return_value=None))
+    resp = client.get("/questions/decks/deck-1/next")
+    assert resp.status_code == 404
+
+
+def test_next_from_deck_invalid_params(client):
+    assert client.get("/questions/decks/deck-1/next?cursor=-1").status_code == 400
+    assert client.get("/questions/decks/deck-1/next?count=500").status_code == 400
+    assert client.get("/questions/decks/deck-1/next?cursor=x").status_code == 400
+
+
 def test_question_metadata_endpoint(client, monkeypatch):
     monkeypatch.setattr(
         "backend.api.questions.get_question_metadata",
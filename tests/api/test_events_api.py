@@ -187,6 +187,52 @@ def test_submit_replay(client, monkeypatch):
     assert resp.get_json()["score"] == 2
 
 
+def test_submit_replay_forwards_evaluation_token(client, monkeypatch):
+    _login_session(client)
+    submit = MagicMock(return_value=ReplayAttemptModel(event_id="e1", score=0, total=1, answers=[]))
+    monkeypatch.setattr("backend.api.events.submit_replay", submit)
+    client.post("/api/events/e1/replay/submit", json={"answers": [], "evaluation_token": "tok", "attempt_id": "a1"})
+    assert submit.call_args.kwargs["evaluation_token"] == "tok"
+    assert submit.call_args.kwargs["attempt_id"] == "a1"
+
+
+def test_grade_replay_answer(client, monkeypatch):
+    monkeypatch.setattr("backend.api.events.get_event", MagicMock(return_value=_sample_event()))
+    monkeypatch.setattr("backend.api.events.can_see_event", MagicMock(return_value=True))
+    grade = MagicMock(return_value=True)
+    monkeypatch.setattr("backend.api.events.grade_replay_answer", grade)
+    resp = client.post("/api/events/e1/replay/grade", json={"attempt_id": "a1", "question_id": "q1", "answer": "A"})
+    assert resp.status_code == 202
+    assert resp.get_json() == {"graded": True}
+    grade.assert_called_once_with("e1", "a1", "q1", "A")
+
+
+def test_grade_replay_answer_validates_body(client, monkeypatch):
+    monkeypatch.setattr("backend.api.events.get_event", MagicMock(return_value=_sample_event()))
+    monkeypatch.setattr("backend.api.events.can_see_event", MagicMock(return_value=True))
+    grade = MagicMock(return_value=None)
+    monkeypatch.setattr("backend.api.events.grade_replay_answer", grade)
+    assert client.post("/api/events/e1/replay/grade", json={"question_id": "q1"}).status_code == 400
+    assert client.post("/api/events/e1/replay/grade", json={"attempt_id": "a1", "answer": "A"}).status_code == 400
+    resp = client.post("/api/events/e1/replay/grade", json={"attempt_id": "a1", "question_id": "q9", "answer": "A"})
+    assert resp.status_code == 404
+    grade.side_effect = ValueError("Invalid or expired replay attempt")
+    resp = client.post("/api/events/e1/replay/grade", json={"attempt_id": "forged", "question_id": "q1", "answer": "A"})
+    assert resp.status_code == 400
+
+
+def test_grade_replay_answer_is_rate_limited(client, monkeypatch):
+    from backend.utils.rate_limit import RateLimiter
+    monkeypatch.setattr("backend.api.events.replay_grade_limiter", RateLimiter(max_calls=2, window_seconds=60))
+    monkeypatch.setattr("backend.api.events.get_event", MagicMock(return_value=_sample_event()))
+    monkeypatch.setattr("backend.api.events.can_see_event", MagicMock(return_value=True))
+    grade = MagicMock(return_value=True)
+    monkeypatch.setattr("backend.api.events.grade_replay_answer", grade)
+    body = {"attempt_id": "a1", "question_id": "q1", "answer": "A"}
+    assert [client.post("/api/events/e1/replay/grade", json=body).status_code for _ in range(3)] == [202, 202, 429]
+    assert grade.call_count == 2
+
+
 def test_evaluate_replay(client, monkeypatch):
     event = _sample_event()
     monkeypatch.setattr("backend.api.events.get_event", MagicMock(return_value=event))
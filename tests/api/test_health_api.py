@@ -0,0 +1,21 @@
+from flask import Flask
+from unittest.mock import MagicMock
+
+from backend.api.health import health_bp
+
+
+def test_health_reports_evaluator_state(monkeypatch):
+    evaluator = MagicMock()
+    evaluator.stats.return_value = {"hits": 3, "misses": 1}
+    evaluator.inner.stats.return_value = {"llm": {"breaker": {"state": "open"}}}
+    monkeypatch.setattr("backend.api.health.get_answer_evaluator", lambda: evaluator)
+    app = Flask(__name__)
+    app.register_blueprint(health_bp)
+
+    resp = app.test_client().get("/health")
+
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["status"] == "ok"
+    assert body["eval_cache"] == {"hits": 3, "misses": 1}
+    assert body["llm_breaker"] == {"state": "open"}
@@ -0,0 +1,253 @@
+import json
+from contextlib import nullcontext
+
+import pytest
+from flask import Flask
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from backend.api.live import live_bp
+from backend.models.live import LiveSessionModel
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(live_bp)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def live_session():
+    return LiveSessionModel(event_id="e1", join_code="ABC123", created_by="host")
+
+
+@pytest.fixture(autouse=True)
+def fast_stream(monkeypatch):
+    monkeypatch.setattr("backend.api.live.watch_session", lambda _session_id: nullcontext())
+    monkeypatch.setattr("backend.api.live._open_streams", 0)
+    monkeypatch.setattr("backend.api.live.get_settings", lambda: SimpleNamespace(
+        live_stream_max_seconds=30, live_stream_max_concurrent=2,
+    ))
+
+
+def _events(body: str) -> list[tuple[str, str]]:
+    """Parse an SSE body into (event, data) pairs, skipping comments/retry."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines()
+            if ": " in line and not line.startswith(":")
+        )
+        if "event" in fields:
+            events.append((fields["event"], fields.get("data", "")))
+    return events
+
+
+def test_stream_not_found(client, monkeypatch):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=None))
+    resp = client.get("/api/live/missing/stream")
+    assert resp.status_code == 404
+
+
+def test_stream_emits_state_only_on_version_change(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    # Version 1 seen twice (idle tick), then 2, then the session disappears.
+    monkeypatch.setattr("backend.api.live.wait_for_session_version", MagicMock(side_effect=[1, 1, 2, None]))
+    get_state = MagicMock(side_effect=lambda *a, **kw: {"version": "v"})
+    monkeypatch.setattr("backend.api.live.get_session_state", get_state)
+
+    resp = client.get(f"/api/live/{live_session.session_id}/stream")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+
+    body = resp.get_data(as_text=True)
+    events = _events(body)
+    assert [name for name, _ in events] == ["state", "state", "end"]
+    assert ": keepalive" in body
+    assert json.loads(events[0][1]) == {"version": "v"}
+    assert get_state.call_count == 2
+
+
+def test_stream_skips_state_already_seen(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.wait_for_session_version", MagicMock(side_effect=[5, None]))
+    get_state = MagicMock(return_value={})
+    monkeypatch.setattr("backend.api.live.get_session_state", get_state)
+
+    resp = client.get(
+        f"/api/live/{live_session.session_id}/stream",
+        headers={"Last-Event-ID": "5"},
+    )
+    assert [name for name, _ in _events(resp.get_data(as_text=True))] == ["end"]
+    get_state.assert_not_called()
+
+
+def test_stream_uses_presenter_view(client, monkeypatch, live_session):
+    with client.session_transaction() as sess:
+        sess["logged_in"] = True
+        sess["username"] = "host"
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    versions = MagicMock(side_effect=[1, None])
+    monkeypatch.setattr("backend.api.live.wait_for_session_version", versions)
+    get_state = MagicMock(return_value={})
+    monkeypatch.setattr("backend.api.live.get_session_state", get_state)
+
+    client.get(f"/api/live/{live_session.session_id}/stream").get_data()
+    get_state.assert_called_once_with(live_session.session_id, participant_id=None, is_presenter=True)
+    # Only the presenter's stream is woken by new answers
+    assert versions.call_args.kwargs["include_answers"] is True
+
+
+def test_player_stream_ignores_answer_changes(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    versions = MagicMock(side_effect=[1, None])
+    monkeypatch.setattr("backend.api.live.wait_for_session_version", versions)
+    monkeypatch.setattr("backend.api.live.get_session_state", MagicMock(return_value={}))
+
+    client.get(f"/api/live/{live_session.session_id}/stream").get_data()
+    assert versions.call_args.kwargs["include_answers"] is False
+
+
+def test_streams_beyond_the_cap_are_refused_until_one_closes(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.wait_for_session_version", MagicMock(return_value=None))
+    url = f"/api/live/{live_session.session_id}/stream"
+
+    first = client.get(url, buffered=False)
+    second = client.get(url, buffered=False)
+    refused = client.get(url)
+    assert (first.status_code, second.status_code, refused.status_code) == (200, 200, 503)
+    assert refused.headers["Retry-After"]
+
+    first.close()
+    again = client.get(url, buffered=False)
+    assert again.status_code == 200
+    second.close()
+    again.close()
+
+
+def test_player_state_etag_ignores_other_answers(client, monkeypatch, live_session):
+    with client.session_transaction() as sess:
+        sess["live_participant_id"] = "p1"
+        sess["live_session_id"] = live_session.session_id
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    versions = MagicMock(return_value=3)
+    monkeypatch.setattr("backend.api.live.get_session_version", versions)
+    monkeypatch.setattr("backend.api.live.get_session_state", lambda *a, **kw: {"version": 3})
+
+    client.get(f"/api/live/{live_session.session_id}/state")
+    assert versions.call_args.kwargs == {"include_answers": False}
+
+    with client.session_transaction() as sess:
+        sess["logged_in"] = True
+        sess["username"] = "host"
+    client.get(f"/api/live/{live_session.session_id}/state")
+    assert versions.call_args.kwargs == {"include_answers": True}
+
+
+def test_own_answer_changes_player_state_etag(client, monkeypatch, live_session):
+    with client.session_transaction() as sess:
+        sess["live_participant_id"] = "p1"
+        sess["live_session_id"] = live_session.session_id
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.get_session_version", MagicMock(return_value=3))
+    monkeypatch.setattr("backend.api.live.get_session_state", lambda *a, **kw: {"version": 3})
+    monkeypatch.setattr("backend.api.live.submit_answer", MagicMock(return_value=MagicMock(
+        model_dump=lambda **kw: {"answer_text": "Paris"})))
+
+    etag = client.get(f"/api/live/{live_session.session_id}/state").headers["ETag"]
+    resp = client.post(f"/api/live/{live_session.session_id}/answer",
+                       json={"question_index": 0, "answer_text": "Paris"})
+    assert resp.status_code == 200
+
+    resp = client.get(f"/api/live/{live_session.session_id}/state", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+
+
+def test_state_sets_etag_and_answers_304(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.get_session_version", MagicMock(return_value=3))
+    get_state = MagicMock(return_value={"version": 3, "status": "lobby"})
+    monkeypatch.setattr("backend.api.live.get_session_state", get_state)
+
+    resp = client.get(f"/api/live/{live_session.session_id}/state")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+    assert etag
+
+    resp = client.get(f"/api/live/{live_session.session_id}/state", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert get_state.call_count == 1
+
+
+def test_state_etag_changes_with_version(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    versions = MagicMock(return_value=3)
+    monkeypatch.setattr("backend.api.live.get_session_version", versions)
+    monkeypatch.setattr("backend.api.live.get_session_state", lambda *a, **kw: {"version": versions.return_value})
+
+    etag = client.get(f"/api/live/{live_session.session_id}/state").headers["ETag"]
+    versions.return_value = 4
+    resp = client.get(f"/api/live/{live_session.session_id}/state", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_state_etag_differs_per_viewer(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.get_session_version", MagicMock(return_value=1))
+    monkeypatch.setattr("backend.api.live.get_session_state", lambda *a, **kw: {"version": 1})
+
+    anonymous_etag = client.get(f"/api/live/{live_session.session_id}/state").headers["ETag"]
+    with client.session_transaction() as sess:
+        sess["logged_in"] = True
+        sess["username"] = "host"
+    resp = client.get(f"/api/live/{live_session.session_id}/state", headers={"If-None-Match": anonymous_etag})
+    assert resp.status_code == 200
+
+
+def test_state_not_found(client, monkeypatch):
+    monkeypatch.setattr("backend.api.live.get_session_version", MagicMock(return_value=None))
+    resp = client.get("/api/live/missing/state")
+    assert resp.status_code == 404
+
+
+def test_leaderboard_top_n_and_own_rank(client, monkeypatch, live_session):
+    with client.session_transaction() as sess:
+        sess["live_participant_id"] = "p7"
+        sess["live_session_id"] = live_session.session_id
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    board = MagicMock(return_value=[{"participant_id": "p1", "display_name": "A", "score": 5}])
+    monkeypatch.setattr("backend.api.live.get_leaderboard", board)
+    rank = MagicMock(return_value={"rank": 7, "score": 1})
+    monkeypatch.setattr("backend.api.live.get_participant_rank", rank)
+
+    resp = client.get(f"/api/live/{live_session.session_id}/leaderboard?limit=3")
+
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "leaderboard": [{"participant_id": "p1", "display_name": "A", "score": 5}],
+        "me": {"rank": 7, "score": 1},
+    }
+    board.assert_called_once_with(live_session.session_id, limit=3)
+    rank.assert_called_once_with(live_session.session_id, "p7")
+
+
+def test_leaderboard_anonymous_has_no_rank(client, monkeypatch, live_session):
+    monkeypatch.setattr("backend.api.live.get_live_session", MagicMock(return_value=live_session))
+    monkeypatch.setattr("backend.api.live.get_leaderboard", MagicMock(return_value=[]))
+    rank = MagicMock()
+    monkeypatch.setattr("backend.api.live.get_participant_rank", rank)
+
+    resp = client.get(f"/api/live/{live_session.session_id}/leaderboard")
+
+    assert resp.get_json()["me"] is None
+    rank.assert_not_called()
+    assert client.get(f"/api/live/{live_session.session_id}/leaderboard?limit=0").status_code == 400
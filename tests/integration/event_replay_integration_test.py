@@ -62,6 +62,9 @@ class MemoryQuestionStore:
     def get_by_id(self, qid: str):
         return self._data.get(qid)
 
+    def get_many(self, qids: list[str]):
+        return {qid: self._data[qid] for qid in qids if qid in self._data}
+
     def update(self, qid: str, updates: dict, **_kw):
         q = self._data.get(qid)
         if not q:
@@ -69,6 +72,17 @@ class MemoryQuestionStore:
         self._data[qid] = q.model_copy(update=updates)
         return self._data[qid]
 
+    def increment_stats(self, results: list[tuple[str, bool]]) -> int:
+        for qid, is_correct in results:
+            q = self._data.get(qid)
+            if q:
+                field = "times_correct" if is_correct else "times_incorrect"
+                self._data[qid] = q.model_copy(update={
+                    "times_asked": q.times_asked + 1,
+                    field: getattr(q, field) + 1,
+                })
+        return len(results)
+
     def delete(self, qid: str) -> bool:
         return self._data.pop(qid, None) is not None
 
@@ -76,6 +90,7 @@ class MemoryQuestionStore:
 class MemoryReplayStore:
     def __init__(self):
         self._data: list[ReplayAttemptModel] = []
+        self._attempt_results: dict[tuple[str, str], tuple[str, str, dict]] = {}
 
     def save(self, replay: ReplayAttemptModel) -> bool:
         self._data.append(replay)
@@ -94,6 +109,26 @@ class MemoryReplayStore:
         matching = [r for r in self._data if r.event_id == event_id]
         return sorted(matching, key=lambda r: r.score, reverse=True)[:limit]
 
+    def save_attempt_result(self, attempt_id, event_id, question_id, result_key, result):
+        self._attempt_results[(attempt_id, question_id)] = (event_id, result_key, result)
+        return True
+
+    def get_attempt_results(self, attempt_id, event_id):
+        return {
+            key: result
+            for (attempt, _), (event, key, result) in self._attempt_results.items()
+            if attempt == attempt_id and event == event_id
+        }
+
+    def delete_attempt_results(self, attempt_id):
+        keys = [k for k in self._attempt_results if k[0] == attempt_id]
+        for k in keys:
+            del self._attempt_results[k]
+        return len(keys)
+
+    def delete_idle_attempt_results(self, before):
+        return 0
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -264,6 +299,61 @@ class TestFullReplayFlow:
         assert resp.get_json()["score"] == 0
 
 
+class TestBackgroundGrading:
+    """Answers graded during play are reused by submit."""
+
+    def test_graded_answers_are_assembled_on_submit(self, client, stores, monkeypatch):
+        _login(client)
+        qids, _ = _seed_questions(stores["question"])
+        resp = client.post("/api/events/", json={"name": "Background"})
+        event_id = resp.get_json()["event_id"]
+        client.post(f"/api/events/{event_id}/questions", json={"question_ids": qids[:2]})
+
+        attempt_id = client.post(f"/api/events/{event_id}/replay").get_json()["attempt_id"]
+        for qid, answer in ((qids[0], "Paris"), (qids[1], "Leonardo da Vinci")):
+            resp = client.post(f"/api/events/{event_id}/replay/grade", json={
+                "attempt_id": attempt_id, "question_id": qid, "answer": answer,
+            })
+            assert resp.status_code == 202
+            # Correctness stays hidden until the review
+            assert resp.get_json() == {"graded": True}
+
+        from backend.services import replay_service
+        batch = MagicMock(side_effect=AssertionError("already graded"))
+        monkeypatch.setattr(replay_service._evaluator, "evaluate_batch", batch)
+
+        resp = client.post(f"/api/events/{event_id}/replay/submit", json={
+            "attempt_id": attempt_id,
+            "answers": [
+                {"question_id": qids[0], "answer": "Paris"},
+                {"question_id": qids[1], "answer": "Leonardo da Vinci"},
+            ],
+        })
+        assert resp.status_code == 201
+        assert resp.get_json()["score"] == 2
+        batch.assert_not_called()
+        assert stores["replay"]._attempt_results == {}
+
+    def test_grade_rejects_questions_outside_the_event(self, client, stores):
+        _login(client)
+        qids, _ = _seed_questions(stores["question"])
+        resp = client.post("/api/events/", json={"name": "Background 2"})
+        event_id = resp.get_json()["event_id"]
+        client.post(f"/api/events/{event_id}/questions", json={"question_ids": qids[:1]})
+
+        attempt_id = client.post(f"/api/events/{event_id}/replay").get_json()["attempt_id"]
+        resp = client.post(f"/api/events/{event_id}/replay/grade", json={
+            "attempt_id": attempt_id, "question_id": qids[2], "answer": "Au",
+        })
+        assert resp.status_code == 404
+        resp = client.post(f"/api/events/{event_id}/replay/grade", json={
+            "attempt_id": "made-up", "question_id": qids[0], "answer": "Paris",
+        })
+        assert resp.status_code == 400
+        resp = client.post(f"/api/events/{event_id}/replay/grade", json={"question_id": qids[0], "answer": "Paris"})
+        assert resp.status_code == 400
+
+
 class TestReplayOverrides:
     """Manual override through the full stack."""
 
@@ -16,7 +16,11 @@ from backend.services.question_service import (
     create_question,
     update_question,
     delete_question,
-    get_random_question_filtered
+    get_random_question_filtered,
+    create_play_deck,
+    draw_from_deck,
+    get_question_metadata,
+    invalidate_question_metadata,
 )
 from backend.models.question import QuestionModel
 from unittest.mock import MagicMock
@@ -48,10 +52,14 @@ def sample_question_data():
 def mock_stores(monkeypatch):
     question_store = MagicMock()
     media_store = MagicMock()
+    deck_store = MagicMock()
     question_store.get_by_id.return_value = None
     monkeypatch.setattr("backend.services.question_service.get_question_store", lambda: question_store)
     monkeypatch.setattr("backend.services.question_service.get_media_store", lambda: media_store)
-    return SimpleNamespace(question_store=question_store, media_store=media_store)
+    monkeypatch.setattr("backend.services.question_service.get_deck_store", lambda: deck_store)
+    invalidate_question_metadata()
+    monkeypatch.setattr("backend.services.question_service._last_deck_purge", float("-inf"))
+    return SimpleNamespace(question_store=question_store, media_store=media_store, deck_store=deck_store)
 
 def test_get_question_by_id(mock_stores, sample_question):
     """Test fetching a question by ID, where the ID is a uuid. It is automatically generated when the question is created."""
@@ -82,6 +90,27 @@ def test_get_all_questions_with_filters(mock_stores, sample_question):
     assert len(questions) == 1
     assert questions[0].model_dump() == sample_question.model_dump()
 
+def test_get_all_questions_follows_cursor(mock_stores, sample_question):
+    """Offset positions the first page only; the returned cursor drives the rest."""
+    cursor = {"added_at": "2026-01-01T00:00:00", "question_id": "q1"}
+    mock_stores.question_store.list.return_value = ([sample_question], cursor)
+    questions, token = get_all_questions(limit=1, offset=5, include_token=True)
+    assert len(questions) == 1
+    mock_stores.question_store.list.assert_called_once_with(None, limit=1, last_key=None, offset=5)
+
+    mock_stores.question_store.list.reset_mock()
+    get_all_questions(limit=1, offset=5, page_token=token)
+    mock_stores.question_store.list.assert_called_once_with(None, limit=1, last_key=cursor, offset=0)
+
+def test_get_all_questions_rejects_foreign_cursors(mock_stores):
+    """Old offset tokens and garbage fail loudly instead of restarting at page 1."""
+    from base64 import urlsafe_b64encode
+    legacy = urlsafe_b64encode(b'{"offset": 100}').decode()
+    for token in (legacy, "not-a-token"):
+        with pytest.raises(ValueError):
+            get_all_questions(limit=1, page_token=token)
+    mock_stores.question_store.list.assert_not_called()
+
 def test_create_question(mock_stores, sample_question_data):
     """Test creating a new question."""
     mock_stores.question_store.add.return_value = True
@@ -250,3 +279,123 @@ def test_get_random_question_filtered_no_results(mock_stores):
     mock_stores.question_store.random_reviewed.return_value = None
     result = get_random_question_filtered(["some-id"], {})
     assert result is None
+
+def test_create_play_deck_shuffles_reviewed_ids(mock_stores):
+    ids = [f"q{i}" for i in range(20)]
+    mock_stores.question_store.list_ids.return_value = list(ids)
+    mock_stores.deck_store.create.return_value = True
+
+    deck = create_play_deck({"language": "english"})
+
+    assert sorted(deck.question_ids) == sorted(ids)
+    assert deck.filters == {"language": "english", "review_status": True}
+    mock_stores.question_store.list_ids.assert_called_once()
+    assert mock_stores.question_store.list_ids.call_args.args[0] == {"language": "english", "review_status": True}
+    mock_stores.deck_store.delete_idle.assert_called_once()
+    mock_stores.deck_store.create.assert_called_once_with(deck)
+
+def test_create_play_deck_replaces_previous_and_throttles_purge(mock_stores):
+    mock_stores.question_store.list_ids.return_value = ["q1", "q2"]
+    mock_stores.deck_store.create.return_value = True
+
+    create_play_deck({}, replaces="deck-0")
+    create_play_deck({})
+
+    mock_stores.deck_store.delete.assert_called_once_with("deck-0")
+    mock_stores.deck_store.delete_idle.assert_called_once()
+
+def test_create_play_deck_no_matches(mock_stores):
+    mock_stores.question_store.list_ids.return_value = []
+    assert create_play_deck({}) is None
+    mock_stores.deck_store.create.assert_not_called()
+
+def test_draw_from_deck_advances_cursor(mock_stores, sample_question):
+    sample_question.review_status = True
+    mock_stores.deck_store.draw.return_value = ([sample_question.question_id], 3)
+    mock_stores.question_store.get_many.return_value = {sample_question.question_id: sample_question}
+
+    questions, next_cursor = draw_from_deck("deck-1", cursor=1)
+
+    assert questions == [sample_question]
+    assert next_cursor == 2
+    args = mock_stores.deck_store.draw.call_args.args
+    assert args[:3] == ("deck-1", 1, 1)
+
+def test_draw_from_deck_last_card_ends_deck(mock_stores, sample_question):
+    sample_question.review_status = True
+    mock_stores.deck_store.draw.return_value = ([sample_question.question_id], 3)
+    mock_stores.question_store.get_many.return_value = {sample_question.question_id: sample_question}
+    _, next_cursor = draw_from_deck("deck-1", cursor=2)
+    assert next_cursor is None
+
+def test_draw_from_deck_skips_removed_questions(mock_stores, sample_question):
+    """A deleted or unreviewed card is skipped by drawing further along the deck."""
+    sample_question.review_status = True
+    mock_stores.deck_store.draw.side_effect = [(["gone"], 5), ([sample_question.question_id], 5)]
+    mock_stores.question_store.get_many.side_effect = [{}, {sample_question.question_id: sample_question}]
+
+    questions, next_cursor = draw_from_deck("deck-1", cursor=0)
+
+    assert questions == [sample_question]
+    assert next_cursor == 2
+    assert [c.args[1] for c in mock_stores.deck_store.draw.call_args_list] == [0, 1]
+
+def test_draw_from_deck_expired(mock_stores):
+    mock_stores.deck_store.draw.return_value = None
+    assert draw_from_deck("deck-1") is None
+
+def test_get_question_metadata_uses_store_facets(mock_stores):
+    mock_stores.question_store.facet_counts.return_value = {
+        "languages": {"german": 1, "english": 4},
+        "topics": {"history": 5},
+        "tags": {"war": 2, "art": 1},
+    }
+
+    metadata = get_question_metadata()
+
+    assert metadata["languages"] == ["english", "german"]
+    assert metadata["topics"] == ["history"]
+    assert metadata["tags"] == ["art", "war"]
+    assert metadata["counts"]["languages"] == {"german": 1, "english": 4}
+    mock_stores.question_store.facet_counts.assert_called_once_with({"review_status": True})
+    mock_stores.question_store.list.assert_not_called()
+
+def test_get_question_metadata_is_cached_until_write(mock_stores, sample_question_data):
+    mock_stores.question_store.facet_counts.return_value = {"languages": {}, "topics": {}, "tags": {}}
+    get_question_metadata()
+    get_question_metadata()
+    assert mock_stores.question_store.facet_counts.call_count == 1
+
+    mock_stores.question_store.add.return_value = True
+    create_question(sample_question_data)
+    get_question_metadata()
+    assert mock_stores.question_store.facet_counts.call_count == 2
+
+def test_get_question_metadata_invalidated_by_update_and_delete(mock_stores, sample_question):
+    mock_stores.question_store.facet_counts.return_value = {"languages": {}, "topics": {}, "tags": {}}
+    get_question_metadata()
+
+    mock_stores.question_store.update.return_value = sample_question
+    update_question(sample_question.question_id, {"review_status": True})
+    get_question_metadata()
+    assert mock_stores.question_store.facet_counts.call_count == 2
+
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    mock_stores.question_store.delete.return_value = True
+    delete_question(sample_question.question_id)
+    get_question_metadata()
+    assert mock_stores.question_store.facet_counts.call_count == 3
+
+
+def test_update_question_answer_invalidates_evaluation_cache(mock_stores, sample_question, monkeypatch):
+    evaluator = MagicMock()
+    monkeypatch.setattr("backend.services.question_service.get_answer_evaluator", lambda: evaluator)
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    mock_stores.question_store.update.return_value = sample_question
+
+    update_question(sample_question.question_id, {"answer": "New answer"})
+    evaluator.invalidate.assert_called_once_with("Sample question?", "Sample answer", "english")
+
+    evaluator.reset_mock()
+    update_question(sample_question.question_id, {"tags": ["other"]})
+    evaluator.invalidate.assert_not_called()
@@ -110,7 +110,7 @@ def test_delete_event_cascade(mock_stores, sample_event, sample_question):
     sample_question_with_media = sample_question.model_copy(update={"media_path": "some/path"})
     mock_stores.event_store.get_by_id.return_value = sample_event
     mock_stores.event_store.delete.return_value = True
-    mock_stores.question_store.get_by_id.return_value = sample_question_with_media
+    mock_stores.question_store.get_many.return_value = {sample_question.question_id: sample_question_with_media}
 
     assert delete_event(sample_event.event_id, "alice", "user", delete_questions=True) is True
     mock_stores.question_store.delete.assert_called_once_with(sample_question.question_id)
@@ -120,6 +120,7 @@ def test_delete_event_cascade(mock_stores, sample_event, sample_question):
 def test_add_question_to_event(mock_stores, sample_event, sample_question):
     mock_stores.event_store.get_by_id.return_value = sample_event
     mock_stores.question_store.get_by_id.return_value = sample_question
+    mock_stores.question_store.get_many.return_value = {sample_question.question_id: sample_question}
     assert add_question_to_event(sample_event.event_id, sample_question.question_id) is True
     mock_stores.event_store.update.assert_called_once()
     mock_stores.question_store.update.assert_called_once()
@@ -135,6 +136,7 @@ def test_remove_question_from_event(mock_stores, sample_event, sample_question):
     sample_question = sample_question.model_copy(update={"event_id": sample_event.event_id})
     mock_stores.event_store.get_by_id.return_value = sample_event
     mock_stores.question_store.get_by_id.return_value = sample_question
+    mock_stores.question_store.get_many.return_value = {}
     assert remove_question_from_event(sample_event.event_id, sample_question.question_id) is True
     mock_stores.event_store.update.assert_called_once()
     mock_stores.question_store.update.assert_called_once()
@@ -155,7 +157,18 @@ def test_reorder_event_questions_invalid(mock_stores, sample_event):
 def test_get_event_questions(mock_stores, sample_event, sample_question):
     sample_event = sample_event.model_copy(update={"question_ids": [sample_question.question_id]})
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.return_value = sample_question
+    mock_stores.question_store.get_many.return_value = {sample_question.question_id: sample_question}
     questions = get_event_questions(sample_event.event_id)
     assert len(questions) == 1
     assert questions[0].question_id == sample_question.question_id
+
+
+def test_get_event_questions_preserves_event_order(mock_stores, sample_event):
+    q1 = QuestionModel(question_id="q1", question="Q1?", answer="A", added_by="alice")
+    q2 = QuestionModel(question_id="q2", question="Q2?", answer="B", added_by="alice")
+    sample_event = sample_event.model_copy(update={"question_ids": ["q2", "missing", "q1"]})
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.return_value = {"q1": q1, "q2": q2}
+    questions = get_event_questions(sample_event.event_id)
+    assert [q.question_id for q in questions] == ["q2", "q1"]
+    mock_stores.question_store.get_many.assert_called_once_with(["q2", "missing", "q1"])
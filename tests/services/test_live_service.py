@@ -0,0 +1,334 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+from types import SimpleNamespace
+
+from backend.services import live_service
+from backend.services.live_service import get_session_state
+from backend.models.event import EventModel
+from backend.models.live import LiveAnswerModel, LiveParticipantModel, LiveSessionModel
+from backend.models.question import QuestionModel
+from backend.utils.answer_eval import question_hash
+
+
+@pytest.fixture
+def sample_question():
+    return QuestionModel(question_id="q1", question="Capital of France?", answer="Paris", added_by="host")
+
+
+@pytest.fixture
+def sample_event(sample_question):
+    return EventModel(name="Quiz Night", created_by="host", question_ids=[sample_question.question_id])
+
+
+@pytest.fixture
+def sample_session(sample_event):
+    return LiveSessionModel(
+        event_id=sample_event.event_id,
+        join_code="ABC123",
+        created_by="host",
+        current_question_index=0,
+        status="active",
+        version=1,
+    )
+
+
+@pytest.fixture
+def participants(sample_session):
+    return [
+        LiveParticipantModel(participant_id="p1", session_id=sample_session.session_id, display_name="Team A"),
+        LiveParticipantModel(participant_id="p2", session_id=sample_session.session_id, display_name="Team B"),
+    ]
+
+
+@pytest.fixture
+def mock_stores(monkeypatch, sample_session, sample_event, sample_question, participants):
+    live_service.clear_snapshot_cache()
+    live_store = MagicMock()
+    event_store = MagicMock()
+    question_store = MagicMock()
+    media_store = MagicMock()
+    live_store.get_session_versions.return_value = (sample_session.version, 0)
+    live_store.get_session.return_value = sample_session
+    live_store.get_participants.return_value = participants
+    live_store.get_leaderboard.return_value = participants
+    live_store.get_answers.return_value = [
+        LiveAnswerModel(session_id=sample_session.session_id, participant_id="p1",
+                        question_index=0, answer_text="Paris"),
+    ]
+    event_store.get_by_id.return_value = sample_event
+    question_store.get_many.return_value = {sample_question.question_id: sample_question}
+    monkeypatch.setattr("backend.services.live_service.get_live_store", lambda: live_store)
+    monkeypatch.setattr("backend.services.live_service.get_event_store", lambda: event_store)
+    monkeypatch.setattr("backend.services.live_service.get_question_store", lambda: question_store)
+    monkeypatch.setattr("backend.services.live_service.get_media_store", lambda: media_store)
+    yield SimpleNamespace(live_store=live_store, event_store=event_store, question_store=question_store)
+    live_service.clear_snapshot_cache()
+
+
+def test_state_is_built_once_per_version(mock_stores, sample_session):
+    get_session_state(sample_session.session_id, participant_id="p1")
+    get_session_state(sample_session.session_id, participant_id="p2")
+    get_session_state(sample_session.session_id, is_presenter=True)
+    assert mock_stores.live_store.get_session.call_count == 1
+    assert mock_stores.live_store.get_answers.call_count == 1
+
+    mock_stores.live_store.get_session_versions.return_value = (2, 0)
+    mock_stores.live_store.get_session.return_value = sample_session.model_copy(update={"version": 2})
+    state = get_session_state(sample_session.session_id)
+    assert state["version"] == 2
+    assert mock_stores.live_store.get_session.call_count == 2
+
+    # A new answer rebuilds the snapshot too, without changing the public version
+    mock_stores.live_store.get_session_versions.return_value = (2, 1)
+    mock_stores.live_store.get_session.return_value = sample_session.model_copy(
+        update={"version": 2, "answers_version": 1})
+    presenter = get_session_state(sample_session.session_id, is_presenter=True)
+    assert presenter["version"] == 2
+    assert mock_stores.live_store.get_session.call_count == 3
+
+
+def test_answers_only_move_the_presenter_version(mock_stores, sample_session):
+    mock_stores.live_store.get_session_versions.return_value = (4, 3)
+    assert live_service.get_session_version(sample_session.session_id) == 4
+    assert live_service.get_session_version(sample_session.session_id, include_answers=True) == 7
+
+    mock_stores.live_store.get_session_versions.return_value = None
+    assert live_service.get_session_version(sample_session.session_id, include_answers=True) is None
+
+
+def test_version_watcher_wakes_every_stream_from_one_lookup(mock_stores, sample_session):
+    watcher = live_service._VersionWatcher(poll_seconds=0.01)
+    session_id = sample_session.session_id
+    lookups = mock_stores.live_store.get_session_versions
+    lookups.return_value = (1, 0)
+    woken = []
+
+    with watcher.watch(session_id), watcher.watch(session_id):
+        assert lookups.call_count == 1
+        assert watcher.wait(session_id, None, False, timeout=1) == 1
+        streams = [
+            threading.Thread(target=lambda: woken.append(watcher.wait(session_id, 1, False, timeout=5)))
+            for _ in range(5)
+        ]
+        for stream in streams:
+            stream.start()
+        lookups.return_value = (2, 0)
+        for stream in streams:
+            stream.join()
+        polls = lookups.call_count
+
+    assert woken == [2] * 5
+    # One lookup per poll for the session, not one per stream
+    assert polls < 5 * len(streams)
+    deadline = time.monotonic() + 1
+    while watcher._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert watcher._thread is None
+
+
+def test_version_watcher_answers_only_wake_presenters(mock_stores, sample_session):
+    watcher = live_service._VersionWatcher(poll_seconds=0.01)
+    session_id = sample_session.session_id
+    mock_stores.live_store.get_session_versions.return_value = (2, 1)
+
+    with watcher.watch(session_id):
+        assert watcher.wait(session_id, 2, False, timeout=0.05) == 2
+        assert watcher.wait(session_id, 2, True, timeout=5) == 3
+        mock_stores.live_store.get_session_versions.return_value = None
+        assert watcher.wait(session_id, 2, False, timeout=5) is None
+
+
+def test_submit_answer_bumps_answers_version_only(mock_stores, sample_session, monkeypatch):
+    monkeypatch.setattr(live_service, "get_settings", lambda: SimpleNamespace(live_speculative_eval=False))
+    active = sample_session.model_copy(update={"status": "active", "current_question_index": 0})
+    mock_stores.live_store.get_session.return_value = active
+    mock_stores.live_store.save_answer.return_value = True
+
+    assert live_service.submit_answer(active.session_id, "p1", 0, "Paris")
+
+    mock_stores.live_store.bump_answers_version.assert_called_once_with(active.session_id)
+    mock_stores.live_store.bump_session_version.assert_not_called()
+
+
+def test_state_views_per_viewer(mock_stores, sample_session):
+    player = get_session_state(sample_session.session_id, participant_id="p1")
+    assert player["current_question"]["question"] is None  # hidden on devices
+    assert player["my_answers"] == {"0": {"answer_text": "Paris", "is_locked": False}}
+    assert "current_answers" not in player
+
+    other = get_session_state(sample_session.session_id, participant_id="p2")
+    assert other["my_answers"] == {}
+
+    presenter = get_session_state(sample_session.session_id, is_presenter=True)
+    assert presenter["current_question"]["question"] == "Capital of France?"
+    assert presenter["answer_counts"] == {"0": 1}
+    assert presenter["current_answers"][0]["display_name"] == "Team A"
+    assert "my_answers" not in presenter
+
+
+def test_state_missing_session(mock_stores):
+    mock_stores.live_store.get_session_versions.return_value = None
+    assert get_session_state("missing") is None
+
+
+def test_reveal_writes_all_evaluations_in_one_call(mock_stores, sample_session, sample_question, monkeypatch):
+    from backend.utils.answer_eval import EvalResult
+
+    answers = [
+        LiveAnswerModel(answer_id="a1", session_id=sample_session.session_id, participant_id="p1",
+                        question_index=0, answer_text="Paris"),
+        LiveAnswerModel(answer_id="a2", session_id=sample_session.session_id, participant_id="p2",
+                        question_index=0, answer_text="Lyon"),
+    ]
+    mock_stores.live_store.get_answers.return_value = answers
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    evaluator = MagicMock()
+    evaluator.evaluate_batch.return_value = [
+        EvalResult(is_correct=True, confidence=1.0, points_awarded=1, max_points=1),
+        EvalResult(is_correct=False, confidence=1.0, explanation="wrong city", points_awarded=0, max_points=1),
+    ]
+    monkeypatch.setattr(live_service, "_evaluator", evaluator)
+
+    result = live_service.reveal_question(sample_session.session_id, 0, "host")
+
+    assert result["results_count"] == 2
+    mock_stores.live_store.update_answer.assert_not_called()
+    mock_stores.live_store.apply_evaluations.assert_called_once_with(sample_session.session_id, 0, {
+        "a1": {"points_awarded": 1, "max_points": 1, "is_correct": True, "explanation": None},
+        "a2": {"points_awarded": 0, "max_points": 1, "is_correct": False, "explanation": "wrong city"},
+    })
+
+
+def test_state_leaderboard_comes_from_running_scores(mock_stores, sample_session, participants):
+    ranked = [
+        participants[1].model_copy(update={"score": 3}),
+        participants[0].model_copy(update={"score": 1}),
+    ]
+    mock_stores.live_store.get_leaderboard.return_value = ranked
+
+    state = get_session_state(sample_session.session_id, participant_id="p1")
+
+    assert [e["participant_id"] for e in state["leaderboard"]] == ["p2", "p1"]
+    assert state["my_rank"] == {"rank": 2, "score": 1}
+    # Participants stay in join order
+    assert [p["participant_id"] for p in state["participants"]] == ["p1", "p2"]
+    mock_stores.live_store.get_participants.assert_not_called()
+
+
+def test_override_refreshes_participant_score(mock_stores, sample_session):
+    answer = LiveAnswerModel(answer_id="a1", session_id=sample_session.session_id, participant_id="p1",
+                             question_index=0, answer_text="Paris", max_points=2)
+    mock_stores.live_store.update_answer.return_value = answer
+
+    live_service.override_answer_points(sample_session.session_id, "a1", 2, "host")
+
+    mock_stores.live_store.refresh_scores.assert_called_once_with(sample_session.session_id, ["p1"])
+    mock_stores.live_store.bump_session_version.assert_called_once_with(sample_session.session_id)
+
+
+def test_get_participant_rank(mock_stores, sample_session, participants):
+    mock_stores.live_store.get_participant.return_value = participants[0].model_copy(update={"score": 4})
+    mock_stores.live_store.get_participant_rank.return_value = 3
+
+    assert live_service.get_participant_rank(sample_session.session_id, "p1") == {"rank": 3, "score": 4}
+
+    mock_stores.live_store.get_participant.return_value = None
+    assert live_service.get_participant_rank(sample_session.session_id, "nope") is None
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+def test_submit_answer_evaluates_speculatively(mock_stores, sample_session, sample_question, monkeypatch):
+    from backend.utils.answer_eval import EvalResult
+
+    mock_stores.live_store.save_answer.return_value = True
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    evaluator = MagicMock()
+    evaluator.evaluate.return_value = EvalResult(
+        is_correct=True, confidence=1.0, explanation="Exact match", points_awarded=1, max_points=1
+    )
+    monkeypatch.setattr(live_service, "_evaluator", evaluator)
+    monkeypatch.setattr(live_service, "_eval_executor", lambda: _InlineExecutor())
+
+    answer = live_service.submit_answer(sample_session.session_id, "p1", 0, "paris")
+
+    assert answer is not None
+    evaluator.evaluate.assert_called_once_with("Capital of France?", "Paris", "paris", 1, None)
+    mock_stores.live_store.save_speculative_result.assert_called_once_with(
+        sample_session.session_id, "p1", 0, "paris",
+        {"points_awarded": 1, "max_points": 1, "is_correct": True, "explanation": "Exact match",
+         "question_hash": question_hash("Capital of France?", "Paris")},
+    )
+
+
+def test_submit_answer_does_not_cache_failed_llm_call(mock_stores, sample_session, sample_question, monkeypatch):
+    from backend.utils.answer_eval import EvalResult
+
+    mock_stores.live_store.save_answer.return_value = True
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    evaluator = MagicMock()
+    evaluator.evaluate.return_value = EvalResult(
+        is_correct=False, confidence=0.8, explanation="No match (20% similarity) (LLM fallback: call failed)",
+    )
+    monkeypatch.setattr(live_service, "_evaluator", evaluator)
+    monkeypatch.setattr(live_service, "_eval_executor", lambda: _InlineExecutor())
+
+    live_service.submit_answer(sample_session.session_id, "p1", 0, "Lyon")
+
+    mock_stores.live_store.save_speculative_result.assert_not_called()
+
+
+def test_reveal_publishes_precomputed_and_evaluates_stragglers(mock_stores, sample_session, sample_question, monkeypatch):
+    from backend.utils.answer_eval import EvalResult
+
+    precomputed = {"points_awarded": 1, "max_points": 1, "is_correct": True, "explanation": "Exact match"}
+    graded_now = {**precomputed, "question_hash": question_hash("Capital of France?", "Paris")}
+    answers = [
+        LiveAnswerModel(answer_id="a1", session_id=sample_session.session_id, participant_id="p1",
+                        question_index=0, answer_text="Paris", speculative_result=graded_now),
+        LiveAnswerModel(answer_id="a2", session_id=sample_session.session_id, participant_id="p2",
+                        question_index=0, answer_text="Lyon"),
+        # Graded against an older point value: re-evaluated
+        LiveAnswerModel(answer_id="a3", session_id=sample_session.session_id, participant_id="p3",
+                        question_index=0, answer_text="Paris",
+                        speculative_result={**graded_now, "points_awarded": 2, "max_points": 2}),
+        # Graded before the reference answer was edited: re-evaluated
+        LiveAnswerModel(answer_id="a4", session_id=sample_session.session_id, participant_id="p4",
+                        question_index=0, answer_text="Lyon",
+                        speculative_result={**precomputed, "question_hash": question_hash("Capital of France?", "Lyon")}),
+        # Stored before results carried a hash: re-evaluated
+        LiveAnswerModel(answer_id="a5", session_id=sample_session.session_id, participant_id="p5",
+                        question_index=0, answer_text="Paris", speculative_result=precomputed),
+    ]
+    mock_stores.live_store.get_answers.return_value = answers
+    mock_stores.question_store.get_by_id.return_value = sample_question
+    evaluator = MagicMock()
+    evaluator.evaluate_batch.return_value = [
+        EvalResult(is_correct=False, confidence=1.0, points_awarded=0, max_points=1),
+        EvalResult(is_correct=True, confidence=1.0, points_awarded=1, max_points=1),
+        EvalResult(is_correct=False, confidence=1.0, points_awarded=0, max_points=1),
+        EvalResult(is_correct=True, confidence=1.0, points_awarded=1, max_points=1),
+    ]
+    monkeypatch.setattr(live_service, "_evaluator", evaluator)
+
+    result = live_service.reveal_question(sample_session.session_id, 0, "host")
+
+    assert result["precomputed"] == 1
+    assert result["evaluated_on_demand"] == 4
+    evaluator.evaluate_batch.assert_called_once_with([
+        ("Capital of France?", "Paris", "Lyon", 1, None),
+        ("Capital of France?", "Paris", "Paris", 1, None),
+        ("Capital of France?", "Paris", "Lyon", 1, None),
+        ("Capital of France?", "Paris", "Paris", 1, None),
+    ])
+    evaluations = mock_stores.live_store.apply_evaluations.call_args.args[2]
+    assert evaluations["a1"] == precomputed
+    assert evaluations["a2"]["points_awarded"] == 0
+    assert evaluations["a3"]["points_awarded"] == 1
+    assert evaluations["a4"]["points_awarded"] == 0
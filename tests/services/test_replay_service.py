@@ -2,7 +2,10 @@ import pytest
 from unittest.mock import MagicMock
 from types import SimpleNamespace
 
+from backend.services import replay_service
 from backend.services.replay_service import (
+    evaluate_replay,
+    grade_replay_answer,
     start_replay,
     submit_replay,
     get_leaderboard,
@@ -11,6 +14,7 @@ from backend.services.replay_service import (
 from backend.models.event import EventModel
 from backend.models.question import QuestionModel
 from backend.models.replay import ReplayAttemptModel
+from backend.utils.answer_eval import SimpleEvaluator
 
 
 @pytest.fixture
@@ -41,16 +45,19 @@ def mock_stores(monkeypatch):
     monkeypatch.setattr("backend.services.replay_service.get_question_store", lambda: question_store)
     monkeypatch.setattr("backend.services.replay_service.get_replay_store", lambda: replay_store)
     monkeypatch.setattr("backend.services.replay_service.get_media_store", lambda: media_store)
+    monkeypatch.setattr("backend.services.replay_service._last_purge", float("-inf"))
     return SimpleNamespace(event_store=event_store, question_store=question_store, replay_store=replay_store, media_store=media_store)
 
 
 def test_start_replay(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
 
     result = start_replay(sample_event.event_id)
     assert result is not None
     assert result["name"] == "Quiz Night"
+    assert result["attempt_id"]
+    mock_stores.replay_store.delete_idle_attempt_results.assert_called_once()
     assert result["total"] == 2
     assert len(result["questions"]) == 2
     # Answers should NOT be included
@@ -58,6 +65,17 @@ def test_start_replay(mock_stores, sample_event, sample_questions):
         assert "answer" not in q
 
 
+def test_start_replay_throttles_idle_purge(mock_stores, sample_event, sample_questions):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.return_value = sample_questions
+
+    first = start_replay(sample_event.event_id)
+    second = start_replay(sample_event.event_id)
+
+    assert first["attempt_id"] != second["attempt_id"]
+    mock_stores.replay_store.delete_idle_attempt_results.assert_called_once()
+
+
 def test_start_replay_not_found(mock_stores):
     mock_stores.event_store.get_by_id.return_value = None
     assert start_replay("bad-id") is None
@@ -65,7 +83,7 @@ def test_start_replay_not_found(mock_stores):
 
 def test_submit_replay_correct_answers(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -81,7 +99,7 @@ def test_submit_replay_correct_answers(mock_stores, sample_event, sample_questio
 
 def test_submit_replay_wrong_answers(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -96,7 +114,7 @@ def test_submit_replay_wrong_answers(mock_stores, sample_event, sample_questions
 
 def test_submit_replay_fuzzy_match(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -110,7 +128,7 @@ def test_submit_replay_fuzzy_match(mock_stores, sample_event, sample_questions):
 
 def test_submit_replay_with_override(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -124,7 +142,7 @@ def test_submit_replay_with_override(mock_stores, sample_event, sample_questions
 
 def test_submit_replay_increments_stats(mock_stores, sample_event, sample_questions):
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -133,15 +151,9 @@ def test_submit_replay_increments_stats(mock_stores, sample_event, sample_questi
         {"question_id": "q2", "answer": "5"},
     ]
     submit_replay(sample_event.event_id, answers)
-    # q1 correct, q2 wrong
-    calls = mock_stores.question_store.update.call_args_list
-    assert len(calls) == 2
-    # First call should increment times_asked and times_correct
-    assert calls[0][0][1]["times_asked"] == 1
-    assert "times_correct" in calls[0][0][1]
-    # Second call should increment times_asked and times_incorrect
-    assert calls[1][0][1]["times_asked"] == 1
-    assert "times_incorrect" in calls[1][0][1]
+    # q1 correct, q2 wrong: one batched increment, no per-question update
+    mock_stores.question_store.increment_stats.assert_called_once_with([("q1", True), ("q2", False)])
+    mock_stores.question_store.update.assert_not_called()
 
 
 def test_get_leaderboard(mock_stores):
@@ -164,7 +176,7 @@ def test_get_user_replays(mock_stores):
 def test_submit_replay_user_answer_key(mock_stores, sample_event, sample_questions):
     """The service must accept 'user_answer' as an alternative to 'answer'."""
     mock_stores.event_store.get_by_id.return_value = sample_event
-    mock_stores.question_store.get_by_id.side_effect = lambda qid: sample_questions.get(qid)
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
     mock_stores.replay_store.save.return_value = True
     mock_stores.question_store.update.return_value = None
 
@@ -176,3 +188,173 @@ def test_submit_replay_user_answer_key(mock_stores, sample_event, sample_questio
     assert replay.score == 2
     assert replay.answers[0]["user_answer"] == "Paris"
     assert replay.answers[1]["user_answer"] == "4"
+
+
+def test_submit_replay_loads_questions_in_one_batch(mock_stores, sample_event, sample_questions):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+    mock_stores.replay_store.save.return_value = True
+
+    answers = [
+        {"question_id": "q1", "answer": "Paris"},
+        {"question_id": "q2", "answer": "4"},
+    ]
+    submit_replay(sample_event.event_id, answers)
+    mock_stores.question_store.get_many.assert_called_once_with(["q1", "q2"])
+    mock_stores.question_store.get_by_id.assert_not_called()
+
+
+@pytest.fixture
+def counting_evaluator(monkeypatch):
+    evaluator = MagicMock()
+    simple = SimpleEvaluator()
+    evaluator.evaluate_batch.side_effect = lambda items: [simple.evaluate(*item) for item in items]
+    monkeypatch.setattr("backend.services.replay_service._evaluator", evaluator)
+    return evaluator
+
+
+def test_evaluation_token_skips_unchanged_answers_on_submit(mock_stores, sample_event, sample_questions, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+
+    answers = [{"question_id": "q1", "answer": "Paris"}, {"question_id": "q2", "answer": "5"}]
+    evaluated = evaluate_replay(sample_event.event_id, answers)
+    assert evaluated["score"] == 1
+    assert counting_evaluator.evaluate_batch.call_count == 1
+
+    answers[1]["answer"] = "4"
+    replay = submit_replay(sample_event.event_id, answers, evaluation_token=evaluated["evaluation_token"])
+
+    assert replay.score == 2
+    # Only the edited answer was graded again
+    assert counting_evaluator.evaluate_batch.call_args.args[0] == [("2+2?", "4", "4", 1, None)]
+
+
+def test_evaluation_token_reuses_results_on_re_evaluate(mock_stores, sample_event, sample_questions, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+
+    answers = [{"question_id": "q1", "answer": "Paris"}, {"question_id": "q2", "answer": "5"}]
+    token = evaluate_replay(sample_event.event_id, answers)["evaluation_token"]
+    answers[1]["override"] = True
+    result = evaluate_replay(sample_event.event_id, answers, evaluation_token=token)
+
+    assert result["score"] == 2
+    assert counting_evaluator.evaluate_batch.call_count == 1
+    assert result["answers"][0]["explanation"] == "Exact match"
+
+
+@pytest.mark.parametrize("token", ["garbage", None])
+def test_invalid_evaluation_token_grades_everything(mock_stores, sample_event, sample_questions, counting_evaluator, token):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+
+    answers = [{"question_id": "q1", "answer": "Paris"}, {"question_id": "q2", "answer": "4"}]
+    replay = submit_replay(sample_event.event_id, answers, evaluation_token=token)
+
+    assert replay.score == 2
+    assert len(counting_evaluator.evaluate_batch.call_args.args[0]) == 2
+
+
+def test_evaluation_token_is_bound_to_event_and_question(mock_stores, sample_event, sample_questions, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+    answers = [{"question_id": "q1", "answer": "Paris"}]
+    token = evaluate_replay(sample_event.event_id, answers)["evaluation_token"]
+
+    # A token from another event is ignored
+    evaluate_replay("other-event", answers, evaluation_token=token)
+    assert counting_evaluator.evaluate_batch.call_count == 2
+
+    # So is a result for a question whose reference answer changed since
+    sample_questions["q1"].answer = "Paris, France"
+    evaluate_replay(sample_event.event_id, answers, evaluation_token=token)
+    assert counting_evaluator.evaluate_batch.call_count == 3
+
+
+@pytest.fixture
+def attempt_store(mock_stores):
+    results = {}
+    mock_stores.replay_store.save_attempt_result.side_effect = (
+        lambda attempt_id, event_id, question_id, key, result: results.__setitem__(key, result) or True
+    )
+    mock_stores.replay_store.get_attempt_results.side_effect = lambda attempt_id, event_id: dict(results)
+    return results
+
+
+def test_background_grades_are_reused_by_evaluate_and_submit(mock_stores, sample_event, sample_questions, counting_evaluator, attempt_store):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_by_id.side_effect = sample_questions.get
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+    counting_evaluator.evaluate.side_effect = SimpleEvaluator().evaluate
+
+    attempt_id = replay_service._issue_attempt_id(sample_event.event_id)
+    assert grade_replay_answer(sample_event.event_id, attempt_id, "q1", "Paris") is True
+    assert grade_replay_answer(sample_event.event_id, attempt_id, "q2", "5") is True
+    assert len(attempt_store) == 2
+    attempt = mock_stores.replay_store.save_attempt_result.call_args.args[0]
+    assert attempt != attempt_id
+    assert mock_stores.replay_store.save_attempt_result.call_args.args[2] == "q2"
+
+    answers = [{"question_id": "q1", "answer": "Paris"}, {"question_id": "q2", "answer": "5"}]
+    evaluated = evaluate_replay(sample_event.event_id, answers, attempt_id=attempt_id)
+    assert evaluated["score"] == 1
+    counting_evaluator.evaluate_batch.assert_not_called()
+
+    replay = submit_replay(sample_event.event_id, answers, attempt_id=attempt_id)
+    assert replay.score == 1
+    counting_evaluator.evaluate_batch.assert_not_called()
+    mock_stores.replay_store.delete_attempt_results.assert_called_once_with(attempt)
+
+
+def test_background_grade_of_edited_answer_is_not_reused(mock_stores, sample_event, sample_questions, counting_evaluator, attempt_store):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_by_id.side_effect = sample_questions.get
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+    counting_evaluator.evaluate.side_effect = SimpleEvaluator().evaluate
+
+    attempt_id = replay_service._issue_attempt_id(sample_event.event_id)
+    grade_replay_answer(sample_event.event_id, attempt_id, "q2", "5")
+    result = evaluate_replay(sample_event.event_id, [{"question_id": "q2", "answer": "4"}], attempt_id=attempt_id)
+
+    assert result["score"] == 1
+    assert counting_evaluator.evaluate_batch.call_args.args[0] == [("2+2?", "4", "4", 1, None)]
+
+
+def test_grade_replay_answer_outside_event(mock_stores, sample_event, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    attempt_id = replay_service._issue_attempt_id(sample_event.event_id)
+    assert grade_replay_answer(sample_event.event_id, attempt_id, "q9", "x") is None
+    counting_evaluator.evaluate.assert_not_called()
+    mock_stores.replay_store.save_attempt_result.assert_not_called()
+
+
+def test_grade_replay_answer_rejects_unissued_attempt_ids(mock_stores, sample_event, sample_questions, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    mock_stores.question_store.get_by_id.side_effect = sample_questions.get
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+    other_event = replay_service._issue_attempt_id("another-event")
+
+    for attempt_id in ("a1", other_event, ""):
+        with pytest.raises(ValueError):
+            grade_replay_answer(sample_event.event_id, attempt_id, "q1", "Paris")
+    counting_evaluator.evaluate.assert_not_called()
+    mock_stores.replay_store.save_attempt_result.assert_not_called()
+
+    # evaluate/submit simply grade everything when the ID is not valid
+    evaluate_replay(sample_event.event_id, [{"question_id": "q1", "answer": "Paris"}], attempt_id="a1")
+    mock_stores.replay_store.get_attempt_results.assert_not_called()
+
+
+def test_evaluation_token_does_not_reuse_results_across_numbers(mock_stores, sample_event, sample_questions, counting_evaluator):
+    mock_stores.event_store.get_by_id.return_value = sample_event
+    sample_questions["q2"].answer = "3.14"
+    mock_stores.question_store.get_many.side_effect = lambda ids: {qid: sample_questions[qid] for qid in ids if qid in sample_questions}
+
+    answers = [{"question_id": "q2", "answer": "3.14"}]
+    token = evaluate_replay(sample_event.event_id, answers)["evaluation_token"]
+    answers[0]["answer"] = "314"
+    result = evaluate_replay(sample_event.event_id, answers, evaluation_token=token)
+
+    assert result["score"] == 0
+    assert counting_evaluator.evaluate_batch.call_count == 2
@@ -0,0 +1,17 @@
+"""Stand-in for ``postgres.session_scope`` in storage tests that inspect SQL."""
+from unittest.mock import MagicMock
+
+from backend.storage import postgres
+
+
+def patch_session_scope(monkeypatch, session=None, rowcount=None):
+    """Route ``postgres.session_scope`` to ``session`` (a fresh MagicMock by
+    default) and return ``(session, scope)``."""
+    if session is None:
+        session = MagicMock()
+    if rowcount is not None:
+        session.execute.return_value.rowcount = rowcount
+    scope = MagicMock()
+    scope.return_value.__enter__.return_value = session
+    monkeypatch.setattr(postgres, "session_scope", scope)
+    return session, scope
@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from backend.storage import postgres
+from tests.storage.fake_session import patch_session_scope
+
+
+def _row(question_id, random_key=0.5):
+    return SimpleNamespace(question_id=question_id, random_key=random_key)
+
+
+def _session(*batches):
+    """A session whose execute() returns the given row batches in order, as
+    records via scalars() or as (question_id, random_key) rows via all()."""
+    session = MagicMock()
+    results = []
+    for rows in batches:
+        result = MagicMock()
+        result.scalars.return_value = list(rows)
+        result.all.return_value = [(r.question_id, r.random_key) for r in rows]
+        results.append(result)
+    session.execute.side_effect = results
+    session.get.side_effect = lambda model, question_id: _row(question_id)
+    return session
+
+
+def _sql(session, index):
+    query = session.execute.call_args_list[index].args[0]
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _base():
+    return postgres._apply_question_filters(postgres.select(postgres.QuestionRecord), {"review_status": True})
+
+
+def test_probe_wraps_to_start_of_key_range():
+    """Nothing at or after the start key: the probe continues from the lowest key."""
+    session = _session([], [_row("q1", 0.1)])
+
+    record = postgres._probe_random(session, _base(), 0.9, set())
+
+    assert record.question_id == "q1"
+    assert "questions.random_key >= 0.9" in _sql(session, 0)
+    assert "questions.random_key < 0.9" in _sql(session, 1)
+
+
+def test_probe_tops_up_a_short_batch_across_the_wrap(monkeypatch):
+    """A start near the top of the range still chooses among a full batch."""
+    monkeypatch.setattr(postgres, "_RANDOM_PROBE_BATCH", 4)
+    monkeypatch.setattr(postgres._random, "choice", lambda rows: rows[-1])
+    session = _session([_row("q9", 0.99)], [_row("q1", 0.01), _row("q2", 0.02), _row("q3", 0.03)])
+
+    record = postgres._probe_random(session, _base(), 0.98, set())
+
+    assert record.question_id == "q3"
+    assert "LIMIT 4" in _sql(session, 0)
+    assert "LIMIT 3" in _sql(session, 1)
+
+
+def test_probe_skips_seen_rows_without_wrapping(monkeypatch):
+    monkeypatch.setattr(postgres, "_RANDOM_PROBE_BATCH", 3)
+    session = _session([_row("q1"), _row("q2"), _row("q3")])
+
+    record = postgres._probe_random(session, _base(), 0.2, {"q1", "q3"})
+
+    assert record.question_id == "q2"
+    session.execute.assert_called_once()
+    assert "NOT IN" not in _sql(session, 0)
+
+
+def test_probe_returns_none_when_batch_and_wrap_are_seen():
+    session = _session([_row("q1")], [_row("q2")])
+    assert postgres._probe_random(session, _base(), 0.5, {"q1", "q2"}) is None
+
+
+def test_scan_unseen_pages_by_key_and_id(monkeypatch):
+    monkeypatch.setattr(postgres, "_RANDOM_SCAN_BATCH", 2)
+    session = _session([_row("q1", 0.1), _row("q2", 0.2)], [_row("q3", 0.3)])
+
+    record = postgres._scan_unseen(session, _base(), {"q1", "q2"})
+
+    assert record.question_id == "q3"
+    sql = _sql(session, 1)
+    assert sql.startswith("SELECT questions.question_id, questions.random_key \nFROM questions")
+    assert "(questions.random_key, questions.question_id) > (0.2, 'q2')" in sql
+    # Only the chosen row is loaded in full
+    session.get.assert_called_once_with(postgres.QuestionRecord, "q3")
+
+
+def test_scan_unseen_exhausted(monkeypatch):
+    monkeypatch.setattr(postgres, "_RANDOM_SCAN_BATCH", 2)
+    session = _session([_row("q1"), _row("q2")], [])
+    assert postgres._scan_unseen(session, _base(), {"q1", "q2"}) is None
+    assert session.execute.call_count == 2
+    session.get.assert_not_called()
+
+
+def test_random_reviewed_all_seen_returns_none(monkeypatch):
+    seen_batch = [_row("q1"), _row("q2")]
+    probes = [seen_batch, seen_batch] * postgres._RANDOM_PROBES
+    session = _session(*probes, seen_batch)
+    _, scope = patch_session_scope(monkeypatch, session)
+
+    assert postgres.PostgresQuestionStore().random_reviewed(["q1", "q2"]) is None
+    # Three wrapped probes, then one scan batch proves everything was seen
+    assert session.execute.call_count == 2 * postgres._RANDOM_PROBES + 1
+    scope.assert_called_once_with()
+
+
+def test_random_reviewed_no_matching_filters(monkeypatch):
+    session = _session(*([[]] * (2 * postgres._RANDOM_PROBES)))
+    patch_session_scope(monkeypatch, session)
+
+    assert postgres.PostgresQuestionStore().random_reviewed([], {"language": "klingon"}) is None
+    # No seen IDs, so empty probes already prove there is nothing to scan
+    assert session.execute.call_count == 2 * postgres._RANDOM_PROBES
+    assert "questions.language = 'klingon'" in _sql(session, 0)
+
+
+def test_random_reviewed_is_read_only(monkeypatch):
+    record = postgres.QuestionRecord(
+        question_id="q1", question="Q?", answer="A", added_by="tester", random_key=0.4,
+        review_status=True, tags=[], incorrect_answers=[], update_history=[],
+    )
+    session = _session([record], [])
+    _, scope = patch_session_scope(monkeypatch, session)
+
+    question = postgres.PostgresQuestionStore().random_reviewed()
+
+    assert question.question_id == "q1"
+    assert record.random_key == 0.4
+    scope.assert_called_once_with()
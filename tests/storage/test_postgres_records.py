@@ -0,0 +1,116 @@
+from datetime import datetime
+
+import pytest
+
+from backend.models.question import QuestionModel
+from backend.storage import postgres
+from tests.storage.fake_session import patch_session_scope
+from backend.storage.postgres import (
+    EventRecord,
+    LiveAnswerRecord,
+    QuestionRecord,
+    _event_from_record,
+    _live_answer_from_record,
+    _question_from_record,
+)
+
+
+def _question_record(**overrides):
+    values = dict(
+        question_id="q1",
+        question="What is the capital of France?",
+        answer="Paris",
+        added_by="tester",
+        added_at=datetime(2024, 1, 1),
+        question_topic="geography",
+        incorrect_answers=["Lyon"],
+        times_asked=3,
+        times_correct=2,
+        times_incorrect=1,
+        update_history=[{"timestamp": "2024-01-02T00:00:00", "changes": {"points": 2}}],
+        last_updated_at=datetime(2024, 1, 2),
+        language="english",
+        tags=["capitals"],
+        review_status=True,
+        points=2,
+    )
+    values.update(overrides)
+    return QuestionRecord(**values)
+
+
+def test_question_from_record_matches_validated_model():
+    record = _question_record()
+    trusted = _question_from_record(record)
+    validated = QuestionModel(**trusted.model_dump())
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_dump(by_alias=True)["id"] == "q1"
+
+
+def test_question_from_record_skips_validators():
+    """Stored rows are trusted; validators only run on inbound payloads."""
+    record = _question_record(tags=["Already-Stored"])
+    assert _question_from_record(record).tags == ["Already-Stored"]
+
+
+def test_question_from_record_copies_lists():
+    record = _question_record()
+    question = _question_from_record(record)
+    question.tags.append("extra")
+    assert record.tags == ["capitals"]
+
+
+def test_other_records_use_trusted_path():
+    event = _event_from_record(EventRecord(
+        event_id="e1", slug=None, name="Quiz night", question_ids=["q1"],
+        is_published=False, created_by="host",
+        created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1),
+    ))
+    assert event.slug == ""
+    assert event.question_ids == ["q1"]
+
+    answer = _live_answer_from_record(LiveAnswerRecord(
+        answer_id="a1", session_id="s1", participant_id="p1", question_index=0,
+        answer_text="Paris", is_locked=True, submitted_at=datetime(2024, 1, 1),
+    ))
+    assert answer.answer_text == "Paris"
+    assert answer.points_awarded is None
+
+
+def _patch_session(monkeypatch, record):
+    session, _ = patch_session_scope(monkeypatch)
+    session.get.return_value = record
+    return postgres
+
+
+def test_question_update_runs_validators(monkeypatch):
+    """Reads trust stored rows, so updates must be sanitized before they are written."""
+    record = _question_record()
+    postgres = _patch_session(monkeypatch, record)
+
+    updated = postgres.PostgresQuestionStore().update("q1", {
+        "answer": "Paris<script>alert(1)</script> ",
+        "tags": ["Europe", " Capitals "],
+        "language": " German ",
+        "updated_by": "editor",
+    })
+
+    assert record.answer == updated.answer == "Paris"
+    assert record.tags == ["europe", "capitals"]
+    assert record.language == "german"
+    assert record.update_history[-1]["changes"]["answer"] == "Paris"
+    assert record.update_history[-1]["updated_by"] == "editor"
+
+
+def test_event_update_rejects_invalid_values(monkeypatch):
+    record = EventRecord(
+        event_id="e1", slug="abc", name="Quiz night", question_ids=["q1"],
+        is_published=False, created_by="host",
+        created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1),
+    )
+    postgres = _patch_session(monkeypatch, record)
+    store = postgres.PostgresEventStore()
+
+    assert store.update("e1", {"name": " <script>x</script>Pub quiz "}).name == "Pub quiz"
+    with pytest.raises(ValueError):
+        store.update("e1", {"question_ids": "not-a-list"})
+    assert record.question_ids == ["q1"]
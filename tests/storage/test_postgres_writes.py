@@ -0,0 +1,83 @@
+from sqlalchemy.dialects import postgresql
+
+from backend.storage import postgres
+from backend.storage.base import QuestionStore
+from tests.storage.fake_session import patch_session_scope
+
+
+def test_stat_deltas_folds_repeated_questions():
+    deltas = QuestionStore._stat_deltas([("q1", True), ("q2", False), ("q1", False), ("", True)])
+    assert deltas == {"q1": (2, 1, 1), "q2": (1, 0, 1)}
+
+
+def test_postgres_increment_stats_is_one_update(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=2)
+
+    updated = postgres.PostgresQuestionStore().increment_stats([("q1", True), ("q2", False)])
+
+    assert updated == 2
+    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "FROM (VALUES" in sql
+    assert "update_history" not in sql
+
+
+def test_postgres_apply_evaluations_is_one_update(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=2)
+
+    updated = postgres.PostgresLiveStore().apply_evaluations("s1", 0, {
+        "a1": {"points_awarded": 1, "max_points": 1, "is_correct": True, "explanation": None},
+        "a2": {"points_awarded": 0, "max_points": 1, "is_correct": False, "explanation": "no"},
+    })
+
+    assert updated == 2
+    # One UPDATE for every answer, then one to refresh the affected running scores
+    answers_sql, scores_sql = (
+        str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.execute.call_args_list
+    )
+    assert answers_sql.startswith("UPDATE live_answers SET")
+    assert "FROM (VALUES" in answers_sql
+    assert "CAST(results.points_awarded AS FLOAT)" in answers_sql
+    assert scores_sql.startswith("UPDATE live_participants SET score=")
+    assert "sum(live_answers.points_awarded)" in scores_sql
+
+
+def test_postgres_update_answers_bulk_is_direct_update(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=3)
+
+    assert postgres.PostgresLiveStore().update_answers_bulk("s1", 0, {"is_locked": True, "unknown": 1}) == 3
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE live_answers SET is_locked=")
+    assert "SELECT" not in sql
+
+
+def test_postgres_speculative_result_only_sticks_to_unscored_same_text(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=0)
+
+    stored = postgres.PostgresLiveStore().save_speculative_result("s1", "p1", 0, "Paris", {"points_awarded": 1})
+
+    assert stored is False
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE live_answers SET speculative_result=")
+    assert "live_answers.answer_text = " in sql
+    assert "live_answers.points_awarded IS NULL" in sql
+
+
+def test_postgres_eval_cache_put_is_upsert(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=1)
+
+    postgres.PostgresEvalCacheStore().put_many({("h", "paris", 1): {"is_correct": True}})
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO eval_cache")
+    assert "ON CONFLICT (question_hash, answer_norm, max_points) DO UPDATE" in sql
+
+
+def test_postgres_replay_attempt_result_is_upsert(monkeypatch):
+    session, _ = patch_session_scope(monkeypatch, rowcount=1)
+
+    assert postgres.PostgresReplayStore().save_attempt_result("a1", "e1", "q1", "k1", {"is_correct": True})
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO replay_attempt_results")
+    assert "ON CONFLICT (attempt_id, question_id) DO UPDATE" in sql
@@ -0,0 +1,60 @@
+"""Offline stand-in for ``anthropic.Anthropic`` used by the evaluator tests.
+
+Grades batch prompts by comparing each ``User:`` line with its ``Reference:``
+line, and lets tests inject latency and failures per request.
+"""
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeAnthropicClient:
+    def __init__(self, latency: float = 0.0, fail=None):
+        """``fail(call_number, user_msg)`` returns an exception to raise, or a
+        string to send back verbatim instead of a graded answer."""
+        self.latency = latency
+        self.fail = fail
+        self.calls: list[dict] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        user_msg = kwargs["messages"][0]["content"]
+        with self._lock:
+            self.calls.append(kwargs)
+            call_number = len(self.calls)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            outcome = self.fail(call_number, user_msg) if self.fail else None
+            if isinstance(outcome, Exception):
+                raise outcome
+            text = outcome if isinstance(outcome, str) else json.dumps(self._grade(user_msg))
+            usage = SimpleNamespace(
+                input_tokens=(len(kwargs["system"]) + len(user_msg)) // 4, output_tokens=len(text) // 4
+            )
+            return SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason="end_turn", usage=usage)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _grade(user_msg: str) -> list[dict]:
+        # Understands both the flat ("User: ...") and grouped ("N. ...") formats
+        graded = []
+        reference = ""
+        for line in user_msg.splitlines():
+            if line.startswith("Reference: "):
+                reference = line[len("Reference: "):]
+                continue
+            match = re.match(r"^(?:User: |\d+\. )(.*)$", line)
+            if match:
+                correct = match.group(1).strip().lower() == reference.strip().lower()
+                graded.append({"correct": correct, "explanation": "fake"})
+        return graded
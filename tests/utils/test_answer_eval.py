@@ -1,14 +1,25 @@
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from backend.utils.answer_eval import (
+    CachingEvaluator,
+    CircuitBreaker,
+    LLM_FALLBACK_NOTE,
+    LLM_SKIPPED_NOTE,
     EvalResult,
     HybridEvaluator,
+    LLMBatchDispatcher,
     LLMEvaluator,
     SimpleEvaluator,
+    answer_index,
+    answer_key,
+    question_hash,
 )
+from tests.utils.fake_anthropic import FakeAnthropicClient
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +83,153 @@ class TestSimpleEvaluator:
         assert "similarity" in result.explanation
 
 
+    def test_numeric_near_miss_is_decisively_wrong(self, evaluator):
+        result = evaluator.evaluate("Moon landing year?", "1969", "1968")
+        assert result.is_correct is False
+        assert result.decisive is True
+        assert result.explanation == "Year mismatch"
+
+    def test_spoken_year_is_not_a_sum(self, evaluator):
+        assert evaluator.evaluate("Orwell novel?", "Nineteen Eighty-Four", "1984").is_correct is True
+        result = evaluator.evaluate("Orwell novel?", "Nineteen Eighty-Four", "103")
+        assert result.is_correct is False
+        assert result.explanation == "Year mismatch"
+
+    def test_numeric_formats_match(self, evaluator):
+        result = evaluator.evaluate("Population?", "12 million", "12,000,000", max_points=2)
+        assert result.is_correct is True
+        assert result.points_awarded == 2
+        assert result.decisive is True
+
+    def test_text_answers_are_not_decisive(self, evaluator):
+        assert evaluator.evaluate("Q", "Paris", "Lyon").decisive is False
+
+    def test_listed_alternatives_each_match(self, evaluator):
+        reference = "Lennon, McCartney, Harrison or Starr"
+        for answer in ("lennon", "Ringo Starr", "McCartney"):
+            result = evaluator.evaluate("Name a Beatle", reference, answer)
+            assert result.is_correct is (answer != "Ringo Starr"), answer
+        result = evaluator.evaluate("Name a Beatle", reference, "Harrisson")
+        assert result.is_correct is True
+        assert "listed option 'Harrison'" in result.explanation
+
+    def test_slash_alternatives(self, evaluator):
+        assert evaluator.evaluate("Country?", "USA / United States", "United States").is_correct is True
+        assert evaluator.evaluate("Country?", "USA / United States", "usa").explanation.startswith("Exact match")
+
+    @pytest.mark.parametrize("reference,answer", [
+        ("AC/DC", "DC"),
+        ("Either/Or", "Or"),
+        ("Tom or Jerry", "Tom"),
+    ])
+    def test_unspaced_slash_and_plain_or_do_not_list_options(self, evaluator, reference, answer):
+        assert evaluator.evaluate("Q", reference, answer).is_correct is False
+        assert len(answer_index(reference).alternatives) == 1
+
+    def test_multi_word_or_list_stays_whole(self, evaluator):
+        reference = "The Good, the Bad or the Ugly"
+        assert len(answer_index(reference).alternatives) == 1
+        assert evaluator.evaluate("Which film?", reference, "The Bad").is_correct is False
+
+    def test_or_listed_option_is_tentative_on_one_point_questions(self, evaluator):
+        result = evaluator.evaluate("Which band?", "Earth, Wind or Fire", "Earth")
+        assert result.is_correct is True
+        assert result.tentative is True
+        assert evaluator.evaluate("Which band?", "Earth, Wind or Fire", "Earth, Wind or Fire").tentative is False
+
+    def test_listed_option_on_multi_point_question_is_tentative(self, evaluator):
+        result = evaluator.evaluate("Who wrote it?", "Lennon / McCartney", "Lennon", max_points=2)
+        assert result.is_correct is True
+        assert result.tentative is True
+        assert evaluator.evaluate("Who wrote it?", "Lennon / McCartney", "Lennon").tentative is False
+        assert evaluator.evaluate("Who wrote it?", "Lennon / McCartney", "Lennon / McCartney", max_points=2).tentative is False
+
+    @pytest.mark.parametrize("reference,answer", [
+        ("Apollo 11", "Apollo 12"),
+        ("Route 66", "Route 67"),
+        ("Episode 4", "Episode 5"),
+        ("H2O", "H2O2"),
+    ])
+    def test_fuzzy_match_needs_the_same_numbers(self, evaluator, reference, answer):
+        result = evaluator.evaluate("Q", reference, answer)
+        assert result.is_correct is False
+        assert result.decisive is False
+        assert result.explanation == "No match (different numbers)"
+
+    def test_typo_beside_the_same_number_still_matches(self, evaluator):
+        assert evaluator.evaluate("Q", "Apollo 11", "Apolo 11").is_correct is True
+        assert evaluator.evaluate("Q", "Apollo 11", "Apollo 011").is_correct is True
+
+    def test_year_for_a_full_date_is_tentative(self, evaluator):
+        result = evaluator.evaluate("Moon landing?", "July 20, 1969", "1969")
+        assert result.is_correct is False
+        assert result.tentative is True
+        assert result.decisive is False
+        assert result.explanation == "Date incomplete"
+        assert evaluator.evaluate("Moon landing?", "July 20, 1969", "1968").decisive is True
+
+    def test_word_order_match(self, evaluator):
+        result = evaluator.evaluate("Who?", "Lennon and McCartney", "McCartney and Lennon")
+        assert result.is_correct is True
+        assert result.explanation == "Exact match (word order)"
+
+    def test_comma_without_or_is_not_a_list(self, evaluator):
+        assert evaluator.evaluate("City?", "Paris, France", "France").is_correct is False
+        assert [a.text for a in answer_index("Paris, France").alternatives] == ["Paris, France"]
+
+    def test_numeric_alternatives(self, evaluator):
+        assert evaluator.evaluate("Q", "3 or 4", "four").is_correct is True
+        result = evaluator.evaluate("Q", "3 or 4", "5")
+        assert result.is_correct is False
+        assert result.decisive is True
+
+    def test_reordered_words_fuzzy_match(self, evaluator):
+        result = evaluator.evaluate("Who?", "Paul McCartney", "McCartny Paul")
+        assert result.is_correct is True
+        assert result.explanation.startswith("Fuzzy match (word order,")
+
+    def test_miss_confidence_is_bounded_by_length(self, evaluator):
+        result = evaluator.evaluate("Q", "Photosynthesis", "42")
+        assert result.explanation == "No match (below 85% similarity)"
+        assert result.confidence == 0.75
+
+    def test_accents_and_umlauts_fold(self, evaluator):
+        assert evaluator.evaluate("Q", "Müller", "Muller").explanation == "Exact match (accents folded)"
+        assert evaluator.evaluate("Q", "Straße", "Strasse").is_correct is True
+        assert evaluator.evaluate("Q", "Müller", "Mueller", language="German").explanation == (
+            "Exact match (accents folded)"
+        )
+
+    def test_phonetic_match_uses_question_language(self, evaluator):
+        result = evaluator.evaluate("Q", "Meyer", "Maier", language="de")
+        assert result.is_correct is True
+        assert result.explanation == "Phonetic match"
+        assert result.confidence == SimpleEvaluator.PHONETIC_CONFIDENCE
+        assert evaluator.evaluate("Q", "Meyer", "Maier").is_correct is False
+        assert evaluator.evaluate("Q", "Catherine", "Kathryn", language="english").is_correct is True
+        assert evaluator.evaluate("Q", "Paris", "Peru", language="english").is_correct is False
+
+    @pytest.mark.parametrize("reference,answer,language", [
+        ("Nigeria", "Niger", "en"),
+        ("Napoli", "Nepal", "en"),
+        ("Rhone", "Rhein", "de"),
+        ("Münz", "Mainz", "de"),
+    ])
+    def test_phonetic_only_match_is_tentative(self, evaluator, reference, answer, language):
+        assert evaluator.evaluate("Q", reference, answer, language=language).tentative is True
+        assert evaluator.evaluate("Q", "Müller", "Mueller", language="de").tentative is False
+
+    def test_phonetic_tier_can_be_disabled(self):
+        evaluator = SimpleEvaluator(phonetic_matching=False)
+        assert evaluator.evaluate("Q", "Müller", "Muller").is_correct is False
+        assert evaluator.evaluate("Q", "Meyer", "Maier", language="de").is_correct is False
+
+    def test_answer_index_is_memoised(self):
+        assert answer_index("USA / United States") is answer_index("USA / United States")
+        index = answer_index("USA / United States")
+        assert [a.normalized for a in index.alternatives] == ["usa united states", "usa", "united states"]
+
+
 # ---------------------------------------------------------------------------
 # LLMEvaluator
 # ---------------------------------------------------------------------------
@@ -135,11 +293,331 @@ class TestLLMEvaluator:
         assert result is None
 
 
+def _chunked_evaluator(client, **kwargs):
+    with patch("anthropic.Anthropic", return_value=client):
+        return LLMEvaluator(api_key="test-key", model="test-model", **kwargs)
+
+
+def _batch(n):
+    return [(f"Q{i}", f"A{i}", f"A{i}" if i % 2 == 0 else "wrong", 1) for i in range(n)]
+
+
+class TestLLMEvaluatorChunking:
+    def test_large_batch_is_split_into_parallel_chunks(self):
+        client = FakeAnthropicClient(latency=0.05)
+        ev = _chunked_evaluator(client, chunk_size=10, max_concurrency=3)
+
+        results = ev.evaluate_batch(_batch(45))
+
+        assert len(client.calls) == 5
+        assert client.max_in_flight == 3
+        assert all(call["max_tokens"] <= 800 for call in client.calls)
+        assert [r.is_correct for r in results] == [i % 2 == 0 for i in range(45)]
+
+    def test_concurrency_limit_is_shared_by_callers(self):
+        client = FakeAnthropicClient(latency=0.05)
+        ev = _chunked_evaluator(client, chunk_size=5, max_concurrency=2)
+
+        callers = [threading.Thread(target=ev.evaluate_batch, args=(_batch(10),)) for _ in range(3)]
+        callers.append(threading.Thread(target=ev.evaluate, args=("Q", "A", "A")))
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        assert len(client.calls) == 7
+        assert client.max_in_flight == 2
+
+    def test_busy_slots_fall_back_without_tripping_breaker(self):
+        client = FakeAnthropicClient()
+        ev = _chunked_evaluator(client, max_concurrency=1, timeout_seconds=0.05)
+        ev._slots.acquire()
+
+        assert ev.evaluate("Q", "A", "A") is None
+        assert client.calls == []
+        assert ev.breaker.snapshot()["consecutive_failures"] == 0
+
+    def test_busy_slots_during_half_open_do_not_claim_the_probe(self):
+        client = FakeAnthropicClient()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01)
+        ev = _chunked_evaluator(client, max_concurrency=1, timeout_seconds=0.05, breaker=breaker)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        ev._slots.acquire()
+        assert ev.evaluate("Q", "A", "A") is None
+        ev._slots.release()
+
+        # The probe is still free for the next request, which closes the breaker
+        assert ev.available()
+        ev.evaluate("Q", "A", "A")
+        assert len(client.calls) == 1
+        assert breaker.snapshot()["state"] == CircuitBreaker.CLOSED
+
+    def test_small_batch_is_one_request(self):
+        client = FakeAnthropicClient()
+        ev = _chunked_evaluator(client, chunk_size=10)
+
+        assert len(ev.evaluate_batch(_batch(10))) == 10
+        assert len(client.calls) == 1
+
+    def test_failed_chunk_is_retried_alone(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: RuntimeError("overloaded") if n == 1 else None)
+        ev = _chunked_evaluator(client, chunk_size=5, max_concurrency=1)
+
+        results = ev.evaluate_batch(_batch(15))
+
+        assert len(client.calls) == 4
+        assert all(r is not None for r in results)
+
+    def test_chunk_failing_twice_falls_back_only_for_that_chunk(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: "not json" if "Q0\n" in msg else None)
+        ev = _chunked_evaluator(client, chunk_size=5, max_concurrency=2)
+
+        results = ev.evaluate_batch(_batch(15))
+
+        assert results[:5] == [None] * 5
+        assert all(r is not None for r in results[5:])
+        assert len(client.calls) == 4
+
+    def test_deadline_returns_none_for_unfinished_chunks(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: time.sleep(0.5) if "Q10\n" in msg else None)
+        ev = _chunked_evaluator(client, chunk_size=5, max_concurrency=3, deadline_seconds=0.2)
+
+        started = time.monotonic()
+        results = ev.evaluate_batch(_batch(15))
+
+        assert time.monotonic() - started < 0.45
+        assert all(r is not None for r in results[:10])
+        assert results[10:] == [None] * 5
+
+    def test_hybrid_falls_back_to_simple_for_failed_chunk(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: RuntimeError("down") if "Q1\n" in msg else None)
+        hybrid = HybridEvaluator()
+        hybrid._llm = _chunked_evaluator(client, chunk_size=2, max_concurrency=2)
+        hybrid._llm_init_attempted = True
+
+        items = [("Q1", "Paris", "Lyon", 1), ("Q1", "Paris", "Nice", 1), ("Q2", "Rome", "rome city", 1)]
+        results = hybrid.evaluate_batch(items)
+
+        assert results[0].explanation.endswith(LLM_FALLBACK_NOTE)
+        assert results[1].explanation.endswith(LLM_FALLBACK_NOTE)
+        assert results[2].explanation == "LLM: fake"
+
+
+class TestLLMEvaluatorGroupedPrompt:
+    def test_shared_question_is_stated_once(self):
+        client = FakeAnthropicClient()
+        ev = _chunked_evaluator(client)
+        items = [
+            ("Capital of France?", "Paris", "paris", 1),
+            ("Capital of Italy?", "Rome", "Milan", 1),
+            ("Capital of France?", "Paris", "Lyon", 1),
+            ("Capital of France?", "Paris", "Marseille", 1),
+        ]
+
+        results = ev.evaluate_batch(items)
+
+        prompt = client.calls[0]["messages"][0]["content"]
+        assert prompt.count("Capital of France?") == 1
+        assert prompt.startswith("Question 1: Capital of France?\nReference: Paris\nAnswers:\n1. paris\n2. Lyon")
+        assert [r.is_correct for r in results] == [True, False, False, False]
+        stats = ev.stats()
+        assert stats["grouped_calls"] == 1
+        assert stats["input_tokens"] > 0
+        assert stats["prompt_chars"] < stats["flat_prompt_chars"]
+
+    def test_results_map_back_to_original_positions(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: json.dumps([
+            {"points_awarded": 2, "explanation": "first"},
+            {"points_awarded": 0, "explanation": "second"},
+            {"points_awarded": 1, "explanation": "third"},
+        ]))
+        ev = _chunked_evaluator(client)
+        items = [("Q1", "A", "x", 2), ("Q2", "B", "y", 1), ("Q1", "A", "z", 2)]
+
+        results = ev.evaluate_batch(items)
+
+        prompt = client.calls[0]["messages"][0]["content"]
+        assert "Max points: 2" in prompt
+        assert client.calls[0]["system"].startswith("You are a trivia quiz answer evaluator. Below are")
+        # Prompt order is x, z (Q1) then y (Q2)
+        assert [r.explanation for r in results] == ["LLM: first", "LLM: third", "LLM: second"]
+        assert [r.points_awarded for r in results] == [2, 1, 0]
+
+    def test_distinct_questions_keep_flat_format(self):
+        client = FakeAnthropicClient()
+        ev = _chunked_evaluator(client)
+
+        ev.evaluate_batch([("Q1", "A", "a", 1), ("Q2", "B", "b", 1)])
+
+        assert client.calls[0]["messages"][0]["content"].startswith("Answer 1:\nQuestion: Q1")
+        assert ev.stats()["grouped_calls"] == 0
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_probes_half_open(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("backend.utils.answer_eval.time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, slow_call_seconds=5)
+
+        breaker.record_failure()
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.snapshot()["state"] == "open"
+        assert breaker.allow() is False
+        assert breaker.available() is False
+
+        now[0] += 10
+        assert breaker.available() is True
+        assert breaker.allow() is True  # the single half-open probe
+        assert breaker.allow() is False
+        breaker.record_success(0.1)
+        assert breaker.snapshot() == {"state": "closed", "consecutive_failures": 0, "trips": 1}
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, slow_call_seconds=1)
+
+        breaker.record_success(0.5)
+        breaker.record_success(2.0)
+        breaker.record_success(3.0)
+
+        assert breaker.snapshot()["state"] == "open"
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("backend.utils.answer_eval.time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5)
+        breaker.record_failure()
+        now[0] = 6.0
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.snapshot()["state"] == "open"
+        assert breaker.allow() is False
+
+
+class TestLLMEvaluatorBreaker:
+    def test_calls_carry_timeout_and_open_breaker_short_circuits(self):
+        client = FakeAnthropicClient(fail=lambda n, msg: RuntimeError("timeout"))
+        ev = _chunked_evaluator(client, timeout_seconds=2.5,
+                                breaker=CircuitBreaker(failure_threshold=2, reset_seconds=60))
+
+        assert ev.evaluate("Q", "Paris", "Lyon") is None
+        assert ev.evaluate("Q", "Paris", "Lyon") is None
+        assert client.calls[0]["timeout"] == 2.5
+        assert ev.available() is False
+
+        assert ev.evaluate_batch(_batch(3)) == [None] * 3
+        assert len(client.calls) == 2
+        assert ev.stats()["breaker"]["state"] == "open"
+
+    def test_hybrid_skips_llm_while_open(self):
+        client = FakeAnthropicClient()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+        breaker.record_failure()
+        hybrid = HybridEvaluator()
+        hybrid._llm = _chunked_evaluator(client, breaker=breaker)
+        hybrid._llm_init_attempted = True
+
+        single = hybrid.evaluate("Q", "Albert Einstein", "Einstein")
+        batch = hybrid.evaluate_batch([("Q", "Paris", "paris", 1), ("Q", "Paris", "Lyon", 1)])
+
+        assert client.calls == []
+        assert single.explanation.endswith(LLM_SKIPPED_NOTE)
+        assert batch[0].explanation == "Exact match"
+        assert batch[1].explanation.endswith(LLM_SKIPPED_NOTE)
+
+    def test_skipped_results_are_not_cached(self):
+        inner = MagicMock()
+        inner.evaluate_batch.return_value = [
+            EvalResult(is_correct=False, confidence=0.5, explanation="No match " + LLM_SKIPPED_NOTE)
+        ]
+        cache = CachingEvaluator(inner, max_entries=10)
+        cache._store_init_attempted = True
+
+        cache.evaluate("Q", "Einstein", "Albert")
+        assert cache.stats()["entries"] == 0
+
+
+class TestLLMBatchDispatcher:
+    def test_concurrent_callers_share_one_request(self):
+        client = FakeAnthropicClient()
+        dispatcher = LLMBatchDispatcher(_chunked_evaluator(client), window_seconds=0.2, max_items=25)
+        results = {}
+
+        def caller(i):
+            results[i] = dispatcher.evaluate_batch([(f"Q{i}", f"A{i}", f"A{i}" if i % 2 else "no", 1)])
+
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(client.calls) == 1
+        assert client.calls[0]["messages"][0]["content"].count("Answer ") == 5
+        assert {i: r[0].is_correct for i, r in results.items()} == {i: bool(i % 2) for i in range(5)}
+        stats = dispatcher.stats()
+        assert stats["batch_size"]["buckets"]["le_5"] == 1
+        assert stats["queue_wait_ms"]["count"] == 5
+
+    def test_cap_closes_window_early(self):
+        client = FakeAnthropicClient()
+        dispatcher = LLMBatchDispatcher(_chunked_evaluator(client), window_seconds=5, max_items=3)
+
+        started = time.monotonic()
+        first = threading.Thread(target=dispatcher.evaluate_batch, args=(_batch(2),))
+        first.start()
+        second = dispatcher.evaluate_batch(_batch(1))
+        first.join()
+
+        assert second[0] is not None
+        assert len(client.calls) == 1
+        assert time.monotonic() - started < 1
+
+    def test_full_batches_bypass_the_queue(self):
+        llm = MagicMock()
+        llm.evaluate_batch.return_value = ["r"] * 4
+        dispatcher = LLMBatchDispatcher(llm, window_seconds=5, max_items=4)
+
+        assert dispatcher.evaluate_batch(_batch(4)) == ["r"] * 4
+        assert dispatcher.stats()["queue_wait_ms"]["count"] == 0
+
+    def test_caller_gives_up_after_timeout(self):
+        client = FakeAnthropicClient(latency=0.5)
+        dispatcher = LLMBatchDispatcher(_chunked_evaluator(client), window_seconds=0.01, timeout_seconds=0.1)
+
+        assert dispatcher.evaluate_batch(_batch(1)) == [None]
+
+    def test_hybrid_routes_llm_items_through_dispatcher(self):
+        hybrid = HybridEvaluator()
+        hybrid._llm = MagicMock()
+        hybrid._dispatcher = MagicMock()
+        hybrid._dispatcher.evaluate_batch.return_value = [EvalResult(is_correct=True, confidence=0.95)]
+        hybrid._llm_init_attempted = True
+
+        assert hybrid.evaluate("Who?", "Albert Einstein", "Einstein").is_correct is True
+        hybrid._dispatcher.evaluate_batch.assert_called_once_with([("Who?", "Albert Einstein", "Einstein", 1)])
+        hybrid._llm._evaluate_single.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # HybridEvaluator
 # ---------------------------------------------------------------------------
 
 class TestHybridEvaluator:
+    def test_explicit_llm_and_client_skip_settings(self, monkeypatch):
+        settings = MagicMock(side_effect=AssertionError("settings should not be read"))
+        monkeypatch.setattr("backend.core.settings.get_settings", settings)
+        client = FakeAnthropicClient()
+        llm = LLMEvaluator(api_key="", client=client)
+        hybrid = HybridEvaluator(simple=SimpleEvaluator(phonetic_matching=False), llm=llm)
+
+        results = hybrid.evaluate_batch([("Q", "Paris", "Lyon", 1), ("Q", "Rome", "Milan", 1)])
+
+        assert [r.is_correct for r in results] == [False, False]
+        assert len(client.calls) == 1
+
     def test_simple_match_skips_llm(self):
         """When SimpleEvaluator says correct, LLM is never called."""
         hybrid = HybridEvaluator()
@@ -188,6 +666,99 @@ class TestHybridEvaluator:
         result = hybrid.evaluate("Q", "Albert Einstein", "Einstein")
         assert result.is_correct is False  # SimpleEvaluator result
 
+    def test_batch_sends_each_distinct_answer_to_llm_once(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        mock_llm.evaluate_batch.side_effect = lambda items: [
+            EvalResult(is_correct=ua == "Einstein", confidence=0.95, explanation="LLM: ok",
+                       points_awarded=1 if ua == "Einstein" else 0)
+            for _, _, ua, _ in items
+        ]
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        items = [
+            ("Who?", "Albert Einstein", "Einstein", 1),
+            ("Who?", "Albert Einstein", "einstein!", 1),
+            ("Who?", "Albert Einstein", "Newton", 1),
+            ("Who?", "Albert Einstein", "Albert Einstein", 1),
+            ("Who?", "Albert Einstein", " EINSTEIN ", 1),
+        ]
+        results = hybrid.evaluate_batch(items)
+
+        mock_llm.evaluate_batch.assert_called_once_with([
+            ("Who?", "Albert Einstein", "Einstein", 1),
+            ("Who?", "Albert Einstein", "Newton", 1),
+        ])
+        assert [r.is_correct for r in results] == [True, True, False, True, True]
+        assert results[0] is not results[1]
+        stats = hybrid.stats()
+        assert (stats["llm_candidates"], stats["llm_unique"], stats["dedup_ratio"]) == (4, 2, 0.5)
+
+    def test_tentative_match_goes_to_llm_for_partial_credit(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        partial = EvalResult(is_correct=False, confidence=0.9, explanation="LLM: one of two", points_awarded=1, max_points=2)
+        mock_llm._evaluate_single.return_value = partial
+        mock_llm.evaluate_batch.return_value = [partial]
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        assert hybrid.evaluate("Who wrote it?", "Lennon / McCartney", "Lennon", 2).points_awarded == 1
+        results = hybrid.evaluate_batch([("Who wrote it?", "Lennon / McCartney", "Lennon", 2)])
+        assert results[0].points_awarded == 1
+        mock_llm.evaluate_batch.assert_called_once_with([("Who wrote it?", "Lennon / McCartney", "Lennon", 2)])
+
+    def test_phonetic_match_is_confirmed_by_llm(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        mock_llm._evaluate_single.return_value = EvalResult(is_correct=False, confidence=0.95, explanation="LLM: different country")
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        result = hybrid.evaluate("Country?", "Nigeria", "Niger", 1, "en")
+
+        assert result.is_correct is False
+        mock_llm._evaluate_single.assert_called_once()
+
+    def test_batch_dedup_keeps_numbers_apart(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        mock_llm.evaluate_batch.side_effect = lambda items: [EvalResult(is_correct=False, confidence=0.9) for _ in items]
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        hybrid.evaluate_batch([("Q", "pi", "3.14", 1), ("Q", "pi", "314", 1), ("Q", "pi", "3.14!", 1)])
+
+        assert [item[2] for item in mock_llm.evaluate_batch.call_args.args[0]] == ["3.14", "314"]
+
+    def test_batch_dedup_keeps_points_apart(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        mock_llm.evaluate_batch.side_effect = lambda items: [
+            EvalResult(is_correct=False, confidence=0.95, max_points=mp) for *_, mp in items
+        ]
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        results = hybrid.evaluate_batch([("Q", "A", "x", 1), ("Q", "A", "x", 2)])
+
+        assert len(mock_llm.evaluate_batch.call_args.args[0]) == 2
+        assert [r.max_points for r in results] == [1, 2]
+
+    def test_decisive_numeric_answers_skip_llm(self):
+        hybrid = HybridEvaluator()
+        mock_llm = MagicMock()
+        hybrid._llm = mock_llm
+        hybrid._llm_init_attempted = True
+
+        assert hybrid.evaluate("Year?", "1969", "1968").is_correct is False
+        results = hybrid.evaluate_batch([("Year?", "1969", "1968", 1), ("Year?", "1969", "apollo year", 1)])
+
+        mock_llm._evaluate_single.assert_not_called()
+        mock_llm.evaluate_batch.assert_called_once_with([("Year?", "1969", "apollo year", 1)])
+        assert results[0].explanation == "Year mismatch"
+
     def test_lazy_init_disabled(self):
         """When settings say disabled, _get_llm returns None."""
         hybrid = HybridEvaluator()
@@ -203,3 +774,133 @@ class TestHybridEvaluator:
 
         assert llm is None
         assert hybrid._llm_init_attempted is True
+
+
+# ---------------------------------------------------------------------------
+# CachingEvaluator
+# ---------------------------------------------------------------------------
+
+def _counting_inner():
+    inner = MagicMock()
+    inner.evaluate_batch.side_effect = lambda items: [
+        EvalResult(is_correct=ua.lower() == ca.lower(), confidence=1.0, explanation="inner",
+                   points_awarded=mp if ua.lower() == ca.lower() else 0, max_points=mp)
+        for _, ca, ua, mp, *_language in items
+    ]
+    return inner
+
+
+class TestCachingEvaluator:
+    def test_normalized_answer_hits_cache(self):
+        inner = _counting_inner()
+        cache = CachingEvaluator(inner, max_entries=10)
+        cache._store_init_attempted = True
+
+        first = cache.evaluate("Capital?", "Paris", "Paris")
+        second = cache.evaluate("Capital?", "Paris", "  paris!")
+
+        assert first.is_correct and second.is_correct
+        assert inner.evaluate_batch.call_count == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.parametrize("reference,cached,answer", [
+        ("3.14", "3.14", "314"),
+        ("-40", "-40", "40"),
+        ("1.5 million", "1.5 million", "15 million"),
+    ])
+    def test_numeric_punctuation_is_part_of_the_key(self, reference, cached, answer):
+        cache = CachingEvaluator(HybridEvaluator(llm=MagicMock()), max_entries=10)
+        cache._store_init_attempted = True
+
+        assert cache.evaluate("Value?", reference, cached).is_correct is True
+        assert cache.evaluate("Value?", reference, answer).is_correct is False
+        assert answer_key(cached) != answer_key(answer)
+
+    def test_points_and_answer_changes_miss(self):
+        inner = _counting_inner()
+        cache = CachingEvaluator(inner, max_entries=10)
+        cache._store_init_attempted = True
+
+        cache.evaluate("Capital?", "Paris", "Paris", 1)
+        cache.evaluate("Capital?", "Paris", "Paris", 2)
+        cache.evaluate("Capital?", "Paris, France", "Paris", 1)
+
+        assert inner.evaluate_batch.call_count == 3
+
+    def test_lru_evicts_oldest(self):
+        inner = _counting_inner()
+        cache = CachingEvaluator(inner, max_entries=2)
+        cache._store_init_attempted = True
+
+        cache.evaluate_batch([("Q", "A", "a", 1), ("Q", "A", "b", 1), ("Q", "A", "c", 1)])
+        assert cache.stats()["entries"] == 2
+        cache.evaluate("Q", "A", "a")
+        assert inner.evaluate_batch.call_count == 2
+
+    def test_failed_llm_fallback_not_cached(self):
+        inner = MagicMock()
+        inner.evaluate_batch.return_value = [
+            EvalResult(is_correct=False, confidence=0.5, explanation="No match (LLM fallback: call failed)")
+        ]
+        cache = CachingEvaluator(inner, max_entries=10)
+        cache._store_init_attempted = True
+
+        cache.evaluate("Q", "Einstein", "Albert")
+        cache.evaluate("Q", "Einstein", "Albert")
+        assert inner.evaluate_batch.call_count == 2
+
+    def test_persistent_tier_read_and_write(self):
+        inner = _counting_inner()
+        store = MagicMock()
+        qhash = question_hash("Capital?", "Paris")
+        stored = {"is_correct": True, "confidence": 0.95, "explanation": "LLM: ok",
+                  "points_awarded": 1, "max_points": 1}
+        store.get_many.return_value = {(qhash, "paree", 1): stored}
+        cache = CachingEvaluator(inner, max_entries=10, store=store)
+
+        results = cache.evaluate_batch([("Capital?", "Paris", "Paree", 1), ("Capital?", "Paris", "Lyon", 1)])
+
+        assert results[0] == EvalResult(**stored)
+        assert results[1].is_correct is False
+        inner.evaluate_batch.assert_called_once_with([("Capital?", "Paris", "Lyon", 1)])
+        store.put_many.assert_called_once()
+        assert list(store.put_many.call_args.args[0]) == [(qhash, "lyon", 1)]
+        assert cache.stats()["persistent_hits"] == 1
+
+    def test_invalidate_drops_question_entries(self):
+        inner = _counting_inner()
+        store = MagicMock()
+        store.get_many.return_value = {}
+        store.delete_question.return_value = 3
+        cache = CachingEvaluator(inner, max_entries=10, store=store)
+
+        cache.evaluate("Capital?", "Paris", "Paris")
+        cache.evaluate("Other?", "Rome", "Rome")
+
+        assert cache.invalidate("Capital?", "Paris") == 4
+        store.delete_question.assert_called_once_with(question_hash("Capital?", "Paris"))
+        assert cache.stats()["entries"] == 1
+
+    def test_language_is_part_of_the_key(self):
+        inner = _counting_inner()
+        cache = CachingEvaluator(inner, max_entries=10)
+        cache._store_init_attempted = True
+
+        cache.evaluate("Name?", "Meyer", "Maier")
+        cache.evaluate("Name?", "Meyer", "Maier", language="de")
+        cache.evaluate("Name?", "Meyer", "Maier", language="de")
+
+        assert inner.evaluate_batch.call_count == 2
+        assert inner.evaluate_batch.call_args.args[0] == [("Name?", "Meyer", "Maier", 1, "de")]
+        assert question_hash("Name?", "Meyer") != question_hash("Name?", "Meyer", "de")
+        assert cache.invalidate("Name?", "Meyer", "de") == 1
+
+    def test_store_errors_fall_through_to_inner(self):
+        inner = _counting_inner()
+        store = MagicMock()
+        store.get_many.side_effect = RuntimeError("db down")
+        store.put_many.side_effect = RuntimeError("db down")
+        cache = CachingEvaluator(inner, max_entries=10, store=store)
+
+        assert cache.evaluate("Capital?", "Paris", "Paris").is_correct is True
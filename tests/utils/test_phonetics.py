@@ -0,0 +1,53 @@
+import pytest
+
+from backend.utils.phonetics import cologne_phonetics, fold, folded_forms, language_code, metaphone, phonetic_key
+
+
+@pytest.mark.parametrize("language, code", [
+    ("German", "de"),
+    ("de-AT", "de"),
+    ("english", "en"),
+    ("en_GB", "en"),
+    ("spanish", None),
+    (None, None),
+])
+def test_language_code(language, code):
+    assert language_code(language) == code
+
+
+def test_fold_strips_accents_and_expands_ligatures():
+    assert fold("Müller") == "muller"
+    assert fold("Straße") == "strasse"
+    assert fold("Ærø") == "aero"
+    assert fold("Crème brûlée") == "creme brulee"
+
+
+def test_german_forms_include_transliteration():
+    assert folded_forms("Müller", "de") == {"muller", "mueller"}
+    assert folded_forms("Müller", "english") == {"muller"}
+
+
+@pytest.mark.parametrize("word, code", [
+    ("wikipedia", "3412"),
+    ("mueller", "657"),
+    ("muellerludenscheidt", "65752682"),
+    ("meyer", "67"),
+    ("maier", "67"),
+])
+def test_cologne_phonetics(word, code):
+    assert cologne_phonetics(word) == code
+
+
+@pytest.mark.parametrize("first, second", [
+    ("catherine", "kathryn"),
+    ("smith", "smyth"),
+    ("knight", "night"),
+])
+def test_metaphone_equivalents(first, second):
+    assert metaphone(first) == metaphone(second)
+
+
+def test_phonetic_key_depends_on_language():
+    assert phonetic_key("Schmidt", "de") == phonetic_key("Schmitt", "de")
+    assert phonetic_key("Schmidt", None) is None
+    assert phonetic_key("1969", "en") is None
@@ -0,0 +1,78 @@
+import pytest
+
+from backend.utils.quantities import parse_quantity, parse_tolerance, partial_date_match, quantities_match
+
+
+def _matches(reference: str, answer: str) -> bool:
+    reference_text, tolerance = parse_tolerance(reference)
+    return quantities_match(parse_quantity(reference_text), parse_quantity(answer), tolerance)
+
+
+@pytest.mark.parametrize("text, kind, value, unit", [
+    ("1969", "year", 1969, None),
+    ("44 BC", "year", -44, None),
+    ("3.14", "number", 3.14, None),
+    ("1,969", "number", 1969, None),
+    ("12 million", "number", 12_000_000, None),
+    ("twenty-one", "number", 21, None),
+    ("a hundred and five", "number", 105, None),
+    ("one hundred twenty three", "number", 123, None),
+    ("Nineteen Eighty-Four", "year", 1984, None),
+    ("nineteen sixty-nine", "year", 1969, None),
+    ("twenty twenty", "year", 2020, None),
+    ("300k", "number", 300_000, None),
+    ("12.5km", "number", 12.5, "km"),
+    ("$12 million", "number", 12_000_000, "usd"),
+    ("45%", "number", 45, "%"),
+    ("-3 °C", "number", -3, "c"),
+    ("about 384,400 km (average)", "number", 384_400, "km"),
+])
+def test_parse_quantity(text, kind, value, unit):
+    quantity = parse_quantity(text)
+    assert (quantity.kind, quantity.value, quantity.unit) == (kind, pytest.approx(value), unit)
+
+
+@pytest.mark.parametrize("text", ["Paris", "Apollo 11", "1960s", "3,14", "1939-1945", "", "one two", "seven eighty"])
+def test_non_quantities(text):
+    assert parse_quantity(text) is None
+
+
+@pytest.mark.parametrize("text", ["20 July 1969", "July 20, 1969", "July 20th 1969", "1969-07-20"])
+def test_parse_dates(text):
+    assert parse_quantity(text).date == (1969, 7, 20)
+
+
+@pytest.mark.parametrize("reference, answer, expected", [
+    ("1969", "1969", True),
+    ("1969", "1968", False),
+    ("1969", "July 1969", True),
+    ("3.14", "3.14159", True),
+    ("3.14", "3.15", False),
+    ("12 million", "12,000,000", True),
+    ("12 million", "twelve million", True),
+    ("12", "twelve", True),
+    ("384,400 km (±1%)", "385000", True),
+    ("384,400 km (±1%)", "390000 km", False),
+    ("100 +/- 5", "104", True),
+    ("100 +/- 5", "106", False),
+    ("100 km", "62.14 miles", True),
+    ("100 km", "100 kg", False),
+    ("100 °C", "212 °F", True),
+    ("20 July 1969", "july 20 1969", True),
+    ("20 July 1969", "21 July 1969", False),
+    ("20 July 1969", "1969", False),
+])
+def test_quantities_match(reference, answer, expected):
+    assert _matches(reference, answer) is expected
+
+
+@pytest.mark.parametrize("reference, answer, expected", [
+    ("20 July 1969", "1969", True),
+    ("20 July 1969", "July 1969", True),
+    ("20 July 1969", "1968", False),
+    ("20 July 1969", "June 1969", False),
+    ("20 July 1969", "20 July 1969", False),
+    ("1969", "1969", False),
+])
+def test_partial_date_match(reference, answer, expected):
+    assert partial_date_match(parse_quantity(reference), parse_quantity(answer)) is expected
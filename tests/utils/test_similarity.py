@@ -0,0 +1,63 @@
+from difflib import SequenceMatcher
+
+import pytest
+
+from backend.utils.similarity import _distance, ratio, ratio_bound, sort_tokens
+
+
+def _reference_distance(a: str, b: str) -> int:
+    """Unbanded weighted OSA distance (indel 1, substitution 2, transposition 1)."""
+    rows = [[i + j if i == 0 or j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = rows[i - 1][j - 1] + (0 if a[i - 1] == b[j - 1] else 2)
+            cost = min(cost, rows[i - 1][j] + 1, rows[i][j - 1] + 1)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1] and a[i - 1] != b[j - 1]:
+                cost = min(cost, rows[i - 2][j - 2] + 1)
+            rows[i][j] = cost
+    return rows[-1][-1]
+
+
+@pytest.mark.parametrize("a, b", [
+    ("beethoven", "bethoveen"),
+    ("thompson", "tomson"),
+    ("schmidt", "schmitt"),
+    ("photosynthesis", "42"),
+    ("kilimanjaro", "kilimanjaro"),
+])
+def test_ratio_matches_sequence_matcher_without_transpositions(a, b):
+    assert ratio(a, b) == pytest.approx(SequenceMatcher(None, a, b).ratio())
+
+
+def test_adjacent_swap_costs_one_edit():
+    assert ratio("the", "teh") == pytest.approx(1 - 1 / 6)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("abcabc", "acbbca"),
+    ("mississippi", "oisssisippi"),
+    ("albert einstein", "able teinstein"),
+    ("", "abc"),
+    ("ab", "ba"),
+])
+def test_banded_distance_agrees_with_full_table(a, b):
+    expected = _reference_distance(a, b)
+    for max_distance in range(len(a) + len(b) + 1):
+        assert _distance(a, b, max_distance) == min(expected, max_distance + 1)
+
+
+def test_cutoff_returns_zero_below_threshold():
+    assert ratio("paris", "lyon", 0.85) == 0.0
+    assert ratio("beethoven", "bethoveen", 0.85) == pytest.approx(0.889, abs=1e-3)
+    assert ratio("", "") == 1.0
+
+
+def test_sorted_tokens_ignore_word_order():
+    assert sort_tokens("mccartney paul") == "mccartney paul"
+    assert ratio(sort_tokens("paul mccartny"), sort_tokens("mccartney paul")) > 0.9
+    assert ratio("paul mccartny", "mccartney paul") < 0.85
+
+
+def test_ratio_bound_is_an_upper_bound():
+    assert ratio_bound("photosynthesis", "42") == pytest.approx(0.25)
+    assert ratio("photosynthesis", "42") <= ratio_bound("photosynthesis", "42")